@@ -0,0 +1,31 @@
+from typing import Protocol
+
+from src.application.ports.presenter_output import IPresenterOutput
+from src.domain.enums_.move_direction import MoveDirection
+
+
+class IAsyncView(Protocol):
+    """
+    Asynchronous counterpart of IView for views that talk to a remote client
+    (socket, WebSocket, ...). Awaiting instead of blocking lets one process
+    serve many sessions concurrently.
+    """
+
+    async def display(self, data: IPresenterOutput) -> None:
+        """
+        Sends the current game state to the user. Should only return once
+        the client can accept more data, so a slow client slows its own game
+        down instead of buffering frames without limit.
+
+        :param data: Structured game data ready for display, containing tiles, score, and message.
+        :return: None
+        """
+
+    async def get_next_move(self) -> MoveDirection:
+        """
+        Waits for the player's next move direction.
+        Should handle input validation internally (retry on invalid input).
+
+        :return: Valid move direction chosen by the player.
+        :raises EOFError: If the client is gone
+        """
@@ -0,0 +1,19 @@
+from typing import Protocol
+
+from src.domain.dataclasses_.game_result import GameState
+from src.domain.enums_.move_direction import MoveDirection
+
+
+class IMovePolicy(Protocol):
+    """
+    Interface for non-interactive players (bots, AI) of the 2048 game.
+    Plays the role of IView.get_next_move when no human is involved.
+    """
+
+    def choose_move(self, game_state: GameState) -> MoveDirection:
+        """
+        Chooses the next move for the given game state.
+
+        :param game_state: Current state of the game (never a completed one).
+        :return: Move direction to play next.
+        """
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import Protocol
 
 
@@ -5,11 +6,13 @@ class IPresenterOutput(Protocol):
     """
     Defines a standardized output format for presenting 2048 game data.
     This protocol ensures consistency in how game state is structured for different output methods
-    (e.g., CLI, GUI, or API responses). All properties return strings for easy rendering.
+    (e.g., CLI, GUI, or API responses). Tiles are numeric values (0 for an empty tile),
+    so views can look up prebuilt glyphs without parsing; the other properties are
+    ready-to-print strings.
     """
 
     @property
-    def tiles(self) -> list[list[str]]: ...
+    def tiles(self) -> Sequence[Sequence[int]]: ...
 
     @property
     def score(self) -> str: ...
@@ -1,6 +1,7 @@
 from typing import Protocol
 
 from src.application.ports.presenter_output import IPresenterOutput
+from src.domain.enums_.game_command import GameCommand
 from src.domain.enums_.move_direction import MoveDirection
 
 
@@ -19,10 +20,11 @@ class IView(Protocol):
         :return: None
         """
 
-    def get_next_move(self) -> MoveDirection:
+    def get_next_move(self) -> MoveDirection | GameCommand:
         """
-        Captures and returns the player's next move direction.
+        Captures and returns the player's next move direction, or a command
+        such as undo for views offering one.
         Should handle input validation internally (retry on invalid input).
 
-        :return: Valid move direction chosen by the player.
+        :return: Valid move direction (or command) chosen by the player.
         """
@@ -0,0 +1,108 @@
+import asyncio
+
+from src.application.ports.async_view import IAsyncView
+from src.application.ports.presenter import IPresenter
+from src.application.ports.presenter_output import IPresenterOutput
+from src.domain.enums_.game_status import GameStatus
+from src.domain.enums_.move_direction import MoveDirection
+from src.domain.interfaces.domain.game import IGame
+
+
+class AsyncGameLoopUseCase:
+    """
+    Asynchronous variant of GameLoopUseCase for hosting many game sessions
+    in one process.
+
+    Input, game stepping and rendering run as separate tasks connected by
+    bounded queues:
+    - the input task reads moves from the view into the moves queue,
+    - the game task applies queued moves and queues the presented frames,
+    - the render task sends the frames to the view.
+
+    When a client consumes frames slowly, the frames queue fills up and the
+    game task waits; then the moves queue fills up and the input task stops
+    reading. The backpressure reaches the client instead of growing buffers.
+    The presenter is only CPU work, so it stays synchronous.
+    """
+
+    def __init__(
+        self,
+        game: IGame,
+        presenter: IPresenter,
+        view: IAsyncView,
+        max_pending_moves: int = 8,
+        max_pending_frames: int = 1,
+    ):
+        """
+        :param game: Game logic
+        :param presenter: Formats game states for the view
+        :param view: Asynchronous view of the session
+        :param max_pending_moves: Moves read ahead before input is paused
+        :param max_pending_frames: Frames queued before the game is paused
+        :raises ValueError: If a queue size is not positive
+        """
+        if max_pending_moves < 1 or max_pending_frames < 1:
+            raise ValueError("Queue sizes must be positive")
+
+        self._game = game
+        self._presenter = presenter
+        self._view = view
+        self._max_pending_moves = max_pending_moves
+        self._max_pending_frames = max_pending_frames
+
+    async def execute(self) -> None:
+        """
+        Plays a game until it is completed and its last frame is displayed.
+
+        :raises ExceptionGroup: With the errors of the failed tasks, e.g.
+                EOFError when the client disconnects; the other tasks are
+                cancelled then.
+        """
+        moves: asyncio.Queue[MoveDirection] = asyncio.Queue(self._max_pending_moves)
+        frames: asyncio.Queue[IPresenterOutput | None] = asyncio.Queue(
+            self._max_pending_frames
+        )
+
+        async with asyncio.TaskGroup() as group:
+            reader = group.create_task(self._read_moves(moves))
+            group.create_task(self._render(frames))
+            await self._step(moves, frames)
+            reader.cancel()
+
+    async def _read_moves(self, moves: asyncio.Queue[MoveDirection]) -> None:
+        """
+        Forwards moves from the view until cancelled.
+
+        :param moves: Queue of moves waiting to be applied
+        """
+        while True:
+            await moves.put(await self._view.get_next_move())
+
+    async def _step(
+        self,
+        moves: asyncio.Queue[MoveDirection],
+        frames: asyncio.Queue[IPresenterOutput | None],
+    ) -> None:
+        """
+        Starts the game and applies moves until it is completed, then closes
+        the frame stream with None.
+
+        :param moves: Queue of moves waiting to be applied
+        :param frames: Queue of frames waiting to be displayed
+        """
+        await frames.put(self._presenter.present(self._game.start()))
+        while True:
+            state = self._game.make_move(await moves.get())
+            await frames.put(self._presenter.present(state))
+            if state.status is GameStatus.COMPLETED:
+                break
+        await frames.put(None)
+
+    async def _render(self, frames: asyncio.Queue[IPresenterOutput | None]) -> None:
+        """
+        Displays frames until the stream is closed.
+
+        :param frames: Queue of frames waiting to be displayed
+        """
+        while (frame := await frames.get()) is not None:
+            await self._view.display(frame)
@@ -0,0 +1,151 @@
+import secrets
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from src.domain.dataclasses_.game_session import GameSession
+from src.domain.entities.bit_board_game import BitBoardGame
+from src.domain.enums_.move_direction import MoveDirection
+from src.domain.interfaces.domain.random_generator import IRandomGenerator
+
+
+class GameSessionsUseCase:
+    """
+    Hosts many concurrent games on one packed game engine.
+
+    Every game is stored as a compact GameSession. A move loads the session
+    into the shared engine (board, score and generator state), applies the
+    move and saves the session back, so no per-game objects are kept alive.
+
+    Sessions live in an LRU table: a session not used for ``idle_ttl``
+    seconds is evicted, and so is the least recently used one when the
+    table exceeds ``max_sessions``. Eviction is checked on every call and
+    only looks at the oldest sessions, so it costs O(1) amortized.
+    """
+
+    def __init__(
+        self,
+        game: BitBoardGame,
+        rng: IRandomGenerator,
+        max_sessions: int = 100_000,
+        idle_ttl: float | None = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param game: Shared engine; its tile spawner must draw from ``rng``
+        :param rng: Generator of the engine, reseeded for every new session
+        :param max_sessions: Largest number of sessions kept
+        :param idle_ttl: Seconds after which an unused session is evicted,
+               None to keep sessions until the table is full
+        :param clock: Monotonic time source in seconds
+        :raises ValueError: If max_sessions is not positive
+        """
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be positive")
+
+        self._game = game
+        self._rng = rng
+        self._max_sessions = max_sessions
+        self._idle_ttl = idle_ttl
+        self._clock = clock
+        self._sessions: OrderedDict[str, GameSession] = OrderedDict()
+
+    def create(self, seed: int | None = None) -> GameSession:
+        """
+        Starts a new game.
+
+        :param seed: Seed of the game's tile spawns, random if None
+        :return: The new session with its starting tiles
+        """
+        now = self._clock()
+        self._evict(now)
+
+        self._rng.seed(seed if seed is not None else secrets.randbits(64))
+        self._game.restore(cells=0, score=0)
+        self._game.start()
+
+        session = GameSession(
+            session_id=secrets.token_urlsafe(12),
+            cells=self._game.get_cells(),
+            score=0,
+            rng_state=self._rng.getstate(),
+            last_used=now,
+        )
+        self._sessions[session.session_id] = session
+        if len(self._sessions) > self._max_sessions:
+            self._sessions.popitem(last=False)
+        return session
+
+    def move(self, session_id: str, direction: MoveDirection) -> GameSession:
+        """
+        Applies a move to a session. Moves of a completed game are ignored.
+
+        :param session_id: Identifier returned by create
+        :param direction: Direction to move tiles
+        :return: The updated session
+        :raises KeyError: If the session does not exist or was evicted
+        """
+        now = self._clock()
+        self._evict(now)
+        session = self._sessions[session_id]
+        self._sessions.move_to_end(session_id)
+        session.last_used = now
+        if session.result is not None:
+            return session
+
+        self._game.restore(cells=session.cells, score=session.score)
+        self._rng.setstate(session.rng_state)
+        result = self._game.step(direction)
+
+        session.cells = self._game.get_cells()
+        session.score = self._game.get_score()
+        session.rng_state = self._rng.getstate()
+        session.moves += 1
+        session.result = result
+        return session
+
+    def get(self, session_id: str) -> GameSession:
+        """
+        Returns a session and marks it as recently used.
+
+        :param session_id: Identifier returned by create
+        :return: The session
+        :raises KeyError: If the session does not exist or was evicted
+        """
+        session = self._sessions[session_id]
+        self._sessions.move_to_end(session_id)
+        session.last_used = self._clock()
+        return session
+
+    def close(self, session_id: str) -> None:
+        """
+        Removes a session.
+
+        :param session_id: Identifier returned by create
+        :raises KeyError: If the session does not exist or was evicted
+        """
+        del self._sessions[session_id]
+
+    def get_sessions_count(self) -> int:
+        """
+        Returns the number of live sessions.
+
+        :return: Sessions in the table
+        """
+        return len(self._sessions)
+
+    def _evict(self, now: float) -> None:
+        """
+        Drops the least recently used sessions that have been idle too long.
+
+        :param now: Current time of the clock
+        """
+        if self._idle_ttl is None:
+            return
+        deadline = now - self._idle_ttl
+        sessions = self._sessions
+        while sessions:
+            oldest = next(iter(sessions.values()))
+            if oldest.last_used > deadline:
+                break
+            sessions.popitem(last=False)
@@ -2,6 +2,9 @@ from src.application.ports.presenter import IPresenter
 from src.application.ports.presenter_output import IPresenterOutput
 from src.application.ports.view import IView
 from src.domain.dataclasses_.game_result import GameState
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.game_history import GameHistory
+from src.domain.enums_.game_command import GameCommand
 from src.domain.enums_.game_status import GameStatus
 from src.domain.enums_.move_direction import MoveDirection
 from src.domain.interfaces.domain.game import IGame
@@ -15,6 +18,11 @@ class GameLoopUseCase:
     - User interface (IView)
 
     The loop continues until the game reaches a completed state (win/lose).
+
+    With a GameHistory, every move that changes the board is recorded as a
+    snapshot of the game before it, and the UNDO and REDO commands of the
+    view restore them (board, score and generator state). Without one the
+    commands are ignored.
     """
 
     def __init__(
@@ -22,34 +30,41 @@ class GameLoopUseCase:
         game: IGame,
         presenter: IPresenter,
         view: IView,
+        history: GameHistory | None = None,
     ):
         self._game = game
         self._presenter = presenter
         self._view = view
+        self._history = history
 
     def execute(self) -> None:
         """
         Runs the main game loop sequence:
         1. Initializes the game
         2. Displays initial state
-        3. Processes player moves until game completion
+        3. Processes player moves (and undo/redo commands) until game completion
         4. Updates and displays game state after each move
 
         The loop breaks when the game status becomes COMPLETED.
         """
         # Initialize game
-        init_state = self._game.start()
+        state: GameState = self._game.start()
+        if self._history is not None:
+            self._history.clear()
 
-        init_view_data: IPresenterOutput = self._presenter.present(init_state)
+        init_view_data: IPresenterOutput = self._presenter.present(state)
         self._view.display(init_view_data)
 
         # Main game loop
         while True:
             # Get player input
-            move_direction: MoveDirection = self._view.get_next_move()
+            action: MoveDirection | GameCommand = self._view.get_next_move()
 
-            # Process move and get new state
-            state: GameState = self._game.make_move(move_direction)
+            # Process move (or command) and get new state
+            if isinstance(action, GameCommand):
+                state = self._apply_command(action, state)
+            else:
+                state = self._make_move(action)
 
             # Update display
             view_data: IPresenterOutput = self._presenter.present(state)
@@ -58,3 +73,41 @@ class GameLoopUseCase:
             # Check completion condition
             if state.status is GameStatus.COMPLETED:
                 break
+
+    def _make_move(self, move_direction: MoveDirection) -> GameState:
+        """
+        Processes a move, recording the game before it if the board changes.
+
+        :param move_direction: Direction to move tiles
+        :return: Game state after the move
+        """
+        if self._history is None:
+            return self._game.make_move(move_direction)
+
+        before = self._game.get_snapshot()
+        state = self._game.make_move(move_direction)
+        if state.changed_cells:
+            self._history.record(before)
+        return state
+
+    def _apply_command(self, command: GameCommand, state: GameState) -> GameState:
+        """
+        Undoes or redoes a move.
+
+        :param command: Command of the player
+        :param state: Current game state, kept if there is nothing to do
+        :return: Game state after the command
+        """
+        if self._history is None:
+            return state
+
+        current = self._game.get_snapshot()
+        if command is GameCommand.UNDO:
+            snapshot = self._history.undo(current)
+        else:
+            snapshot = self._history.redo(current)
+        if snapshot is None:
+            return state
+
+        self._game.restore_snapshot(snapshot)
+        return BitBoard.to_game_state(snapshot, previous=current)
@@ -0,0 +1,52 @@
+from src.application.ports.move_policy import IMovePolicy
+from src.domain.dataclasses_.game_result import GameState
+from src.domain.dataclasses_.game_summary import GameSummary
+from src.domain.enums_.game_status import GameStatus
+from src.domain.interfaces.domain.game import IGame
+
+
+class SelfPlayUseCase:
+    """
+    Plays a complete game without any user interface:
+    moves come from an IMovePolicy instead of an IView.
+
+    The game ends when it reaches a completed state (win/lose) or when the
+    optional move limit is exhausted.
+    """
+
+    def __init__(
+        self,
+        game: IGame,
+        policy: IMovePolicy,
+        max_moves: int | None = None,
+    ):
+        """
+        :param game: Fresh (not started) game to play
+        :param policy: Source of moves
+        :param max_moves: Stop after this many moves, None for no limit
+        """
+        self._game = game
+        self._policy = policy
+        self._max_moves = max_moves
+
+    def execute(self) -> GameSummary:
+        """
+        Starts the game and lets the policy play it to the end.
+
+        :return: Summary of the finished game
+        """
+        state: GameState = self._game.start()
+        moves = 0
+
+        while state.status is not GameStatus.COMPLETED:
+            if self._max_moves is not None and moves >= self._max_moves:
+                break
+            state = self._game.make_move(self._policy.choose_move(state))
+            moves += 1
+
+        return GameSummary(
+            score=state.score,
+            max_tile=max(tile.value for row in state.tiles for tile in row),
+            moves=moves,
+            result=state.result,
+        )
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
+
+@dataclass
+class BatchGameState:
+    """
+    Snapshot of N games advanced in lockstep, one entry per board.
+
+    Array counterpart of GameState: ``exponents[i]`` holds board ``i`` as
+    tile exponents (0 for an empty cell, ``n`` for 2ⁿ), ``statuses`` and
+    ``results`` hold GameStatus / GameResult values (``NO_RESULT`` while
+    the game is in progress).
+    """
+
+    NO_RESULT = -1
+
+    exponents: npt.NDArray[np.uint8]
+    scores: npt.NDArray[np.int64]
+    statuses: npt.NDArray[np.int8]
+    results: npt.NDArray[np.int8]
+    changed: npt.NDArray[np.bool_]
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+from src.domain.enums_.move_direction import MoveDirection
+from src.domain.enums_.random_generator_kind import RandomGeneratorKind
+
+
+@dataclass(frozen=True)
+class GameReplay:
+    """
+    Everything needed to re-simulate a game exactly.
+
+    Tile spawns are fully determined by the spawner's generator and seed, so
+    a game is reproduced by replaying its moves on a fresh board. The final
+    score and largest tile are kept to detect replays that diverge.
+    """
+
+    seed: int
+    rng_kind: RandomGeneratorKind
+    dimension: int
+    moves: tuple[MoveDirection, ...]
+    score: int
+    max_tile: int
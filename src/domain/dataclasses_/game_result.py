@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from src.domain.dataclasses_.tile import Tile
+from src.domain.dataclasses_.tile_position import TilePosition
 from src.domain.enums_.game_result import GameResult
 from src.domain.enums_.game_status import GameStatus
 
@@ -12,9 +13,12 @@ class GameState:
 
     Contains all necessary information to represent the current game status,
     including board configuration, player score, and game progress status.
+    ``changed_cells`` lists the positions whose tile differs from the previous
+    state (moved, merged or spawned tiles), so presenters can redraw only them.
     """
 
     tiles: list[list[Tile]]
     score: int
     status: GameStatus = GameStatus.IN_PROGRESS
     result: GameResult | None = None
+    changed_cells: frozenset[TilePosition] = frozenset()
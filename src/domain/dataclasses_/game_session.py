@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import Any
+
+from src.domain.enums_.game_result import GameResult
+
+
+@dataclass(slots=True)
+class GameSession:
+    """
+    Compact state of a hosted game between two moves.
+
+    A session holds no Game, Board or Tile objects: the board is a packed
+    integer and the spawner's generator is kept as its saved state, so one
+    shared engine can play any number of sessions. With a counter-based
+    generator the whole session is a handful of integers.
+    """
+
+    session_id: str
+    cells: int
+    score: int
+    rng_state: Any
+    moves: int = 0
+    result: GameResult | None = None
+    last_used: float = 0.0
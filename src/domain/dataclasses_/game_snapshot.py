@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from typing import Any
+
+from src.domain.enums_.game_result import GameResult
+from src.domain.enums_.game_status import GameStatus
+
+
+@dataclass(frozen=True, slots=True)
+class GameSnapshot:
+    """
+    Everything needed to suspend a game and resume it later.
+
+    The board is packed like a BitBoard (one 4-bit exponent per cell, cell
+    ``(row, col)`` at nibble ``row * dimension + col``). ``rng_state`` is the
+    state of the spawner's generator, None for a bare position (e.g. in a
+    training corpus), which can be looked at but not continued identically.
+    BitBoard converts snapshots to and from game states.
+    """
+
+    dimension: int
+    cells: int
+    score: int
+    result: GameResult | None = None
+    rng_state: Any = None
+
+    @property
+    def status(self) -> GameStatus:
+        return GameStatus.IN_PROGRESS if self.result is None else GameStatus.COMPLETED
+
+    def check_fits(self, dimension: int) -> None:
+        """
+        Checks that the snapshot can be restored on a board, as every engine
+        does before restoring it.
+
+        :param dimension: Number of rows (and columns) of the board
+        :raises ValueError: If the snapshot is of another dimension, or its
+                cells do not fit the board
+        """
+        if self.dimension != dimension:
+            raise ValueError(
+                f"Snapshot of a {self.dimension}x{self.dimension} board "
+                f"cannot be restored on a {dimension}x{dimension} board"
+            )
+        # one 4-bit exponent per cell
+        if not 0 <= self.cells < 1 << (4 * dimension * dimension):
+            raise ValueError("Snapshot cells do not fit the board")
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from src.domain.enums_.game_result import GameResult
+
+
+@dataclass
+class GameSummary:
+    """
+    Final outcome of a single played game, used for statistics.
+
+    ``moves`` counts every processed move, including the ones that did not
+    change the board.
+    """
+
+    score: int
+    max_tile: int
+    moves: int
+    result: GameResult | None
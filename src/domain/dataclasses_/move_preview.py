@@ -0,0 +1,21 @@
+from dataclasses import dataclass
+
+from src.domain.enums_.move_direction import MoveDirection
+
+
+@dataclass(frozen=True, slots=True)
+class MovePreview:
+    """
+    What a move would do to the board, before a tile is spawned.
+
+    The board is packed like a BitBoard (one 4-bit exponent per cell, cell
+    ``(row, col)`` at nibble ``row * dimension + col``). A move that does not
+    change the board is not legal: it keeps the board and gains nothing.
+    ``BitBoard(cells=preview.cells, dim=preview.dimension)`` unpacks it.
+    """
+
+    direction: MoveDirection
+    dimension: int
+    cells: int
+    score_delta: int
+    changed: bool
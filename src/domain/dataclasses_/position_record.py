@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+from src.domain.enums_.move_direction import MoveDirection
+
+
+@dataclass(frozen=True, slots=True)
+class PositionRecord:
+    """
+    One training sample taken from a played game: the position the move was
+    made from, the move, the score it earned and the score the game ended
+    with.
+
+    The board is packed like a BitBoard (one 4-bit exponent per cell).
+    """
+
+    cells: int
+    move: MoveDirection
+    score_delta: int
+    final_score: int
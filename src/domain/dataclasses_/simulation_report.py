@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+
+from src.domain.dataclasses_.game_replay import GameReplay
+from src.domain.dataclasses_.game_summary import GameSummary
+from src.domain.enums_.game_result import GameResult
+
+
+@dataclass
+class SimulationReport:
+    """
+    Aggregated statistics of many played games.
+
+    Reports built independently (e.g. in separate worker processes) can be
+    combined with merge. ``replays`` is only filled when games are recorded.
+    """
+
+    scores: list[int] = field(default_factory=list)
+    moves: list[int] = field(default_factory=list)
+    max_tiles: Counter[int] = field(default_factory=Counter)
+    wins: int = 0
+    replays: list[GameReplay] = field(default_factory=list)
+
+    @property
+    def games(self) -> int:
+        return len(self.scores)
+
+    def add(self, summary: GameSummary, replay: GameReplay | None = None) -> None:
+        """
+        Accounts a single finished game.
+
+        :param summary: Outcome of the game
+        :param replay: Recording of the game, if it was recorded
+        """
+        self.scores.append(summary.score)
+        self.moves.append(summary.moves)
+        self.max_tiles[summary.max_tile] += 1
+        if summary.result is GameResult.WIN:
+            self.wins += 1
+        if replay is not None:
+            self.replays.append(replay)
+
+    def merge(self, other: SimulationReport) -> None:
+        """
+        Adds all games of another report to this one.
+
+        :param other: Report to merge in
+        """
+        self.scores.extend(other.scores)
+        self.moves.extend(other.moves)
+        self.max_tiles.update(other.max_tiles)
+        self.wins += other.wins
+        self.replays.extend(other.replays)
+
+    @staticmethod
+    def percentile(values: list[int], percent: float) -> int:
+        """
+        Returns the nearest-rank percentile of the values.
+
+        :param values: Observed values
+        :param percent: Percentile in range 0-100
+        :return: Percentile value (0 for no values)
+        """
+        if not values:
+            return 0
+        ordered = sorted(values)
+        rank = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+        return ordered[rank]
@@ -1,18 +1,43 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
+from typing import Any, ClassVar
 
 from src.domain.enums_.tile_value import TileValue
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, init=False, eq=False)
 class Tile:
     """
     Represents a single tile on the 2048 game board.
 
     Each tile carries a value that determines its visual representation
     and merge behavior in the game. The value comes from TileValue enum.
+
+    Tiles are immutable flyweights: there is exactly one instance per value,
+    so creating a tile never allocates and equality is an identity check.
     """
 
     value: TileValue
 
+    _instances: ClassVar[dict[TileValue, Tile]] = {}
+
+    def __new__(cls, value: TileValue) -> Tile:
+        tile = cls._instances.get(value)
+        if tile is None:
+            tile = object.__new__(cls)
+            object.__setattr__(tile, "value", TileValue(value))
+            cls._instances[value] = tile
+        return tile
+
+    def __reduce__(self) -> tuple[type[Tile], tuple[TileValue]]:
+        return Tile, (self.value,)
+
+    def __copy__(self) -> Tile:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Tile:
+        return self
+
     def __str__(self) -> str:
         return str(self.value)
@@ -1,23 +1,50 @@
+from __future__ import annotations
+
 from dataclasses import dataclass
+from typing import Any, ClassVar
 
 
-@dataclass
+@dataclass(frozen=True, slots=True, init=False, eq=False)
 class TilePosition:
     """
     Represents a coordinate position of a tile on the game board.
 
     Stores row and column indices (0-based) and provides common position operations.
     This class is hashable and can be used as a dictionary key.
+
+    Positions are immutable flyweights: there is exactly one instance per
+    coordinate pair, so equality and hashing work on identity.
     """
 
     row_idx: int
     col_idx: int
 
+    # nested by row so that a lookup does not build a key tuple
+    _instances: ClassVar[dict[int, dict[int, TilePosition]]] = {}
+
+    def __new__(cls, row_idx: int, col_idx: int) -> TilePosition:
+        row = cls._instances.get(row_idx)
+        if row is None:
+            row = cls._instances[row_idx] = {}
+        position = row.get(col_idx)
+        if position is None:
+            position = object.__new__(cls)
+            object.__setattr__(position, "row_idx", row_idx)
+            object.__setattr__(position, "col_idx", col_idx)
+            row[col_idx] = position
+        return position
+
+    def __reduce__(self) -> tuple[type[TilePosition], tuple[int, int]]:
+        return TilePosition, (self.row_idx, self.col_idx)
+
+    def __copy__(self) -> TilePosition:
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> TilePosition:
+        return self
+
     def __str__(self) -> str:
         return f"({self.row_idx}, {self.col_idx})"
 
     def __repr__(self) -> str:
         return self.__str__()
-
-    def __hash__(self) -> int:
-        return hash((self.row_idx, self.col_idx))
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from array import array
+
+from src.domain.dataclasses_.dimension import Dimension
+from src.domain.dataclasses_.tile import Tile
+from src.domain.enums_.tile_value import TileValue
+
+
+class ArrayBoard:
+    """
+    Represents the game board in 2048 as a flat array of exponents.
+
+    Every cell is one byte: 0 for an empty cell, ``n`` for a tile with value
+    2ⁿ. Cell ``(row, col)`` lives at index ``row * dim + col``, so a row is a
+    contiguous slice and a column a slice with step ``dim``. Unlike BitBoard
+    the board is mutable and its size is not limited by integer arithmetic,
+    which makes it suitable for large boards.
+    """
+
+    def __init__(self, cells: array[int], dim: int) -> None:
+        """
+        :param cells: Exponents of all cells in row-major order (typecode "B")
+        :param dim: Number of rows (and columns) of the board
+        :raises ValueError: If the array does not hold dim × dim bytes
+        """
+        if cells.typecode != "B" or len(cells) != dim * dim:
+            raise ValueError(f"Expected {dim * dim} cells of typecode 'B'")
+        self._cells = cells
+        self._dim = dim
+
+    def get_cells(self) -> array[int]:
+        """
+        Returns the live array of the board; changes to it change the board.
+
+        :return: Array with one exponent per cell.
+        """
+        return self._cells
+
+    def get_dim(self) -> int:
+        """
+        Returns the number of rows (and columns) of the board.
+
+        :return: Board dimension.
+        """
+        return self._dim
+
+    def get_tiles(self) -> list[list[Tile]]:
+        """
+        Returns a snapshot of all tiles on the board at the current moment.
+
+        :return: Freshly built 2D list of tiles.
+        """
+        tiles = [
+            Tile(value=TileValue.from_exponent(exponent)) for exponent in range(16)
+        ]
+        dim = self._dim
+        return [
+            [tiles[exponent] for exponent in self._cells[row : row + dim]]
+            for row in range(0, dim * dim, dim)
+        ]
+
+    @classmethod
+    def from_tiles(cls, tiles: list[list[Tile]]) -> ArrayBoard:
+        """
+        Converts a 2D list of tiles into a new board.
+
+        :param tiles: Square 2D list of tiles
+        :return: A new ArrayBoard holding the same tiles.
+        """
+        cells = array("B", (tile.value.exponent for row in tiles for tile in row))
+        return cls(cells=cells, dim=len(tiles))
+
+    @classmethod
+    def create(cls, dimension: Dimension) -> ArrayBoard:
+        """
+        Creates a new empty board with the specified dimensions.
+
+        :param dimension: The size of the board (rows x cols).
+        :return: A new ArrayBoard instance with all cells empty.
+        """
+        return cls(cells=array("B", bytes(dimension.rows**2)), dim=dimension.rows)
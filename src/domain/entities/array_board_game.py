@@ -0,0 +1,279 @@
+from array import array
+from itertools import compress
+from operator import eq, not_
+
+from src.domain.dataclasses_.game_result import GameState
+from src.domain.dataclasses_.game_snapshot import GameSnapshot
+from src.domain.dataclasses_.tile import Tile
+from src.domain.dataclasses_.tile_position import TilePosition
+from src.domain.entities.array_board import ArrayBoard
+from src.domain.enums_.game_result import GameResult
+from src.domain.enums_.game_status import GameStatus
+from src.domain.enums_.move_direction import MoveDirection
+from src.domain.enums_.tile_value import TileValue
+from src.domain.interfaces.domain.tile_spawner import ITileSpawner
+
+
+class ArrayBoardGame:
+    """
+    Game logic for 2048 operating on an ArrayBoard, meant for large boards.
+
+    Behaves exactly like Game (same moves, scoring, spawning order and
+    win/lose rules), but its cost grows linearly with the number of cells:
+    every line (row or column, in move order) is read and written through a
+    strided memoryview of the flat exponent array, and slid and merged in a
+    single pass. Nothing is transposed or shifted cell by cell.
+
+    The tile grid returned in GameState is kept alive between moves and
+    only the changed cells are updated, like Game does.
+    """
+
+    _WIN_EXPONENT = TileValue.ELEVEN.exponent
+    # largest exponent a tile can have, such tiles never merge (as in Game)
+    _MAX_EXPONENT = TileValue.FIFTEEN.exponent
+    # translation giving the largest tiles an exponent no cell can hold
+    _MERGING_EXPONENTS = bytes(range(256)).replace(
+        bytes((_MAX_EXPONENT,)), bytes((_MAX_EXPONENT + 1,))
+    )
+    _TILES = tuple(
+        Tile(value=TileValue.from_exponent(exponent))
+        for exponent in range(_MAX_EXPONENT + 1)
+    )
+
+    def __init__(self, board: ArrayBoard, tile_spawner: ITileSpawner) -> None:
+        """
+        Initializes a new game instance.
+
+        :param board: Flat game board
+        :param tile_spawner: Tile spawner implementation
+        """
+        self._board = board
+        self._dim = board.get_dim()
+        self._cells = board.get_cells()
+        self._view = memoryview(self._cells)
+        self._tile_spawner = tile_spawner
+        self._tiles = board.get_tiles()
+        self._score = 0
+        self._lines = self._get_lines(self._dim)
+
+    def start(self) -> GameState:
+        """
+        Starts a new game by spawning initial tiles.
+
+        :return: Initial game state with 2 spawned tiles
+        """
+        changed: set[int] = set()
+        self._spawn(2, changed)
+        return GameState(
+            tiles=self._tiles,
+            score=0,
+            status=GameStatus.IN_PROGRESS,
+            result=None,
+            changed_cells=self._to_positions(changed),
+        )
+
+    def make_move(self, move_direction: MoveDirection) -> GameState:
+        """
+        Processes a player move and updates game state.
+
+        :param move_direction: Direction to move tiles
+        :return: Updated game state after move processing
+        :raises ValueError: if move cannot be processed
+        """
+        lines = self._lines.get(move_direction)
+        if lines is None:
+            raise ValueError(f"Invalid move direction: {move_direction}")
+
+        changed: set[int] = set()
+        for line, indices in lines:
+            self._slide_line(line, indices, changed)
+        if changed:
+            self._spawn(1, changed)
+
+        game_result = self._get_game_result()
+        game_status = (
+            GameStatus.IN_PROGRESS if game_result is None else GameStatus.COMPLETED
+        )
+
+        return GameState(
+            tiles=self._tiles,
+            score=self._score,
+            status=game_status,
+            result=game_result,
+            changed_cells=self._to_positions(changed),
+        )
+
+    def get_snapshot(self) -> GameSnapshot:
+        """
+        Packs the exponent array, two cells per byte, together with the score,
+        result and generator state.
+
+        :return: Snapshot of the current game
+        """
+        cells = self._cells
+        # two 4-bit exponents per byte, lowest nibble first
+        packed = bytes(low | high << 4 for low, high in zip(cells[0::2], cells[1::2]))
+        if len(cells) % 2:
+            packed += bytes((cells[-1],))
+        return GameSnapshot(
+            dimension=self._dim,
+            cells=int.from_bytes(packed, "little"),
+            score=self._score,
+            result=self._get_game_result(),
+            rng_state=self._tile_spawner.get_random_generator().getstate(),
+        )
+
+    def restore_snapshot(self, snapshot: GameSnapshot) -> None:
+        """
+        Unpacks the board of a snapshot into the exponent array. The
+        generator is only restored if the snapshot holds its state.
+
+        :param snapshot: Snapshot taken from a game of the same dimension
+        :raises ValueError: If the snapshot does not fit the board
+        """
+        snapshot.check_fits(self._dim)
+
+        size = len(self._cells)
+        packed = snapshot.cells.to_bytes((size + 1) // 2, "little")
+        self._cells[0::2] = array("B", (byte & 0xF for byte in packed))
+        self._cells[1::2] = array("B", (byte >> 4 for byte in packed[: size // 2]))
+        self._tiles[:] = self._board.get_tiles()
+        self._score = snapshot.score
+        if snapshot.rng_state is not None:
+            self._tile_spawner.get_random_generator().setstate(snapshot.rng_state)
+
+    def _slide_line(self, line: slice, indices: range, changed: set[int]) -> None:
+        """
+        Slides and merges one line towards its first cell in a single pass,
+        accumulating the score.
+
+        :param line: Strided slice of the cells, ordered in move direction
+        :param indices: Cell index of every position of the line
+        :param changed: Receives the indices of the cells whose value changed
+        """
+        before = self._view[line].tobytes()
+        tiles = before.replace(b"\x00", b"")
+        if not tiles:
+            return
+
+        after = bytearray()
+        idx = 0
+        last = len(tiles) - 1
+        while idx < last:
+            exponent = tiles[idx]
+            if exponent == tiles[idx + 1] and exponent != self._MAX_EXPONENT:
+                exponent += 1
+                self._score += 1 << exponent
+                idx += 2
+            else:
+                idx += 1
+            after.append(exponent)
+        if idx == last:
+            after.append(tiles[last])
+        after.extend(bytes(len(before) - len(after)))
+
+        if after == before:
+            return
+        self._view[line] = after
+        for position, (old, new) in enumerate(zip(before, after)):
+            if old != new:
+                cell = indices[position]
+                self._tiles[cell // self._dim][cell % self._dim] = self._TILES[new]
+                changed.add(cell)
+
+    def _spawn(self, qty: int, changed: set[int]) -> None:
+        """
+        Spawns new tiles on random empty cells of the board.
+
+        Empty cells are listed in row-major order, like Board does, so the
+        same generator yields the same spawns as in Game.
+
+        :param qty: Number of tiles to spawn
+        :param changed: Receives the indices of the spawned cells
+        """
+        empty_cells = list(compress(range(len(self._cells)), map(not_, self._cells)))
+        for cell, value in self._tile_spawner.pick_spawns(qty, empty_cells):
+            exponent = value.exponent
+            self._cells[cell] = exponent
+            self._tiles[cell // self._dim][cell % self._dim] = self._TILES[exponent]
+            changed.add(cell)
+
+    def _to_positions(self, cells: set[int]) -> frozenset[TilePosition]:
+        """
+        Converts cell indices to positions.
+
+        :param cells: Indices of cells in the flat array
+        :return: Positions of the cells
+        """
+        return frozenset(
+            TilePosition(row_idx=cell // self._dim, col_idx=cell % self._dim)
+            for cell in cells
+        )
+
+    def _get_game_result(self) -> GameResult | None:
+        """
+        Determines current game result (win/lose) based on board state.
+
+        :return: GameResult if game ended, None otherwise
+        """
+        if self._WIN_EXPONENT in self._cells:
+            return GameResult.WIN
+
+        if 0 not in self._cells and not self._has_moves_left():
+            return GameResult.LOSE
+
+        return None
+
+    def _has_moves_left(self) -> bool:
+        """
+        Checks if any two neighbouring cells hold the same mergeable value,
+        comparing every cell with the one below and with the one to its right
+        a whole slice at a time.
+
+        :return: True if at least one valid move exists
+        """
+        cells = self._cells.tobytes()
+        # the largest tiles never merge: make them differ from any neighbour
+        merging = cells.translate(self._MERGING_EXPONENTS)
+        dim = self._dim
+        if any(map(eq, merging[:-dim], cells[dim:])):
+            return True
+        return any(
+            any(
+                map(
+                    eq, merging[start : start + dim - 1], cells[start + 1 : start + dim]
+                )
+            )
+            for start in range(0, dim * dim, dim)
+        )
+
+    @staticmethod
+    def _get_lines(dim: int) -> dict[MoveDirection, list[tuple[slice, range]]]:
+        """
+        Describes every line of the board for every direction: the strided
+        slice reading the line from the cell tiles move towards, and the
+        cell indices it covers.
+
+        :param dim: Board dimension
+        :return: Lines by move direction
+        """
+        size = dim * dim
+        cells = range(size)
+        starts = range(0, size, dim)
+
+        def lines(slices: list[slice]) -> list[tuple[slice, range]]:
+            return [(line, cells[line]) for line in slices]
+
+        return {
+            MoveDirection.LEFT: lines([slice(start, start + dim) for start in starts]),
+            MoveDirection.RIGHT: lines(
+                [
+                    slice(start + dim - 1, start - 1 if start else None, -1)
+                    for start in starts
+                ]
+            ),
+            MoveDirection.UP: lines([slice(col, size, dim) for col in range(dim)]),
+            MoveDirection.DOWN: lines(
+                [slice(size - dim + col, None, -dim) for col in range(dim)]
+            ),
+        }
@@ -0,0 +1,311 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from src.domain.dataclasses_.batch_game_state import BatchGameState
+from src.domain.dataclasses_.dimension import Dimension
+from src.domain.dataclasses_.game_result import GameState
+from src.domain.dataclasses_.tile import Tile
+from src.domain.entities.bit_board import BitBoard
+from src.domain.enums_.game_result import GameResult
+from src.domain.enums_.game_status import GameStatus
+from src.domain.enums_.move_direction import MoveDirection
+from src.domain.enums_.tile_value import TileValue
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError:  # NumPy is an optional extra: pip install ".[batch]"
+    np = None  # type: ignore[assignment]
+
+
+class BatchGame:
+    """
+    Runs N games of 2048 in lockstep using NumPy array operations.
+
+    Boards are kept as an ``(N, dim, dim)`` uint8 array of tile exponents.
+    Every call to make_moves advances all boards at once: boards are grouped
+    by direction, rotated so that the move becomes a LEFT move, slid and
+    merged column by column across all rows of the group, and rotated back.
+    Rules (merging, scoring, spawning, win/lose detection) match Game;
+    completed games are frozen and ignore further moves.
+
+    Requires NumPy, which is an optional dependency of the project.
+    """
+
+    DIRECTIONS: tuple[MoveDirection, ...] = (
+        MoveDirection.UP,
+        MoveDirection.DOWN,
+        MoveDirection.LEFT,
+        MoveDirection.RIGHT,
+    )
+
+    _WIN_EXPONENT = BitBoard.to_exponent(TileValue.ELEVEN)
+    # FIFTEEN is the largest tile and never merges
+    _MAX_EXPONENT = BitBoard.to_exponent(TileValue.FIFTEEN)
+
+    def __init__(
+        self,
+        boards_qty: int,
+        dimension: Dimension,
+        tile2_spawn_chance: float | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """
+        :param boards_qty: Number of boards (N) to run in parallel
+        :param dimension: Size of every board
+        :param tile2_spawn_chance: Probability (0-1) of spawning TileValue.ONE
+               instead of TileValue.TWO
+        :param seed: Seed of the NumPy random generator
+        :raises ImportError: If NumPy is not installed
+        :raises ValueError: If boards_qty is not positive
+        """
+        if np is None:
+            raise ImportError(
+                "BatchGame requires NumPy, install the 'batch' extra to use it"
+            )
+        if boards_qty < 1:
+            raise ValueError("boards_qty must be positive")
+
+        self._dim = dimension.rows
+        self._tile2_spawn_chance = tile2_spawn_chance or 0.9
+        self._rng = np.random.default_rng(seed)
+        self._exponents = np.zeros((boards_qty, self._dim, self._dim), dtype=np.uint8)
+        self._scores = np.zeros(boards_qty, dtype=np.int64)
+        self._statuses = np.full(
+            boards_qty, GameStatus.IN_PROGRESS.value, dtype=np.int8
+        )
+        self._results = np.full(boards_qty, BatchGameState.NO_RESULT, dtype=np.int8)
+
+    def start(self) -> BatchGameState:
+        """
+        Starts all games by spawning two tiles on every board.
+
+        :return: Initial state of all games
+        """
+        everyone = np.ones(len(self._exponents), dtype=np.bool_)
+        self._spawn(everyone)
+        self._spawn(everyone)
+        return self._get_state(changed=everyone)
+
+    def make_moves(
+        self, directions: Sequence[MoveDirection] | npt.NDArray[np.integer]
+    ) -> BatchGameState:
+        """
+        Applies one move to every board and updates all game states.
+
+        :param directions: One MoveDirection per board, or an integer array of
+               indices into DIRECTIONS
+        :return: Updated state of all games
+        :raises ValueError: If the number of directions does not match the
+                number of boards
+        """
+        codes = self._get_direction_codes(directions)
+        active = self._statuses == GameStatus.IN_PROGRESS.value
+        before = self._exponents.copy()
+
+        for code, direction in enumerate(self.DIRECTIONS):
+            mask = active & (codes == code)
+            if mask.any():
+                self._apply_move(direction, mask)
+
+        changed = (self._exponents != before).any(axis=(1, 2))
+        self._spawn(changed)
+        self._update_results(active)
+
+        return self._get_state(changed=changed)
+
+    def get_game_state(self, board_idx: int) -> GameState:
+        """
+        Converts a single board of the batch into a regular GameState.
+
+        :param board_idx: Index of the board
+        :return: GameState equivalent of the board
+        """
+        tiles = [
+            [Tile(value=BitBoard.to_value(int(exponent))) for exponent in row]
+            for row in self._exponents[board_idx]
+        ]
+        result_value = int(self._results[board_idx])
+        return GameState(
+            tiles=tiles,
+            score=int(self._scores[board_idx]),
+            status=GameStatus(int(self._statuses[board_idx])),
+            result=(
+                None
+                if result_value == BatchGameState.NO_RESULT
+                else GameResult(result_value)
+            ),
+        )
+
+    def _get_direction_codes(
+        self, directions: Sequence[MoveDirection] | npt.NDArray[np.integer]
+    ) -> npt.NDArray[np.intp]:
+        """
+        Converts the move vector to indices into DIRECTIONS.
+
+        :param directions: MoveDirections or their indices
+        :return: Integer array with one index per board
+        :raises ValueError: If the number of directions is wrong
+        """
+        if isinstance(directions, np.ndarray):
+            codes = directions.astype(np.intp, copy=False)
+        else:
+            codes = np.fromiter(
+                (self.DIRECTIONS.index(direction) for direction in directions),
+                dtype=np.intp,
+                count=len(directions),
+            )
+        if codes.shape != (len(self._exponents),):
+            raise ValueError("Exactly one direction per board is required")
+        return codes
+
+    def _apply_move(
+        self, direction: MoveDirection, mask: npt.NDArray[np.bool_]
+    ) -> None:
+        """
+        Moves the selected boards in a single direction.
+
+        :param direction: Direction of the move
+        :param mask: Boards to move
+        """
+        boards = self._to_left(direction, self._exponents[mask])
+        lines = boards.reshape(-1, self._dim)
+
+        moved, gained = self._slide_lines_left(lines)
+
+        self._exponents[mask] = self._from_left(direction, moved.reshape(boards.shape))
+        self._scores[mask] += gained.reshape(-1, self._dim).sum(axis=1)
+
+    def _slide_lines_left(
+        self, lines: npt.NDArray[np.uint8]
+    ) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.int64]]:
+        """
+        Slides every line towards index 0, merging matching pairs.
+
+        Lines are compacted, then neighbouring equal tiles are merged from
+        left to right (a merged tile leaves a hole behind, so it can't be
+        merged again, and FIFTEEN never merges), and finally compacted once
+        more.
+
+        :param lines: ``(K, dim)`` array of exponents
+        :return: Moved lines and the score gained by each line
+        """
+        lines = self._compact_left(lines)
+        gained = np.zeros(len(lines), dtype=np.int64)
+
+        for col in range(self._dim - 1):
+            current = lines[:, col]
+            following = lines[:, col + 1]
+            merge = (current != 0) & (current != self._MAX_EXPONENT)
+            merge &= current == following
+            current[merge] += 1
+            following[merge] = 0
+            gained[merge] += np.left_shift(1, current[merge].astype(np.int64))
+
+        return self._compact_left(lines), gained
+
+    def _compact_left(self, lines: npt.NDArray[np.uint8]) -> npt.NDArray[np.uint8]:
+        """
+        Moves all non-empty cells of every line to its beginning, keeping order.
+
+        :param lines: ``(K, dim)`` array of exponents
+        :return: New compacted array
+        """
+        order = np.argsort(lines == 0, axis=1, kind="stable")
+        return np.take_along_axis(lines, order, axis=1)
+
+    def _to_left(
+        self, direction: MoveDirection, boards: npt.NDArray[np.uint8]
+    ) -> npt.NDArray[np.uint8]:
+        """
+        Rotates boards so that a move in ``direction`` becomes a LEFT move.
+
+        :param direction: Direction of the move
+        :param boards: ``(M, dim, dim)`` array of boards
+        :return: Reoriented contiguous copy
+        """
+        if direction == MoveDirection.RIGHT:
+            boards = boards[:, :, ::-1]
+        elif direction == MoveDirection.UP:
+            boards = boards.transpose(0, 2, 1)
+        elif direction == MoveDirection.DOWN:
+            boards = boards.transpose(0, 2, 1)[:, :, ::-1]
+        return np.ascontiguousarray(boards)
+
+    def _from_left(
+        self, direction: MoveDirection, boards: npt.NDArray[np.uint8]
+    ) -> npt.NDArray[np.uint8]:
+        """
+        Reverts the reorientation done by _to_left.
+
+        :param direction: Direction of the move
+        :param boards: ``(M, dim, dim)`` array of boards
+        :return: Boards in their original orientation
+        """
+        if direction == MoveDirection.RIGHT:
+            return boards[:, :, ::-1]
+        if direction == MoveDirection.UP:
+            return boards.transpose(0, 2, 1)
+        if direction == MoveDirection.DOWN:
+            return boards[:, :, ::-1].transpose(0, 2, 1)
+        return boards
+
+    def _spawn(self, mask: npt.NDArray[np.bool_]) -> None:
+        """
+        Spawns one tile on a uniformly chosen empty cell of every selected board.
+
+        :param mask: Boards to spawn a tile on
+        """
+        flat = self._exponents.reshape(len(self._exponents), -1)
+        empty = flat == 0
+        mask = mask & empty.any(axis=1)
+        if not mask.any():
+            return
+
+        # the empty cell with the highest random key is a uniform choice
+        keys = np.where(empty[mask], self._rng.random(empty[mask].shape), -1.0)
+        cells = keys.argmax(axis=1)
+        values = np.where(
+            self._rng.random(len(cells)) < self._tile2_spawn_chance,
+            BitBoard.to_exponent(TileValue.ONE),
+            BitBoard.to_exponent(TileValue.TWO),
+        ).astype(np.uint8)
+        flat[np.flatnonzero(mask), cells] = values
+
+    def _update_results(self, mask: npt.NDArray[np.bool_]) -> None:
+        """
+        Checks win/lose conditions of the selected boards.
+
+        :param mask: Boards to check
+        """
+        boards = self._exponents
+        win = (boards == self._WIN_EXPONENT).any(axis=(1, 2))
+        has_empty = (boards == 0).any(axis=(1, 2))
+        # the largest tiles never merge, so equal neighbours of them don't count
+        mergeable = boards != self._MAX_EXPONENT
+        in_rows = mergeable[:, :, 1:] & (boards[:, :, 1:] == boards[:, :, :-1])
+        in_cols = mergeable[:, 1:, :] & (boards[:, 1:, :] == boards[:, :-1, :])
+        has_moves = in_rows.any(axis=(1, 2)) | in_cols.any(axis=(1, 2))
+        lose = ~has_empty & ~has_moves
+
+        won = mask & win
+        lost = mask & ~win & lose
+        self._results[won] = GameResult.WIN.value
+        self._results[lost] = GameResult.LOSE.value
+        self._statuses[won | lost] = GameStatus.COMPLETED.value
+
+    def _get_state(self, changed: npt.NDArray[np.bool_]) -> BatchGameState:
+        """
+        Builds a snapshot of all games.
+
+        :param changed: Boards changed by the last operation
+        :return: Copy of the current state
+        """
+        return BatchGameState(
+            exponents=self._exponents.copy(),
+            scores=self._scores.copy(),
+            statuses=self._statuses.copy(),
+            results=self._results.copy(),
+            changed=changed,
+        )
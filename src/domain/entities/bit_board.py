@@ -0,0 +1,312 @@
+from __future__ import annotations
+
+from typing import Any
+
+from src.domain.dataclasses_.dimension import Dimension
+from src.domain.dataclasses_.game_result import GameState
+from src.domain.dataclasses_.game_snapshot import GameSnapshot
+from src.domain.dataclasses_.tile import Tile
+from src.domain.dataclasses_.tile_position import TilePosition
+from src.domain.enums_.move_direction import MoveDirection
+from src.domain.enums_.tile_value import TileValue
+
+
+class BitBoard:
+    """
+    Represents the game board in 2048 packed into a single integer.
+
+    Every cell is stored as a 4-bit exponent (nibble): 0 for an empty cell,
+    ``n`` for a tile with value 2ⁿ. Cell ``(row, col)`` lives at nibble
+    ``row * dim + col``, so a 4×4 board fits into one 64-bit integer and a
+    whole row into 16 bits.
+    """
+
+    CELL_BITS = 4
+    CELL_MASK = 0xF
+    # hex digit of every tile (tiles are flyweights, one per value)
+    _TILE_DIGITS = {Tile(value=value): f"{value.exponent:x}" for value in TileValue}
+
+    def __init__(self, cells: int, dim: int) -> None:
+        """
+        :param cells: Packed board, one nibble per cell in row-major order
+        :param dim: Number of rows (and columns) of the board
+        """
+        self._cells = cells
+        self._dim = dim
+        # lowest bit of every nibble, and of every nibble but the last column
+        self._low_bits = int("1" * (dim * dim), 16) if dim else 0
+        self._pair_bits = int(("0" + "1" * (dim - 1)) * dim, 16) if dim else 0
+
+    def get_cells(self) -> int:
+        """
+        Returns the packed representation of the board.
+
+        :return: Integer with one 4-bit exponent per cell.
+        """
+        return self._cells
+
+    def set_cells(self, cells: int) -> None:
+        """
+        Replaces the packed representation of the board.
+
+        :param cells: Integer with one 4-bit exponent per cell.
+        """
+        self._cells = cells
+
+    def get_dim(self) -> int:
+        """
+        Returns the number of rows (and columns) of the board.
+
+        :return: Board dimension.
+        """
+        return self._dim
+
+    def get_tiles(self) -> list[list[Tile]]:
+        """
+        Returns a snapshot of all tiles on the board at the current moment.
+
+        The returned lists are freshly built, modifying them does not affect
+        the board.
+
+        :return: a list of all tiles.
+        """
+        cells = self._cells
+        from_exponent = TileValue.from_exponent
+        tiles: list[list[Tile]] = []
+        for _ in range(self._dim):
+            row: list[Tile] = []
+            for _ in range(self._dim):
+                row.append(Tile(value=from_exponent(cells & self.CELL_MASK)))
+                cells >>= self.CELL_BITS
+            tiles.append(row)
+        return tiles
+
+    def get_empty_tiles_positions(self) -> list[TilePosition]:
+        """
+        Returns a list of positions of all empty tiles on the board at the
+        current moment.
+
+        :return: a list of positions of all empty tiles on the board.
+        """
+        return [
+            TilePosition(row_idx=idx // self._dim, col_idx=idx % self._dim)
+            for idx in self.get_empty_cells()
+        ]
+
+    def get_empty_cells(self) -> list[int]:
+        """
+        Returns flat (row-major) indices of all empty cells.
+
+        :return: a list of indices of empty cells, in ascending order.
+        """
+        cells = self._cells
+        empty: list[int] = []
+        for idx in range(self._dim * self._dim):
+            if not cells & self.CELL_MASK:
+                empty.append(idx)
+            cells >>= self.CELL_BITS
+        return empty
+
+    def get_empty_mask(self) -> int:
+        """
+        Returns a mask with the lowest bit of every empty nibble set.
+
+        Computed with a few whole-board operations instead of a loop over the
+        cells. The set bits are the shifts at which new tiles can be placed.
+
+        :return: Empty cell mask, one set bit per empty cell.
+        """
+        return ~self._fold(self._cells) & self._low_bits
+
+    def get_legal_moves_mask(self) -> int:
+        """
+        Finds the moves that would change the board, without applying any.
+
+        A move is legal if some tile has an empty cell next to it in move
+        direction, or an equal neighbour along the move axis that it can
+        merge with (FIFTEEN never merges). Each check covers all cells at
+        once: nibbles are compared with the nibbles one cell (horizontal
+        moves) or one row (vertical moves) further, like get_empty_mask.
+
+        :return: 4-bit mask with MoveDirection.bit set for every legal move
+        """
+        cells = self._cells
+        occupied = self._fold(cells) & self._low_bits
+        empty = occupied ^ self._low_bits
+        # FIFTEEN is the only nibble with all bits set
+        fifteen = cells & (cells >> 1)
+        fifteen &= fifteen >> 2
+        mergeable = occupied & ~fifteen
+
+        # the right-hand neighbour is one nibble further, the one below a row
+        col_shift = self.CELL_BITS
+        row_shift = self.CELL_BITS * self._dim
+
+        # cells whose right-hand neighbour (in the same row) equals them
+        equal_in_rows = ~self._fold(cells ^ (cells >> col_shift)) & self._pair_bits
+        # cells whose neighbour below equals them, none in the last row
+        equal_in_cols = ~self._fold(cells ^ (cells >> row_shift))
+
+        mask = 0
+        if equal_in_rows & mergeable:
+            mask |= MoveDirection.LEFT.bit | MoveDirection.RIGHT.bit
+        else:
+            if empty & (occupied >> col_shift) & self._pair_bits:
+                mask |= MoveDirection.LEFT.bit
+            if occupied & (empty >> col_shift) & self._pair_bits:
+                mask |= MoveDirection.RIGHT.bit
+        if equal_in_cols & mergeable:
+            mask |= MoveDirection.UP.bit | MoveDirection.DOWN.bit
+        else:
+            if empty & (occupied >> row_shift):
+                mask |= MoveDirection.UP.bit
+            if occupied & (empty >> row_shift):
+                mask |= MoveDirection.DOWN.bit
+        return mask
+
+    @staticmethod
+    def _fold(cells: int) -> int:
+        """
+        Folds every nibble onto its lowest bit, which is then set iff the
+        nibble is non-zero. The other bits of the result are meaningless.
+
+        :param cells: Packed board
+        :return: Folded board
+        """
+        folded = cells | (cells >> 1)
+        return folded | (folded >> 2)
+
+    @staticmethod
+    def transpose(cells: int, dim: int) -> int:
+        """
+        Swaps rows and columns of a packed board.
+
+        :param cells: Packed board
+        :param dim: Board dimension
+        :return: Transposed packed board
+        """
+        if dim == 4:
+            # Swap nibbles across the diagonal in 2×2 blocks, then swap the
+            # off-diagonal 2×2 blocks themselves.
+            a = (
+                (cells & 0xF0F00F0FF0F00F0F)
+                | ((cells & 0x0000F0F00000F0F0) << 12)
+                | ((cells & 0x0F0F00000F0F0000) >> 12)
+            )
+            return (
+                (a & 0xFF00FF0000FF00FF)
+                | ((a & 0x00FF00FF00000000) >> 24)
+                | ((a & 0x00000000FF00FF00) << 24)
+            )
+
+        result = 0
+        for row_idx in range(dim):
+            for col_idx in range(dim):
+                src = (row_idx * dim + col_idx) * BitBoard.CELL_BITS
+                dst = (col_idx * dim + row_idx) * BitBoard.CELL_BITS
+                result |= ((cells >> src) & BitBoard.CELL_MASK) << dst
+        return result
+
+    @staticmethod
+    def get_changed_cells(diff: int, dim: int) -> frozenset[TilePosition]:
+        """
+        Converts a packed difference mask to cell positions.
+
+        :param diff: Packed board with a non-zero nibble for every changed cell
+        :param dim: Board dimension
+        :return: Positions of the changed cells
+        """
+        changed: list[TilePosition] = []
+        idx = 0
+        while diff:
+            if diff & BitBoard.CELL_MASK:
+                changed.append(TilePosition(row_idx=idx // dim, col_idx=idx % dim))
+            diff >>= BitBoard.CELL_BITS
+            idx += 1
+        return frozenset(changed)
+
+    @staticmethod
+    def to_game_state(
+        snapshot: GameSnapshot, previous: GameSnapshot | None = None
+    ) -> GameState:
+        """
+        Unpacks a snapshot into a GameState.
+
+        :param snapshot: Snapshot to unpack
+        :param previous: Snapshot the game is coming from, e.g. when undoing a
+               move; the cells differing from it are reported as changed
+        :return: Game state with freshly built tiles
+        """
+        changed_cells: frozenset[TilePosition] = frozenset()
+        if previous is not None:
+            changed_cells = BitBoard.get_changed_cells(
+                snapshot.cells ^ previous.cells, snapshot.dimension
+            )
+        return GameState(
+            tiles=BitBoard(cells=snapshot.cells, dim=snapshot.dimension).get_tiles(),
+            score=snapshot.score,
+            status=snapshot.status,
+            result=snapshot.result,
+            changed_cells=changed_cells,
+        )
+
+    @staticmethod
+    def to_snapshot(game_state: GameState, rng_state: Any = None) -> GameSnapshot:
+        """
+        Packs a GameState into a snapshot.
+
+        :param game_state: State to pack
+        :param rng_state: State of the game's generator, if it is known
+        :return: Snapshot of the state
+        """
+        return GameSnapshot(
+            dimension=len(game_state.tiles),
+            cells=BitBoard.from_tiles(game_state.tiles).get_cells(),
+            score=game_state.score,
+            result=game_state.result,
+            rng_state=rng_state,
+        )
+
+    @staticmethod
+    def to_exponent(value: TileValue) -> int:
+        """
+        Converts a tile value to the exponent stored in a nibble.
+
+        :param value: Tile value
+        :return: Exponent (0 for an empty tile)
+        """
+        return value.exponent
+
+    @staticmethod
+    def to_value(exponent: int) -> TileValue:
+        """
+        Converts an exponent stored in a nibble to a tile value.
+
+        :param exponent: Exponent (0 for an empty tile)
+        :return: Corresponding tile value
+        """
+        return TileValue.from_exponent(exponent)
+
+    @classmethod
+    def from_tiles(cls, tiles: list[list[Tile]]) -> BitBoard:
+        """
+        Packs a 2D list of tiles into a new board.
+
+        :param tiles: Square 2D list of tiles
+        :return: A new BitBoard holding the same tiles.
+        """
+        # one hex digit per nibble, the last cell first; parsing the digits
+        # is linear in the number of cells, OR-ing them in one by one is not
+        digit = cls._TILE_DIGITS.__getitem__
+        digits = "".join("".join(map(digit, reversed(row))) for row in reversed(tiles))
+        return cls(cells=int(digits or "0", 16), dim=len(tiles))
+
+    @classmethod
+    def create(cls, dimension: Dimension) -> BitBoard:
+        """
+        Creates a new empty board with the specified dimensions.
+
+        :param dimension: The size of the board (rows x cols).
+        :return: A new BitBoard instance with all cells empty.
+        """
+        return cls(cells=0, dim=dimension.rows)
@@ -0,0 +1,359 @@
+from collections.abc import Iterable
+
+from src.domain.dataclasses_.game_result import GameState
+from src.domain.dataclasses_.game_snapshot import GameSnapshot
+from src.domain.dataclasses_.game_summary import GameSummary
+from src.domain.dataclasses_.tile_position import TilePosition
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.move_tables import MoveTables
+from src.domain.enums_.game_result import GameResult
+from src.domain.enums_.game_status import GameStatus
+from src.domain.enums_.move_direction import MoveDirection
+from src.domain.enums_.tile_value import TileValue
+from src.domain.interfaces.domain.tile_spawner import ITileSpawner
+
+
+class BitBoardGame:
+    """
+    Game logic for 2048 operating on a packed BitBoard.
+
+    Behaves exactly like Game (same moves, scoring, spawning order and
+    win/lose rules), but keeps the board as a single integer so that moves
+    do not allocate Tile objects. Tiles are only materialized when a
+    GameState is returned.
+    """
+
+    _WIN_EXPONENT = BitBoard.to_exponent(TileValue.ELEVEN)
+
+    def __init__(
+        self,
+        board: BitBoard,
+        tile_spawner: ITileSpawner,
+        move_tables: MoveTables | None = None,
+    ) -> None:
+        """
+        Initializes a new game instance.
+
+        :param board: Packed game board
+        :param tile_spawner: Tile spawner implementation
+        :param move_tables: Precomputed row moves, used for 4×4 boards only;
+               rows are slid one by one when omitted
+        """
+        self._board = board
+        self._dim = board.get_dim()
+        self._tile_spawner = tile_spawner
+        self._move_tables = move_tables if self._dim == MoveTables.ROW_CELLS else None
+        self._score = 0
+        # lowest bit of every nibble, and a board filled with the win exponent
+        self._low_bits = int("1" * (self._dim * self._dim), 16) if self._dim else 0
+        self._win_cells = self._low_bits * self._WIN_EXPONENT
+        # legal moves of the board last asked about
+        self._legal_moves: tuple[int, int] | None = None
+
+    def start(self) -> GameState:
+        """
+        Starts a new game by spawning initial tiles.
+
+        :return: Initial game state with 2 spawned tiles
+        """
+        cells_before = self._board.get_cells()
+        self._spawn(2)
+        return GameState(
+            tiles=self._board.get_tiles(),
+            score=0,
+            status=GameStatus.IN_PROGRESS,
+            result=None,
+            changed_cells=self._get_changed_cells(
+                cells_before ^ self._board.get_cells()
+            ),
+        )
+
+    def make_move(self, move_direction: MoveDirection) -> GameState:
+        """
+        Processes a player move and updates game state.
+
+        :param move_direction: Direction to move tiles
+        :return: Updated game state after move processing
+        """
+        cells_before = self._board.get_cells()
+        cells_after = self._apply_move(move_direction, cells_before)
+        self._board.set_cells(cells_after)
+
+        if cells_after != cells_before:
+            self._spawn(1)
+
+        game_result: GameResult | None = self._get_game_result(self._board.get_cells())
+        game_status = (
+            GameStatus.IN_PROGRESS if game_result is None else GameStatus.COMPLETED
+        )
+
+        return GameState(
+            tiles=self._board.get_tiles(),
+            score=self._score,
+            status=game_status,
+            result=game_result,
+            # spawned cells are reported even if a tile of the same value
+            # moved away from them, like Game does
+            changed_cells=self._get_changed_cells(
+                (cells_before ^ cells_after) | (cells_after ^ self._board.get_cells())
+            ),
+        )
+
+    def step(self, move_direction: MoveDirection) -> GameResult | None:
+        """
+        Processes a player move like make_move, without building a GameState.
+        Meant for callers that keep their own representation of the game
+        (e.g. a server hosting many games).
+
+        :param move_direction: Direction to move tiles
+        :return: GameResult if the game ended, None otherwise
+        """
+        cells = self._board.get_cells()
+        moved = self._apply_move(move_direction, cells)
+        if moved != cells:
+            self._board.set_cells(moved)
+            self._spawn(1)
+        return self._get_game_result(self._board.get_cells())
+
+    def apply_moves(self, moves: Iterable[MoveDirection]) -> GameSummary:
+        """
+        Processes a sequence of moves without building a GameState per move.
+
+        Moves are applied exactly like make_move does (including spawning and
+        drawing from the random generator), which makes this the fast path
+        for replaying recorded games. The game result is only evaluated after
+        the last move, so the sequence should end where the game ended.
+
+        :param moves: Directions to apply, in order
+        :return: Summary of the game after the last move
+        """
+        cells = self._board.get_cells()
+        moves_qty = 0
+        for move in moves:
+            moved = self._apply_move(move, cells)
+            moves_qty += 1
+            if moved != cells:
+                self._board.set_cells(moved)
+                self._spawn(1)
+                cells = self._board.get_cells()
+
+        max_exponent = 0
+        cells_bits = self._dim * self._dim * BitBoard.CELL_BITS
+        for shift in range(0, cells_bits, BitBoard.CELL_BITS):
+            max_exponent = max(max_exponent, (cells >> shift) & BitBoard.CELL_MASK)
+
+        return GameSummary(
+            score=self._score,
+            max_tile=BitBoard.to_value(max_exponent),
+            moves=moves_qty,
+            result=self._get_game_result(cells),
+        )
+
+    def get_cells(self) -> int:
+        """
+        Returns the packed board of the game.
+
+        :return: Integer with one 4-bit exponent per cell
+        """
+        return self._board.get_cells()
+
+    def get_score(self) -> int:
+        """
+        Returns the score accumulated so far.
+
+        :return: Current score
+        """
+        return self._score
+
+    def restore(self, cells: int, score: int) -> None:
+        """
+        Continues a game from a saved packed board and score, e.g. to let one
+        engine serve many games stored compactly. The random generator of the
+        spawner is restored separately.
+
+        :param cells: Packed board
+        :param score: Score of the game
+        """
+        self._board.set_cells(cells)
+        self._score = score
+
+    def get_legal_moves_mask(self) -> int:
+        """
+        Tells which moves would change the board, without applying any.
+        The mask is cached until the board changes.
+
+        :return: 4-bit mask with MoveDirection.bit set for every legal move
+        """
+        return self._get_legal_moves_mask(self._board.get_cells())
+
+    def get_snapshot(self) -> GameSnapshot:
+        """
+        Returns the packed board as it is, together with the score, result
+        and generator state.
+
+        :return: Snapshot of the current game
+        """
+        cells = self._board.get_cells()
+        return GameSnapshot(
+            dimension=self._dim,
+            cells=cells,
+            score=self._score,
+            result=self._get_game_result(cells),
+            rng_state=self._tile_spawner.get_random_generator().getstate(),
+        )
+
+    def restore_snapshot(self, snapshot: GameSnapshot) -> None:
+        """
+        Takes the packed board of a snapshot over as it is. The generator is
+        only restored if the snapshot holds its state.
+
+        :param snapshot: Snapshot taken from a game of the same dimension
+        :raises ValueError: If the snapshot does not fit the board
+        """
+        snapshot.check_fits(self._dim)
+
+        self.restore(cells=snapshot.cells, score=snapshot.score)
+        if snapshot.rng_state is not None:
+            self._tile_spawner.get_random_generator().setstate(snapshot.rng_state)
+
+    def _apply_move(self, move: MoveDirection, cells: int) -> int:
+        """
+        Applies move in specified direction to the packed board.
+
+        Vertical moves are performed as horizontal moves on the transposed
+        board: UP becomes LEFT and DOWN becomes RIGHT.
+
+        :param move: Direction to move
+        :param cells: Packed board before the move
+        :return: Packed board after the move
+        :raises ValueError: if move cannot be processed
+        """
+        if self._move_tables is not None:
+            cells, score = self._move_tables.move(cells, move)
+            self._score += score
+            return cells
+
+        if move == MoveDirection.LEFT:
+            return self._apply_move_rows(cells, reverse=False)
+        if move == MoveDirection.RIGHT:
+            return self._apply_move_rows(cells, reverse=True)
+        if move == MoveDirection.UP:
+            transposed = self._transpose(cells)
+            return self._transpose(self._apply_move_rows(transposed, reverse=False))
+        if move == MoveDirection.DOWN:
+            transposed = self._transpose(cells)
+            return self._transpose(self._apply_move_rows(transposed, reverse=True))
+        raise ValueError(f"Invalid move direction: {move}")
+
+    def _apply_move_rows(self, cells: int, reverse: bool) -> int:
+        """
+        Slides and merges every row towards column 0 (or towards the last
+        column when ``reverse`` is set), accumulating the score.
+
+        :param cells: Packed board
+        :param reverse: Move rows towards the last column instead of column 0
+        :return: Packed board after the move
+        """
+        cells, score = MoveTables.move_rows(cells, self._dim, reverse)
+        self._score += score
+        return cells
+
+    def _transpose(self, cells: int) -> int:
+        """
+        Swaps rows and columns of the packed board.
+
+        :param cells: Packed board
+        :return: Transposed packed board
+        """
+        return BitBoard.transpose(cells, self._dim)
+
+    def _spawn(self, qty: int) -> None:
+        """
+        Spawns new tiles on random empty cells of the board.
+
+        :param qty: Number of tiles to spawn
+        """
+        cells = self._board.get_cells()
+        for shift, value in self._tile_spawner.pick_spawns_in_mask(
+            qty, self._board.get_empty_mask()
+        ):
+            cells |= BitBoard.to_exponent(value) << shift
+        self._board.set_cells(cells)
+
+    def _get_changed_cells(self, diff: int) -> frozenset[TilePosition]:
+        """
+        Converts a packed difference mask to cell positions.
+
+        :param diff: Packed board with a non-zero nibble for every changed cell
+        :return: Positions of the changed cells
+        """
+        return BitBoard.get_changed_cells(diff, self._dim)
+
+    def _get_game_result(self, cells: int) -> GameResult | None:
+        """
+        Determines current game result (win/lose) based on board state.
+
+        :param cells: Packed board
+        :return: GameResult if game ended, None otherwise
+        """
+        if self._is_win(cells):
+            return GameResult.WIN
+
+        if self._is_lose(cells):
+            return GameResult.LOSE
+
+        return None
+
+    def _is_win(self, cells: int) -> bool:
+        """
+        Checks if winning condition is met (TileValue.ELEVEN present).
+
+        :param cells: Packed board
+        :return: True if winning tile found
+        """
+        return self._has_zero_cell(cells ^ self._win_cells)
+
+    def _is_lose(self, cells: int) -> bool:
+        """
+        Checks if losing condition is met (no valid moves left).
+
+        :param cells: Packed board
+        :return: True if no valid moves available
+        """
+        if self._has_empty_cells(cells):
+            return False
+        return not self._get_legal_moves_mask(cells)
+
+    def _has_empty_cells(self, cells: int) -> bool:
+        """
+        Checks if at least one cell of the packed board is empty.
+
+        :param cells: Packed board
+        :return: True if an empty cell exists
+        """
+        return self._has_zero_cell(cells)
+
+    def _has_zero_cell(self, cells: int) -> bool:
+        """
+        Checks all nibbles for zero at once: a nibble is non-zero iff the OR of
+        its four bits, folded into its lowest bit, is set.
+
+        :param cells: Packed board
+        :return: True if any nibble is zero
+        """
+        folded = cells | (cells >> 1)
+        folded |= folded >> 2
+        return bool(~folded & self._low_bits)
+
+    def _get_legal_moves_mask(self, cells: int) -> int:
+        """
+        Computes the legal moves of a packed board, reusing the last result
+        while the board stays the same.
+
+        :param cells: Packed board
+        :return: 4-bit mask with MoveDirection.bit set for every legal move
+        """
+        if self._legal_moves is None or self._legal_moves[0] != cells:
+            mask = BitBoard(cells=cells, dim=self._dim).get_legal_moves_mask()
+            self._legal_moves = (cells, mask)
+        return self._legal_moves[1]
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
+from typing import overload
+
 from src.domain.dataclasses_.dimension import Dimension
 from src.domain.dataclasses_.tile import Tile
 from src.domain.dataclasses_.tile_position import TilePosition
@@ -7,10 +10,40 @@ from src.domain.enums_.tile_value import TileValue
 
 
 class Board:
-    """Represents the game board in 2048, containing tiles and their positions."""
+    """
+    Represents the game board in 2048, containing tiles and their positions.
+
+    Empty cells are indexed incrementally in a Fenwick tree of per-cell empty
+    flags, updated only for the cells reported through update_cells, in
+    O(log N) per changed cell. The same tree finds the k-th empty cell in
+    row-major order in O(log N), so counting and sampling empty cells neither
+    scans the board nor builds a list of them.
+    """
 
     def __init__(self, tiles: list[list[Tile]]) -> None:
         self._tiles = tiles
+        self._cols = len(tiles[0]) if tiles else 0
+        self._positions: list[TilePosition] = [
+            TilePosition(row_idx=row_idx, col_idx=col_idx)
+            for row_idx, row in enumerate(tiles)
+            for col_idx in range(len(row))
+        ]
+        self._is_empty = bytearray(
+            tiles[position.row_idx][position.col_idx].value == TileValue.ZERO
+            for position in self._positions
+        )
+        self._empty_count = sum(self._is_empty)
+
+        # node i (1-based) counts the empty cells in (i - lowbit(i), i]
+        size = len(self._positions)
+        self._tree = [0, *self._is_empty]
+        for node in range(1, size + 1):
+            parent = node + (node & -node)
+            if parent <= size:
+                self._tree[parent] += self._tree[node]
+        # largest power of two not above the size, where lookups start
+        self._top = 1 << (size.bit_length() - 1) if size else 0
+        self._empty_positions = _EmptyPositions(self)
 
     def get_tiles(self) -> list[list[Tile]]:
         """
@@ -20,19 +53,70 @@ class Board:
         """
         return self._tiles
 
-    def get_empty_tiles_positions(self) -> list[TilePosition]:
+    def get_empty_tiles_positions(self) -> Sequence[TilePosition]:
         """
-        Returns a list of positions of all empty tiles on the board at the
-        current moment.
+        Returns positions of all empty tiles on the board at the current
+        moment, in row-major order.
+
+        The sequence is a live read-only view of the index: indexing it costs
+        O(log N) and it changes with the board, copy it to keep a snapshot.
 
-        :return: a list of positions of all empty tiles on the board.
+        :return: positions of all empty tiles on the board.
         """
-        return [
-            TilePosition(row_idx=row_idx, col_idx=col_idx)
-            for row_idx, row in enumerate(self._tiles)
-            for col_idx, tile in enumerate(row)
-            if tile.value == TileValue.ZERO
-        ]
+        return self._empty_positions
+
+    def get_empty_cells_count(self) -> int:
+        """
+        Returns the number of empty tiles on the board.
+
+        :return: number of empty tiles.
+        """
+        return self._empty_count
+
+    def update_cells(self, positions: Iterable[TilePosition]) -> None:
+        """
+        Updates the empty-cell index after tiles at the given positions were
+        replaced (moved, merged or spawned).
+
+        :param positions: positions whose tiles may have changed.
+        """
+        tree = self._tree
+        size = len(self._positions)
+        for position in positions:
+            idx = position.row_idx * self._cols + position.col_idx
+            is_empty = (
+                self._tiles[position.row_idx][position.col_idx].value == TileValue.ZERO
+            )
+            if is_empty == self._is_empty[idx]:
+                continue
+
+            self._is_empty[idx] = is_empty
+            delta = 1 if is_empty else -1
+            self._empty_count += delta
+            node = idx + 1
+            while node <= size:
+                tree[node] += delta
+                node += node & -node
+
+    def _find_empty_cell(self, rank: int) -> int:
+        """
+        Finds the flat index of the rank-th empty cell in row-major order by
+        descending the Fenwick tree.
+
+        :param rank: Zero-based rank, below the number of empty cells
+        :return: Flat cell index
+        """
+        tree = self._tree
+        size = len(self._positions)
+        node = 0
+        step = self._top
+        while step:
+            child = node + step
+            if child <= size and tree[child] <= rank:
+                node = child
+                rank -= tree[child]
+            step >>= 1
+        return node
 
     @classmethod
     def create(cls, dimension: Dimension) -> Board:
@@ -50,3 +134,29 @@ class Board:
         ]
 
         return cls(tiles=tiles)
+
+
+class _EmptyPositions(Sequence[TilePosition]):
+    """Live row-major view of the empty positions of a board."""
+
+    def __init__(self, board: Board) -> None:
+        self._board = board
+
+    def __len__(self) -> int:
+        return self._board._empty_count
+
+    @overload
+    def __getitem__(self, idx: int) -> TilePosition: ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> list[TilePosition]: ...
+
+    def __getitem__(self, idx: int | slice) -> TilePosition | list[TilePosition]:
+        if isinstance(idx, slice):
+            return [self[rank] for rank in range(*idx.indices(len(self)))]
+        count = self._board._empty_count
+        if idx < 0:
+            idx += count
+        if not 0 <= idx < count:
+            raise IndexError("empty position index out of range")
+        return self._board._positions[self._board._find_empty_cell(idx)]
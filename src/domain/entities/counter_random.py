@@ -0,0 +1,94 @@
+from collections.abc import Sequence
+from typing import TypeVar
+
+_ItemT = TypeVar("_ItemT")
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+
+
+class CounterRandom:
+    """
+    Counter-based random generator (SplitMix64).
+
+    The n-th output is a pure function of (seed, n): a 64-bit counter is
+    scrambled by the SplitMix64 finalizer. Creating a generator is free (no
+    state table to initialize like random.Random) and the whole state is two
+    integers, so it is cheap to store with replays and snapshots.
+
+    Not suitable for cryptography.
+    """
+
+    def __init__(self, seed: int = 0) -> None:
+        """
+        :param seed: Any integer, reduced to 64 bits
+        """
+        self._seed = seed & _MASK64
+        self._counter = 0
+
+    def seed(self, seed: int, /) -> None:
+        """
+        Restarts the sequence of another seed.
+
+        :param seed: Any integer, reduced to 64 bits
+        """
+        self._seed = seed & _MASK64
+        self._counter = 0
+
+    def random(self) -> float:
+        """
+        Draws a float uniformly from [0, 1) with 53 bits of precision.
+
+        :return: Random float
+        """
+        return (self._next() >> 11) * (1.0 / (1 << 53))
+
+    def randrange(self, stop: int, /) -> int:
+        """
+        Draws an integer uniformly from [0, stop) by multiply-shift; the bias
+        is below stop / 2⁶⁴, negligible for board-sized ranges.
+
+        :param stop: Exclusive upper bound (positive)
+        :return: Random integer
+        """
+        return (self._next() * stop) >> 64
+
+    def choice(self, seq: Sequence[_ItemT]) -> _ItemT:
+        """
+        Picks a uniformly random element of a non-empty sequence.
+
+        :param seq: Sequence to pick from
+        :return: Chosen element
+        :raises IndexError: If the sequence is empty
+        """
+        if not seq:
+            raise IndexError("Cannot choose from an empty sequence")
+        return seq[self.randrange(len(seq))]
+
+    def getstate(self) -> tuple[int, int]:
+        """
+        Captures the generator state.
+
+        :return: (seed, counter) pair
+        """
+        return self._seed, self._counter
+
+    def setstate(self, state: tuple[int, int]) -> None:
+        """
+        Restores a state captured by getstate.
+
+        :param state: (seed, counter) pair
+        """
+        self._seed, self._counter = state
+
+    def _next(self) -> int:
+        """
+        Advances the counter and scrambles it.
+
+        :return: Next 64-bit output
+        """
+        self._counter += 1
+        z = (self._seed + self._counter * _GOLDEN_GAMMA) & _MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+        return z ^ (z >> 31)
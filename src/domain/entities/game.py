@@ -1,7 +1,10 @@
-import copy
-
 from src.domain.dataclasses_.game_result import GameState
+from src.domain.dataclasses_.game_snapshot import GameSnapshot
+from src.domain.dataclasses_.move_preview import MovePreview
 from src.domain.dataclasses_.tile import Tile
+from src.domain.dataclasses_.tile_position import TilePosition
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.move_tables import MoveTables
 from src.domain.enums_.game_result import GameResult
 from src.domain.enums_.game_status import GameStatus
 from src.domain.enums_.move_direction import MoveDirection
@@ -18,21 +21,40 @@ class Game:
     and spawns new tiles after valid moves.
     """
 
+    # FIFTEEN is the largest value (and the largest exponent of a packed cell)
+    _UNMERGEABLE_VALUES = frozenset({TileValue.ZERO, TileValue.FIFTEEN})
+    _EMPTY_TILE = Tile(value=TileValue.ZERO)
+
     def __init__(
         self,
         board: IBoard,
         tile_spawner: ITileSpawner,
+        move_tables: MoveTables | None = None,
     ) -> None:
         """
         Initializes a new game instance.
 
         :param board: The game board implementation
         :param tile_spawner: Tile spawner implementation
+        :param move_tables: Precomputed row moves, used for 4×4 boards only;
+               the slide-and-merge kernel is used when omitted
         """
         self._board = board
         self._dim = len(board.get_tiles())
         self._tile_spawner = tile_spawner
+        self._move_tables = move_tables if self._dim == MoveTables.ROW_CELLS else None
         self._score = 0
+        self._lines = self._get_lines(self._dim)
+        # computed on demand, dropped whenever the board changes
+        self._packed_cells: int | None = None
+        self._legal_moves_mask: int | None = None
+        self._successors: dict[MoveDirection, MovePreview] | None = None
+        # row and column (and position) of every cell index used by the lines
+        self._cells = [divmod(cell, self._dim) for cell in range(self._dim**2)]
+        self._positions = [
+            TilePosition(row_idx=row_idx, col_idx=col_idx)
+            for row_idx, col_idx in self._cells
+        ]
 
     def start(self) -> GameState:
         """
@@ -41,12 +63,17 @@ class Game:
         :return: Initial game state with 2 spawned tiles
         """
         tiles: list[list[Tile]] = self._board.get_tiles()
-        self._tile_spawner.spawn(tiles, 2, self._board.get_empty_tiles_positions())
+        spawned = self._tile_spawner.spawn(
+            tiles, 2, self._board.get_empty_tiles_positions()
+        )
+        self._board.update_cells(spawned)
+        self._forget_board()
         return GameState(
             tiles=self._board.get_tiles(),
             score=0,
             status=GameStatus.IN_PROGRESS,
             result=None,
+            changed_cells=frozenset(spawned),
         )
 
     def make_move(self, move_direction: MoveDirection) -> GameState:
@@ -57,247 +84,327 @@ class Game:
         :return: Updated game state after move processing
         """
         tiles: list[list[Tile]] = self._board.get_tiles()
-        tiles_before = copy.deepcopy(tiles)
-        self._apply_move(move_direction, tiles)
-        tiles_after = self._board.get_tiles()
+        changed_cells = self._apply_move(move_direction, tiles)
+        self._board.update_cells(changed_cells)
 
-        if self._has_board_changed(tiles_before, tiles_after):
-            self._tile_spawner.spawn(
-                tiles_after, 1, self._board.get_empty_tiles_positions()
+        if changed_cells:
+            spawned = self._tile_spawner.spawn(
+                tiles, 1, self._board.get_empty_tiles_positions()
             )
+            self._board.update_cells(spawned)
+            changed_cells.update(spawned)
+            self._forget_board()
 
-        game_result: GameResult | None = self._get_game_result(tiles_after)
+        game_result: GameResult | None = self._get_game_result(tiles)
         game_status = (
             GameStatus.IN_PROGRESS if game_result is None else GameStatus.COMPLETED
         )
 
         return GameState(
-            tiles=tiles_after,
+            tiles=tiles,
             score=self._score,
             status=game_status,
             result=game_result,
+            changed_cells=frozenset(changed_cells),
         )
 
-    def _apply_move(self, move: MoveDirection, tiles: list[list[Tile]]) -> None:
+    def get_legal_moves_mask(self) -> int:
+        """
+        Tells which moves would change the board, without applying any.
+
+        The board is packed and checked a whole board at a time (see
+        BitBoard.get_legal_moves_mask); the mask is cached until the board
+        changes.
+
+        :return: 4-bit mask with MoveDirection.bit set for every legal move
+        """
+        if self._legal_moves_mask is None:
+            board = BitBoard(cells=self._get_packed_cells(), dim=self._dim)
+            self._legal_moves_mask = board.get_legal_moves_mask()
+        return self._legal_moves_mask
+
+    def preview(self, direction: MoveDirection) -> MovePreview:
+        """
+        Tells what a move would do, without changing the game: the board
+        after sliding and merging (no tile spawned), the score gained and
+        whether the board changed.
+
+        :param direction: Direction of the move
+        :return: Outcome of the move
+        :raises ValueError: if move cannot be processed
+        """
+        preview = self._get_successors().get(direction)
+        if preview is None:
+            raise ValueError(f"Invalid move direction: {direction}")
+        return preview
+
+    def successors(self) -> dict[MoveDirection, MovePreview]:
+        """
+        Previews all four moves at once, without changing the game.
+
+        The board is packed once and moved as an integer (with the move
+        tables on 4×4 boards), vertical moves share one transposition and
+        illegal moves are not computed at all. The previews are cached until
+        the board changes.
+
+        :return: Outcome of every move, by direction
+        """
+        return dict(self._get_successors())
+
+    def get_snapshot(self) -> GameSnapshot:
+        """
+        Packs the tile grid (cached until the board changes) together with the
+        score, result and generator state.
+
+        :return: Snapshot of the current game
+        """
+        return GameSnapshot(
+            dimension=self._dim,
+            cells=self._get_packed_cells(),
+            score=self._score,
+            result=self._get_game_result(self._board.get_tiles()),
+            rng_state=self._tile_spawner.get_random_generator().getstate(),
+        )
+
+    def restore_snapshot(self, snapshot: GameSnapshot) -> None:
+        """
+        Rebuilds the tile grid from the packed board of a snapshot. The
+        generator is only restored if the snapshot holds its state.
+
+        :param snapshot: Snapshot taken from a game of the same dimension
+        :raises ValueError: If the snapshot does not fit the board
+        """
+        snapshot.check_fits(self._dim)
+
+        tiles = self._board.get_tiles()
+        restored = BitBoard(cells=snapshot.cells, dim=self._dim).get_tiles()
+        for row_idx, row in enumerate(restored):
+            tiles[row_idx][:] = row
+        self._board.update_cells(
+            TilePosition(row_idx=row_idx, col_idx=col_idx)
+            for row_idx in range(self._dim)
+            for col_idx in range(self._dim)
+        )
+        self._forget_board()
+        self._score = snapshot.score
+        if snapshot.rng_state is not None:
+            self._tile_spawner.get_random_generator().setstate(snapshot.rng_state)
+
+    def _forget_board(self) -> None:
+        """Drops everything computed from the board, after it changed."""
+        self._packed_cells = None
+        self._legal_moves_mask = None
+        self._successors = None
+
+    def _get_packed_cells(self) -> int:
+        """
+        Packs the board, once per board.
+
+        :return: Packed board (see BitBoard)
+        """
+        if self._packed_cells is None:
+            tiles = self._board.get_tiles()
+            self._packed_cells = BitBoard.from_tiles(tiles).get_cells()
+        return self._packed_cells
+
+    def _get_successors(self) -> dict[MoveDirection, MovePreview]:
+        """
+        Computes (once per board) the outcome of every move on the packed
+        board.
+
+        :return: Outcome of every move, by direction
+        """
+        if self._successors is not None:
+            return self._successors
+
+        cells = self._get_packed_cells()
+        legal_moves_mask = self.get_legal_moves_mask()
+        transposed: int | None = None
+        successors: dict[MoveDirection, MovePreview] = {}
+        for direction in MoveDirection:
+            changed = bool(legal_moves_mask & direction.bit)
+            if not changed:
+                moved, score = cells, 0
+            elif self._move_tables is not None:
+                moved, score = self._move_tables.move(cells, direction)
+            elif direction in (MoveDirection.LEFT, MoveDirection.RIGHT):
+                reverse = direction == MoveDirection.RIGHT
+                moved, score = MoveTables.move_rows(cells, self._dim, reverse)
+            else:
+                if transposed is None:
+                    transposed = BitBoard.transpose(cells, self._dim)
+                reverse = direction == MoveDirection.DOWN
+                moved, score = MoveTables.move_rows(transposed, self._dim, reverse)
+                moved = BitBoard.transpose(moved, self._dim)
+            successors[direction] = MovePreview(
+                direction=direction,
+                dimension=self._dim,
+                cells=moved,
+                score_delta=score,
+                changed=changed,
+            )
+
+        self._successors = successors
+        return successors
+
+    def _apply_move(
+        self, move: MoveDirection, tiles: list[list[Tile]]
+    ) -> set[TilePosition]:
         """
         Applies move in specified direction to the tiles.
 
         :param move: Direction to move
         :param tiles: Current board tiles to modify
+        :return: Positions whose tile value changed, empty if nothing moved
         :raises ValueError: if move cannot be processed
         """
-        if move == MoveDirection.UP:
-            self._apply_move_up(tiles)
-        elif move == MoveDirection.DOWN:
-            self._apply_move_down(tiles)
-        elif move == MoveDirection.RIGHT:
-            self._apply_move_right(tiles)
-        elif move == MoveDirection.LEFT:
-            self._apply_move_left(tiles)
-        else:
-            raise ValueError(f"Invalid move direction: {move}")
-
-    def _apply_move_right(self, tiles: list[list[Tile]]) -> None:
-        """
-        Moves all tiles to the right, merging matching pairs.
-
-        Example transformation:
-        [0, 2, 2, 0]    =>   [0, 0, 0, 4]
-        [0, 4, 4, 4]    =>   [0, 0, 4, 8]
-        [2, 0, 2, 8]    =>   [0, 0, 4, 8]
-        [4, 8, 16, 16]  =>   [0, 4, 8, 32]
-        """
-        # all zeros should "pop up" in the opposite for move direction
-        for row in tiles:
-            target = self._dim - 1
-            source = self._dim - 2
-            while source >= 0:
-                if row[target].value != TileValue.ZERO:
-                    source -= 1
-                    target -= 1
-                    continue
-
-                if row[source].value != TileValue.ZERO:
-                    row[source], row[target] = row[target], row[source]
-                    source -= 1
-                    target -= 1
-                else:
-                    source -= 1
-
-        # merge tiles with the same value
-        for row in tiles:
-            target = self._dim - 1
-            source = self._dim - 2
-            while source >= 0:
-                if row[target].value != TileValue.ZERO and row[target] == row[source]:
-                    new_tile = Tile(value=row[target].value.next())
-                    row[target] = new_tile
-                    del row[source]
-                    row.insert(0, Tile(value=TileValue.ZERO))
-                    self._score += new_tile.value
-                source -= 1
-                target -= 1
-
-    def _apply_move_left(self, tiles: list[list[Tile]]) -> None:
-        """
-        Moves all tiles to the left, merging matching pairs.
-
-        Example transformation:
-        [0, 2, 2, 0]    =>   [4, 0, 0, 0]
-        [0, 4, 4, 4]    =>   [8, 4, 0, 0]
-        [2, 0, 2, 8]    =>   [4, 8, 0, 0]
-        [4, 8, 16, 16]  =>   [4, 8, 32, 0]
-        """
-        # all zeros should "pop up" in the opposite for move direction
-        for row in tiles:
-            target = 0
-            source = 1
-            while source < self._dim:
-                if row[target].value != TileValue.ZERO:
-                    source += 1
-                    target += 1
-                    continue
-
-                if row[source].value != TileValue.ZERO:
-                    row[source], row[target] = row[target], row[source]
-                    source += 1
-                    target += 1
-                else:
-                    source += 1
-
-        # merge tiles with the same value
-        for row in tiles:
-            target = 0
-            source = 1
-            while source < self._dim:
-                if row[target].value != TileValue.ZERO and row[target] == row[source]:
-                    new_tile = Tile(value=row[target].value.next())
-                    row[target] = new_tile
-                    del row[source]
-                    row.append(Tile(value=TileValue.ZERO))
-                    self._score += new_tile.value
-                source += 1
-                target += 1
-
-    def _apply_move_down(self, tiles: list[list[Tile]]) -> None:
-        """
-        Moves all tiles downward, merging matching pairs.
-
-        Example transformation:
-        [2, 0, 0, 0]   =>   [0, 0, 0, 0]
-        [2, 4, 0, 0]   =>   [0, 0, 0, 0]
-        [0, 4, 8, 0]   =>   [0, 8, 0, 0]
-        [0, 8, 8, 16]  =>   [4, 8, 16, 16]
-        """
-        # all zeros should "pop up" in the opposite for move direction
-        for i in range(self._dim):
-            target = self._dim - 1
-            source = self._dim - 2
-            while source >= 0:
-                if tiles[target][i].value != TileValue.ZERO:
-                    source -= 1
-                    target -= 1
-                    continue
-
-                if tiles[source][i].value != TileValue.ZERO:
-                    tiles[source][i], tiles[target][i] = (
-                        tiles[target][i],
-                        tiles[source][i],
-                    )
-                    source -= 1
-                    target -= 1
-                else:
-                    source -= 1
-
-        # merge tiles with the same value
-        for i in range(self._dim):
-            target = self._dim - 1
-            source = self._dim - 2
-            while source >= 0:
-                if (
-                    tiles[target][i].value != TileValue.ZERO
-                    and tiles[target][i] == tiles[source][i]
-                ):
-                    new_tile = Tile(value=tiles[target][i].value.next())
-                    tiles[target][i] = new_tile
-
-                    for j in range(source, 0, -1):
-                        tiles[j][i] = tiles[j - 1][i]
-                    tiles[0][i] = Tile(value=TileValue.ZERO)
+        if self._move_tables is not None:
+            return self._apply_move_with_tables(move, tiles, self._move_tables)
 
-                    self._score += new_tile.value
+        lines = self._lines.get(move)
+        if lines is None:
+            raise ValueError(f"Invalid move direction: {move}")
 
-                source -= 1
-                target -= 1
+        changed_cells: set[TilePosition] = set()
+        for start, stride in lines:
+            self._slide_line(tiles, start, stride, changed_cells)
+        return changed_cells
 
-    def _apply_move_up(self, tiles: list[list[Tile]]) -> None:
+    def _apply_move_with_tables(
+        self,
+        move: MoveDirection,
+        tiles: list[list[Tile]],
+        move_tables: MoveTables,
+    ) -> set[TilePosition]:
         """
-        Moves all tiles upward, merging matching pairs.
+        Applies move using precomputed row tables: every row (or column for
+        vertical moves) is packed into 16 bits, looked up and written back.
+        Only the cells whose value changed receive new Tile objects.
 
-        Example transformation:
-        [2, 0, 0, 0]   =>   [4, 8, 16, 16]
-        [2, 4, 0, 0]   =>   [0, 8, 0, 0]
-        [0, 4, 8, 0]   =>   [0, 0, 0, 0]
-        [0, 8, 8, 16]  =>   [0, 0, 0, 0]
+        :param move: Direction to move
+        :param tiles: Current 4×4 board tiles to modify
+        :param move_tables: Precomputed row moves
+        :return: Positions whose tile value changed
+        :raises ValueError: if move cannot be processed
         """
-        # all zeros should "pop up" in the opposite for move direction
-        for i in range(self._dim):
-            target = 0
-            source = 1
-            while source < self._dim:
-                if tiles[target][i].value != TileValue.ZERO:
-                    source += 1
-                    target += 1
-                    continue
-
-                if tiles[source][i].value != TileValue.ZERO:
-                    tiles[source][i], tiles[target][i] = (
-                        tiles[target][i],
-                        tiles[source][i],
-                    )
-                    source += 1
-                    target += 1
-                else:
-                    source += 1
-
-        # merge tiles with the same value
-        for i in range(self._dim):
-            target = 0
-            source = 1
-            while source < self._dim:
-                if (
-                    tiles[target][i].value != TileValue.ZERO
-                    and tiles[target][i] == tiles[source][i]
-                ):
-                    new_tile = Tile(value=tiles[target][i].value.next())
-                    tiles[target][i] = new_tile
-
-                    for j in range(source, self._dim - 1):
-                        tiles[j][i] = tiles[j + 1][i]
-                    tiles[self._dim - 1][i] = Tile(value=TileValue.ZERO)
-
-                    self._score += new_tile.value
-
-                source += 1
-                target += 1
-
-    def _has_board_changed(
+        if move == MoveDirection.LEFT or move == MoveDirection.UP:
+            rows, scores = move_tables.left_rows, move_tables.left_scores
+        elif move == MoveDirection.RIGHT or move == MoveDirection.DOWN:
+            rows, scores = move_tables.right_rows, move_tables.right_scores
+        else:
+            raise ValueError(f"Invalid move direction: {move}")
+        vertical = move == MoveDirection.UP or move == MoveDirection.DOWN
+
+        changed_cells: set[TilePosition] = set()
+        for line_idx in range(self._dim):
+            positions = [
+                (i, line_idx) if vertical else (line_idx, i) for i in range(self._dim)
+            ]
+
+            packed = 0
+            for shift, (row_idx, col_idx) in enumerate(positions):
+                exponent = BitBoard.to_exponent(tiles[row_idx][col_idx].value)
+                packed |= exponent << (shift * BitBoard.CELL_BITS)
+
+            moved = rows[packed]
+            if moved == packed:
+                continue
+            self._score += scores[packed]
+
+            for row_idx, col_idx in positions:
+                exponent = moved & BitBoard.CELL_MASK
+                moved >>= BitBoard.CELL_BITS
+                if BitBoard.to_exponent(tiles[row_idx][col_idx].value) != exponent:
+                    tiles[row_idx][col_idx] = Tile(value=BitBoard.to_value(exponent))
+                    changed_cells.add(TilePosition(row_idx=row_idx, col_idx=col_idx))
+
+        return changed_cells
+
+    def _slide_line(
         self,
-        tiles_before: list[list[Tile]],
-        tiles_after: list[list[Tile]],
-    ) -> bool:
+        tiles: list[list[Tile]],
+        start: int,
+        stride: int,
+        changed_cells: set[TilePosition],
+    ) -> None:
         """
-        Checks if board state changed after move attempt.
+        Slides and merges one line in place, in a single pass.
+
+        The line is addressed like a flat buffer holding the board row by row:
+        it begins at cell index ``start`` (the cell tiles move towards) and
+        every next cell is ``stride`` indices further. Tiles are read in line
+        order and written behind the read position, a tile being held back
+        until the next one tells whether both merge; the cells left behind
+        are emptied. Tiles are flyweights and positions are precomputed, so
+        nothing is allocated.
+
+        Example transformation (start=0, stride=1, i.e. a row moved left):
+        [2, 2, 2, 2]   =>   [4, 4, 0, 0]
+        [0, 4, 4, 8]   =>   [8, 8, 0, 0]
+
+        :param tiles: Board tiles to modify
+        :param start: Cell index of the first cell of the line
+        :param stride: Cell index distance between neighbouring cells
+        :param changed_cells: Receives the positions whose tile value changed
+        """
+        stop = start + stride * self._dim
+        cells = self._cells
+        positions = self._positions
+        write = start
+        # last tile read, not written yet as it may merge with the next one
+        held: Tile | None = None
+
+        for read in range(start, stop, stride):
+            row_idx, col_idx = cells[read]
+            tile = tiles[row_idx][col_idx]
+            if tile.value == TileValue.ZERO:
+                continue
+            if held is None:
+                held = tile
+                continue
+            # tile held back after writing the current one, none after a merge
+            next_held: Tile | None = tile
+            if held is tile and tile.value not in self._UNMERGEABLE_VALUES:
+                held = Tile(value=tile.value.next())
+                self._score += held.value
+                next_held = None
+
+            # tiles are flyweights: the same object means the same value
+            row_idx, col_idx = cells[write]
+            if tiles[row_idx][col_idx] is not held:
+                tiles[row_idx][col_idx] = held
+                changed_cells.add(positions[write])
+            write += stride
+            held = next_held
+
+        if held is not None:
+            row_idx, col_idx = cells[write]
+            if tiles[row_idx][col_idx] is not held:
+                tiles[row_idx][col_idx] = held
+                changed_cells.add(positions[write])
+            write += stride
+        for write in range(write, stop, stride):
+            row_idx, col_idx = cells[write]
+            if tiles[row_idx][col_idx] is not self._EMPTY_TILE:
+                tiles[row_idx][col_idx] = self._EMPTY_TILE
+                changed_cells.add(positions[write])
+
+    @staticmethod
+    def _get_lines(dim: int) -> dict[MoveDirection, list[tuple[int, int]]]:
+        """
+        Describes every line of the board for every direction as the start
+        offset and stride used by _slide_line.
 
-        :param tiles_before: Board state before move
-        :param tiles_after: Board state after move
-        :return: True if any tile changed position/value
+        :param dim: Board dimension
+        :return: (start, stride) of every line by move direction
         """
-        for i in range(self._dim):
-            for j in range(self._dim):
-                if tiles_before[i][j].value != tiles_after[i][j].value:
-                    return True
-        return False
+        last = dim - 1
+        return {
+            MoveDirection.LEFT: [(row * dim, 1) for row in range(dim)],
+            MoveDirection.RIGHT: [(row * dim + last, -1) for row in range(dim)],
+            MoveDirection.UP: [(col, dim) for col in range(dim)],
+            MoveDirection.DOWN: [(last * dim + col, -dim) for col in range(dim)],
+        }
 
     def _get_game_result(self, tiles: list[list[Tile]]) -> GameResult | None:
         """
@@ -334,26 +441,6 @@ class Game:
         :param tiles: Current board tiles
         :return: True if no valid moves available
         """
-        empty_tiles_positions = self._board.get_empty_tiles_positions()
-        return len(empty_tiles_positions) == 0 and not self._has_moves_left(tiles)
-
-    def _has_moves_left(self, tiles: list[list[Tile]]) -> bool:
-        """
-        Checks if any valid moves remain on the board.
-
-        :param tiles: Current board tiles
-        :return: True if at least one valid move exists
-        """
-        # search for available moves horizontally
-        for row in tiles:
-            for i in range(1, self._dim):
-                if row[i - 1] == row[i]:
-                    return True
-
-        # search for available moves vertically
-        for i in range(self._dim):
-            for j in range(1, self._dim):
-                if tiles[j - 1][i] == tiles[j][i]:
-                    return True
-
-        return False
+        if self._board.get_empty_cells_count() > 0:
+            return False
+        return not self.get_legal_moves_mask()
@@ -0,0 +1,222 @@
+import sys
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Any
+
+from src.domain.dataclasses_.game_snapshot import GameSnapshot
+
+
+@dataclass(frozen=True, slots=True)
+class _Entry:
+    """
+    A snapshot kept by the history.
+
+    For a Mersenne Twister generator the 624 state words are moved out of the
+    snapshot to ``words``, which is shared with the neighbouring entries, and
+    the snapshot only keeps ``(version, index, gauss)``.
+    """
+
+    snapshot: GameSnapshot
+    words: tuple[int, ...] | None
+    size: int
+
+
+class GameHistory:
+    """
+    Undo and redo stacks of a game, bounded in memory.
+
+    Entries are packed snapshots (board, score and generator state), so
+    undoing a move restores its score and redoing it spawns the same tile.
+    Undo and redo move one entry between the stacks, which costs the same
+    however long the game is. Recording a move clears the redo stack.
+
+    Memory is estimated from the sizes of the stored objects. When the
+    entries exceed ``max_bytes``, the oldest undo entries are dropped first.
+
+    A Mersenne Twister state is 624 words plus an index into them. The words
+    only change once every 624 draws, i.e. every few hundred moves, so
+    consecutive entries share one tuple of words.
+    """
+
+    DEFAULT_MAX_BYTES = 1 << 20
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """
+        :param max_bytes: Memory the entries may use, 0 disables the history
+        :raises ValueError: If max_bytes is negative
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+        self._max_bytes = max_bytes
+        self._undo: deque[_Entry] = deque()
+        self._redo: deque[_Entry] = deque()
+        self._size = 0
+        # entries referencing every shared tuple of words (by identity)
+        self._words_refs: dict[int, int] = {}
+
+    def record(self, snapshot: GameSnapshot) -> None:
+        """
+        Remembers the game before a move that changed the board.
+
+        :param snapshot: Snapshot taken before the move
+        """
+        while self._redo:
+            self._release(self._redo.pop())
+        self._undo.append(self._store(snapshot))
+        self._shrink()
+
+    def undo(self, current: GameSnapshot) -> GameSnapshot | None:
+        """
+        Takes back the last recorded move.
+
+        :param current: Snapshot of the game now, kept for redo
+        :return: Snapshot to restore, None if there is nothing to undo
+        """
+        if not self._undo:
+            return None
+        # stored while the entry is still on its stack, to share its words
+        entry = self._undo[-1]
+        self._redo.append(self._store(current))
+        self._release(self._undo.pop())
+        self._shrink()
+        return self._load(entry)
+
+    def redo(self, current: GameSnapshot) -> GameSnapshot | None:
+        """
+        Plays the last undone move again.
+
+        :param current: Snapshot of the game now, kept for undo
+        :return: Snapshot to restore, None if there is nothing to redo
+        """
+        if not self._redo:
+            return None
+        # stored while the entry is still on its stack, to share its words
+        entry = self._redo[-1]
+        self._undo.append(self._store(current))
+        self._release(self._redo.pop())
+        self._shrink()
+        return self._load(entry)
+
+    def can_undo(self) -> bool:
+        """
+        Tells whether a recorded move can be taken back.
+
+        :return: True if the undo stack is not empty
+        """
+        return bool(self._undo)
+
+    def can_redo(self) -> bool:
+        """
+        Tells whether an undone move can be played again.
+
+        :return: True if the redo stack is not empty
+        """
+        return bool(self._redo)
+
+    def get_size(self) -> int:
+        """
+        Returns the estimated memory used by the entries.
+
+        :return: Size in bytes
+        """
+        return self._size
+
+    def clear(self) -> None:
+        """Forgets all entries."""
+        self._undo.clear()
+        self._redo.clear()
+        self._words_refs.clear()
+        self._size = 0
+
+    def _store(self, snapshot: GameSnapshot) -> _Entry:
+        """
+        Turns a snapshot into an entry, sharing the generator words with the
+        most recent entries when they are equal, and accounts for its size.
+
+        :param snapshot: Snapshot to keep
+        :return: Entry holding the snapshot
+        """
+        state = snapshot.rng_state
+        words: tuple[int, ...] | None = None
+        if self._is_mersenne_state(state):
+            version, internal_state, gauss = state
+            words = internal_state[:-1]
+            for stack in (self._undo, self._redo):
+                if stack and stack[-1].words == words:
+                    words = stack[-1].words
+                    break
+            snapshot = replace(snapshot, rng_state=(version, internal_state[-1], gauss))
+
+        size = sum(
+            map(sys.getsizeof, (snapshot, snapshot.cells, snapshot.score))
+        ) + self._get_size(snapshot.rng_state)
+        if words is not None:
+            refs = self._words_refs.get(id(words), 0)
+            if not refs:
+                self._size += self._get_size(words)
+            self._words_refs[id(words)] = refs + 1
+        self._size += size
+        return _Entry(snapshot=snapshot, words=words, size=size)
+
+    def _release(self, entry: _Entry) -> None:
+        """
+        Accounts for an entry leaving the history.
+
+        :param entry: Entry removed from a stack
+        """
+        self._size -= entry.size
+        if entry.words is not None:
+            refs = self._words_refs.pop(id(entry.words)) - 1
+            if refs:
+                self._words_refs[id(entry.words)] = refs
+            else:
+                self._size -= self._get_size(entry.words)
+
+    def _shrink(self) -> None:
+        """Drops the oldest entries until the history fits into max_bytes."""
+        while self._size > self._max_bytes and (self._undo or self._redo):
+            # the redo stack's first entry is the move farthest in the future
+            stack = self._undo if self._undo else self._redo
+            self._release(stack.popleft())
+
+    @staticmethod
+    def _load(entry: _Entry) -> GameSnapshot:
+        """
+        Rebuilds the snapshot an entry was stored from.
+
+        :param entry: Stored entry
+        :return: Snapshot with the complete generator state
+        """
+        if entry.words is None:
+            return entry.snapshot
+        version, index, gauss = entry.snapshot.rng_state
+        return replace(
+            entry.snapshot, rng_state=(version, entry.words + (index,), gauss)
+        )
+
+    @staticmethod
+    def _is_mersenne_state(state: Any) -> bool:
+        """
+        Recognizes a random.Random state: (version, words + (index,), gauss).
+
+        :param state: Generator state
+        :return: True for a Mersenne Twister state
+        """
+        return (
+            isinstance(state, tuple)
+            and len(state) == 3
+            and isinstance(state[1], tuple)
+            and len(state[1]) > 1
+        )
+
+    @classmethod
+    def _get_size(cls, value: Any) -> int:
+        """
+        Estimates the memory of a value made of tuples and numbers.
+
+        :param value: Value to measure
+        :return: Size in bytes, including the items of tuples
+        """
+        if isinstance(value, tuple):
+            return sys.getsizeof(value) + sum(map(cls._get_size, value))
+        return sys.getsizeof(value)
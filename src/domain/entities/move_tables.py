@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import sys
+from array import array
+
+from src.domain.entities.bit_board import BitBoard
+from src.domain.enums_.move_direction import MoveDirection
+from src.domain.interfaces.domain.move_tables_cache import IMoveTablesCache
+
+_Tables = tuple["array[int]", "array[int]", "array[int]", "array[int]"]
+
+
+class MoveTables:
+    """
+    Precomputed results of sliding every possible packed 4-cell row.
+
+    A row of a 4×4 BitBoard is 16 bits wide, so all 65536 rows can be
+    tabulated once: for each row the tables hold the row after moving it
+    towards column 0 (LEFT) or towards column 3 (RIGHT) and the score gained
+    by the merges. Vertical moves reuse the same tables on the transposed
+    board.
+
+    Tables are built lazily on first access and, when a cache is supplied,
+    loaded from / stored to it so that subsequent processes start instantly.
+    Pickling transfers only the cache, not the tables themselves, so handing
+    MoveTables to worker processes is cheap.
+    """
+
+    ROW_CELLS = 4
+    ROWS_QTY = 1 << (BitBoard.CELL_BITS * ROW_CELLS)
+
+    _CACHE_MAGIC = b"2048MT"
+    _CACHE_VERSION = 1
+
+    def __init__(self, cache: IMoveTablesCache | None = None) -> None:
+        """
+        :param cache: Optional persistent storage for the generated tables
+        """
+        self._cache = cache
+        self._tables: _Tables | None = None
+
+    def __getstate__(self) -> dict[str, object]:
+        return {"_cache": self._cache, "_tables": None}
+
+    @property
+    def left_rows(self) -> array[int]:
+        """Row after moving it towards column 0, indexed by the original row."""
+        return self._get_tables()[0]
+
+    @property
+    def right_rows(self) -> array[int]:
+        """Row after moving it towards column 3, indexed by the original row."""
+        return self._get_tables()[1]
+
+    @property
+    def left_scores(self) -> array[int]:
+        """Score gained by moving a row towards column 0."""
+        return self._get_tables()[2]
+
+    @property
+    def right_scores(self) -> array[int]:
+        """Score gained by moving a row towards column 3."""
+        return self._get_tables()[3]
+
+    def move(self, cells: int, direction: MoveDirection) -> tuple[int, int]:
+        """
+        Moves a whole packed 4×4 board: four table lookups, plus a transpose
+        before and after for vertical moves.
+
+        :param cells: Packed 4×4 board
+        :param direction: Direction of the move
+        :return: Packed board after the move and the score gained
+        :raises ValueError: if direction cannot be processed
+        """
+        # the hot path of hosted games: no helper calls, no tuple slicing
+        if direction is MoveDirection.LEFT or direction is MoveDirection.UP:
+            rows, _, scores, _ = self._tables or self._get_tables()
+        elif direction is MoveDirection.RIGHT or direction is MoveDirection.DOWN:
+            _, rows, _, scores = self._tables or self._get_tables()
+        else:
+            raise ValueError(f"Invalid move direction: {direction}")
+
+        vertical = direction is MoveDirection.UP or direction is MoveDirection.DOWN
+        if vertical:
+            cells = BitBoard.transpose(cells, self.ROW_CELLS)
+        row0 = cells & 0xFFFF
+        row1 = (cells >> 16) & 0xFFFF
+        row2 = (cells >> 32) & 0xFFFF
+        row3 = cells >> 48
+        moved = rows[row0] | rows[row1] << 16 | rows[row2] << 32 | rows[row3] << 48
+        score = scores[row0] + scores[row1] + scores[row2] + scores[row3]
+        if vertical:
+            moved = BitBoard.transpose(moved, self.ROW_CELLS)
+        return moved, score
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializes the tables (little-endian) with a small versioned header.
+
+        :return: Binary representation accepted by the cache.
+        """
+        chunks = [self._CACHE_MAGIC, bytes([self._CACHE_VERSION])]
+        for table in self._get_tables():
+            if sys.byteorder != "little":
+                table = array(table.typecode, table)
+                table.byteswap()
+            chunks.append(table.tobytes())
+        return b"".join(chunks)
+
+    def _get_tables(self) -> _Tables:
+        """
+        Returns the tables, loading them from the cache or generating (and
+        caching) them on first use.
+
+        :return: left rows, right rows, left scores, right scores
+        """
+        if self._tables is None:
+            if self._cache is not None:
+                data = self._cache.load()
+                if data is not None:
+                    self._tables = self._from_bytes(data)
+
+            if self._tables is None:
+                self._tables = self._build()
+                if self._cache is not None:
+                    self._cache.save(self.to_bytes())
+
+        return self._tables
+
+    def _from_bytes(self, data: bytes) -> _Tables | None:
+        """
+        Restores the tables from their binary representation.
+
+        :param data: Bytes produced by to_bytes
+        :return: Restored tables, None if the data is stale or corrupted
+        """
+        header = self._CACHE_MAGIC + bytes([self._CACHE_VERSION])
+        if not data.startswith(header):
+            return None
+
+        tables = [array("H"), array("H"), array("I"), array("I")]
+        offset = len(header)
+        for table in tables:
+            size = self.ROWS_QTY * table.itemsize
+            chunk = data[offset : offset + size]
+            if len(chunk) != size:
+                return None
+            table.frombytes(chunk)
+            if sys.byteorder != "little":
+                table.byteswap()
+            offset += size
+        if offset != len(data):
+            return None
+
+        return tables[0], tables[1], tables[2], tables[3]
+
+    def _build(self) -> _Tables:
+        """
+        Generates all four tables from scratch.
+
+        :return: left rows, right rows, left scores, right scores
+        """
+        left_rows = array("H", bytes(2 * self.ROWS_QTY))
+        right_rows = array("H", bytes(2 * self.ROWS_QTY))
+        left_scores = array("I", bytes(4 * self.ROWS_QTY))
+        right_scores = array("I", bytes(4 * self.ROWS_QTY))
+
+        for row in range(self.ROWS_QTY):
+            moved, score = self.move_row_left(row, self.ROW_CELLS)
+            left_rows[row] = moved
+            left_scores[row] = score
+
+            reversed_row = self.reverse_row(row, self.ROW_CELLS)
+            moved, score = self.move_row_left(reversed_row, self.ROW_CELLS)
+            right_rows[row] = self.reverse_row(moved, self.ROW_CELLS)
+            right_scores[row] = score
+
+        return left_rows, right_rows, left_scores, right_scores
+
+    @staticmethod
+    def move_row_left(row: int, cells_qty: int) -> tuple[int, int]:
+        """
+        Slides a single packed row towards column 0, merging matching pairs.
+
+        Tiles with the maximum exponent that fits into a nibble never merge,
+        so the result always stays within ``cells_qty`` nibbles.
+
+        Example transformation (values shown instead of exponents):
+        [2, 2, 4, 4]  =>  [4, 8, 0, 0]
+        [2, 2, 2, 0]  =>  [4, 2, 0, 0]
+
+        :param row: Packed row, column 0 in the lowest nibble
+        :param cells_qty: Number of cells in the row
+        :return: Packed row after the move and the score gained by merges
+        """
+        result = 0
+        score = 0
+        shift = 0
+        pending = 0
+        for _ in range(cells_qty):
+            exponent = row & BitBoard.CELL_MASK
+            row >>= BitBoard.CELL_BITS
+            if not exponent:
+                continue
+            if exponent == pending and exponent < BitBoard.CELL_MASK:
+                result |= (exponent + 1) << shift
+                shift += BitBoard.CELL_BITS
+                score += 1 << (exponent + 1)
+                pending = 0
+            else:
+                if pending:
+                    result |= pending << shift
+                    shift += BitBoard.CELL_BITS
+                pending = exponent
+        if pending:
+            result |= pending << shift
+        return result, score
+
+    @classmethod
+    def move_rows(cls, cells: int, dim: int, reverse: bool) -> tuple[int, int]:
+        """
+        Slides every row of a packed board of any dimension towards column 0
+        (or towards the last column when ``reverse`` is set), without tables.
+
+        :param cells: Packed board
+        :param dim: Board dimension
+        :param reverse: Move rows towards the last column instead of column 0
+        :return: Packed board after the move and the score gained
+        """
+        row_bits = BitBoard.CELL_BITS * dim
+        row_mask = (1 << row_bits) - 1
+        result = 0
+        total_score = 0
+        for shift in range(0, row_bits * dim, row_bits):
+            row = (cells >> shift) & row_mask
+            if reverse:
+                row = cls.reverse_row(row, dim)
+            row, score = cls.move_row_left(row, dim)
+            if reverse:
+                row = cls.reverse_row(row, dim)
+            result |= row << shift
+            total_score += score
+        return result, total_score
+
+    @staticmethod
+    def reverse_row(row: int, cells_qty: int) -> int:
+        """
+        Reverses the order of the cells in a packed row.
+
+        :param row: Packed row
+        :param cells_qty: Number of cells in the row
+        :return: Packed row with the last column moved to column 0
+        """
+        result = 0
+        for _ in range(cells_qty):
+            result = (result << BitBoard.CELL_BITS) | (row & BitBoard.CELL_MASK)
+            row >>= BitBoard.CELL_BITS
+        return result
@@ -1,47 +1,137 @@
 import random
+from collections.abc import Sequence
+from typing import TypeVar
 
 from src.domain.dataclasses_.tile import Tile
 from src.domain.dataclasses_.tile_position import TilePosition
 from src.domain.enums_.tile_value import TileValue
+from src.domain.interfaces.domain.random_generator import IRandomGenerator
+
+_CellT = TypeVar("_CellT")
 
 
 class TileSpawner:
     """Handles spawning new tiles on the game board with controlled probabilities."""
 
-    def __init__(self, tile2_spawn_chance: float | None = None) -> None:
+    def __init__(
+        self,
+        tile2_spawn_chance: float | None = None,
+        rng: IRandomGenerator | None = None,
+    ) -> None:
         """
         Initializes the tile spawner with a custom probability for TileValue.ONE.
 
         :param tile2_spawn_chance: Probability (0-1) of spawning TileValue.ONE
                instead of TileValue.TWO.
+        :param rng: Random generator owned by the game, an unseeded
+               random.Random is created if omitted.
         """
         self._tile2_spawn_chance = tile2_spawn_chance or 0.9
+        self._random: IRandomGenerator = rng if rng is not None else random.Random()
+
+    def get_random_generator(self) -> IRandomGenerator:
+        """
+        Returns the generator the spawner draws from, e.g. to save its state.
+
+        :return: Random generator of the game.
+        """
+        return self._random
 
     def spawn(
         self,
         board: list[list[Tile]],
         qty: int,
-        empty_cells: list[TilePosition],
-    ) -> None:
+        empty_cells: Sequence[TilePosition],
+    ) -> list[TilePosition]:
         """
         Spawns new tiles on random empty positions of the board.
 
         :param board: 2D list representing the game board to modify.
-        :param qty: Number of tiles to spawn (must be 1 or 2).
+        :param qty: Number of tiles to spawn (1 up to the number of empty cells).
         :param empty_cells: Available positions for new tiles.
-        :raises ValueError: If qty is not 1 or 2.
+        :return: Positions that received a new tile.
+        :raises ValueError: If qty is not in range 1 to len(empty_cells).
         """
-        if qty not in (1, 2):
-            raise ValueError("qty must be 1 or 2")
+        spawned: list[TilePosition] = []
+        for position, value in self.pick_spawns(qty, empty_cells):
+            board[position.row_idx][position.col_idx] = Tile(value=value)
+            spawned.append(position)
+        return spawned
 
-        unique_positions: set[TilePosition] = set()
-        while len(unique_positions) < qty:
-            position = random.choice(empty_cells)
-            unique_positions.add(position)
+    def pick_spawns(
+        self,
+        qty: int,
+        empty_cells: Sequence[_CellT],
+    ) -> list[tuple[_CellT, TileValue]]:
+        """
+        Chooses distinct empty cells and the values to spawn on them without
+        touching any board representation.
 
-        for position in unique_positions:
-            value = self._get_new_tile_value()
-            board[position.row_idx][position.col_idx] = Tile(value=value)
+        Cells may be of any type (TilePosition, flat index, ...). The sequence
+        is only indexed, never copied, so a board may pass its live index.
+
+        :param qty: Number of tiles to spawn (1 up to the number of empty cells).
+        :param empty_cells: Available cells for new tiles.
+        :return: (cell, value) pairs in the order they were picked.
+        :raises ValueError: If qty is not in range 1 to len(empty_cells).
+        """
+        return [
+            (empty_cells[idx], value)
+            for idx, value in self._pick(qty, len(empty_cells))
+        ]
+
+    def pick_spawns_in_mask(
+        self, qty: int, empty_mask: int
+    ) -> list[tuple[int, TileValue]]:
+        """
+        Chooses distinct empty cells of a packed board and the values to spawn
+        on them.
+
+        ``empty_mask`` has one set bit per empty cell; the picked cells are
+        returned as positions of those bits, so a packed board can place a tile
+        with a single shift. The n-th set bit (from the lowest) stands for the
+        n-th empty cell, hence a mask in row-major order draws exactly the same
+        cells and values as pick_spawns over the row-major list of cells.
+
+        :param qty: Number of tiles to spawn (1 up to the number of set bits).
+        :param empty_mask: Integer with a set bit for every empty cell.
+        :return: (bit position, value) pairs in the order they were picked.
+        :raises ValueError: If qty is not in range 1 to the number of set bits.
+        """
+        return [
+            (_get_set_bit_position(empty_mask, idx), value)
+            for idx, value in self._pick(qty, empty_mask.bit_count())
+        ]
+
+    def _pick(self, qty: int, cells_qty: int) -> list[tuple[int, TileValue]]:
+        """
+        Samples distinct cell indices in one pass and draws their values.
+
+        Partial Fisher–Yates shuffle over the virtual list [0, cells_qty):
+        the i-th pick swaps a random index from the unpicked tail into slot i.
+        Only swapped slots are stored, so no list of cells is built and there
+        are no retries however full the board is. The generator is used in a
+        fixed order: one randrange per picked cell, then one random per value.
+
+        :param qty: Number of cells to pick.
+        :param cells_qty: Number of available cells.
+        :return: (cell index, value) pairs in the order they were picked.
+        :raises ValueError: If qty is not in range 1 to cells_qty.
+        """
+        if not 1 <= qty <= cells_qty:
+            raise ValueError(f"qty must be in range 1 to {cells_qty}, got {qty}")
+        if qty == 1:
+            # one spawn per move is the common case, drawn as the loop would
+            return [(self._random.randrange(cells_qty), self._get_new_tile_value())]
+
+        swapped: dict[int, int] = {}
+        picked: list[int] = []
+        for slot in range(qty):
+            idx = slot + self._random.randrange(cells_qty - slot)
+            picked.append(swapped.get(idx, idx))
+            swapped[idx] = swapped.get(slot, slot)
+
+        return [(idx, self._get_new_tile_value()) for idx in picked]
 
     def _get_new_tile_value(self) -> TileValue:
         """
@@ -51,6 +141,19 @@ class TileSpawner:
         """
         return (
             TileValue.ONE
-            if random.random() < self._tile2_spawn_chance
+            if self._random.random() < self._tile2_spawn_chance
             else TileValue.TWO
         )
+
+
+def _get_set_bit_position(mask: int, idx: int) -> int:
+    """
+    Finds the idx-th lowest set bit of a mask.
+
+    :param mask: Integer with more than idx set bits.
+    :param idx: Zero-based rank of the bit.
+    :return: Position of the bit.
+    """
+    for _ in range(idx):
+        mask &= mask - 1
+    return (mask & -mask).bit_length() - 1
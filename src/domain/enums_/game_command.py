@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class GameCommand(Enum):
+    """
+    Player requests other than moves, handled by the game loop.
+
+    UNDO takes back the last move, REDO plays an undone move again (with the
+    same spawned tile).
+    """
+
+    UNDO = "undo"
+    REDO = "redo"
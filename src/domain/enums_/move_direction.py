@@ -12,3 +12,16 @@ class MoveDirection(Enum):
     DOWN = "down"
     LEFT = "left"
     RIGHT = "right"
+
+    @property
+    def bit(self) -> int:
+        """
+        Bit of the direction in legal-move masks: 1 for UP, 2 for DOWN,
+        4 for LEFT and 8 for RIGHT (declaration order).
+
+        :return: Single-bit mask of the direction
+        """
+        return _BITS[self]
+
+
+_BITS = {direction: 1 << idx for idx, direction in enumerate(MoveDirection)}
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class RandomGeneratorKind(Enum):
+    """
+    Random generators a game can be seeded with.
+
+    MERSENNE is Python's random.Random, COUNTER is the counter-based
+    CounterRandom which is faster to create and whose state is two integers.
+    """
+
+    MERSENNE = 0
+    COUNTER = 1
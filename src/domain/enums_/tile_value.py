@@ -12,8 +12,12 @@ class TileValue(IntEnum):
     - TWO = 2² (4)
     - ...
     - ELEVEN = 2¹¹ (2048)
+    - ...
+    - FIFTEEN = 2¹⁵ (32768)
 
-    The ZERO value represents an empty tile space on the board.
+    The ZERO value represents an empty tile space on the board. Values past
+    ELEVEN are reachable when a game continues after the win; FIFTEEN is the
+    largest exponent a packed 4-bit cell can hold, so it never merges.
     """
 
     ZERO = 0
@@ -28,21 +32,55 @@ class TileValue(IntEnum):
     NINE = 512
     TEN = 1024
     ELEVEN = 2048
+    TWELVE = 4096
+    THIRTEEN = 8192
+    FOURTEEN = 16384
+    FIFTEEN = 32768
 
     def next(self) -> TileValue:
         """
         Returns the next value in the progression sequence (current × 2).
 
         :return: Next TileValue in the sequence
-        :raises StopIteration: When called on ELEVEN (maximum value)
+        :raises StopIteration: When called on FIFTEEN (maximum value)
         :example:
             >>> TileValue.ONE.next()
             <TileValue.TWO: 4>
         """
-        members = list(self.__class__)
-        index = members.index(self) + 1
-
-        if index >= len(members):
+        following = _NEXT_BY_VALUE[self]
+        if following is None:
             raise StopIteration("No more values")
+        return following
+
+    @property
+    def exponent(self) -> int:
+        """
+        Power of two of the value, 0 for an empty tile.
+
+        :example:
+            >>> TileValue.THREE.exponent
+            3
+        """
+        return _EXPONENTS_BY_VALUE[self]
+
+    @classmethod
+    def from_exponent(cls, exponent: int) -> TileValue:
+        """
+        Returns the value with the given power of two.
+
+        :param exponent: Power of two (0 for an empty tile)
+        :return: Corresponding TileValue
+        :raises IndexError: If the exponent is out of range
+        """
+        return _VALUES_BY_EXPONENT[exponent]
+
 
-        return members[index]
+# members are declared in exponent order: ZERO, 2¹, 2², ...
+_VALUES_BY_EXPONENT: tuple[TileValue, ...] = tuple(TileValue)
+_EXPONENTS_BY_VALUE: dict[TileValue, int] = {
+    value: exponent for exponent, value in enumerate(_VALUES_BY_EXPONENT)
+}
+_NEXT_BY_VALUE: dict[TileValue, TileValue | None] = {
+    value: following
+    for value, following in zip(_VALUES_BY_EXPONENT, _VALUES_BY_EXPONENT[1:] + (None,))
+}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
 from typing import Protocol
 
 from src.domain.dataclasses_.dimension import Dimension
@@ -21,11 +22,25 @@ class IBoard(Protocol):
         :return: 2D list of Tile objects representing the board's state.
         """
 
-    def get_empty_tiles_positions(self) -> list[TilePosition]:
+    def get_empty_tiles_positions(self) -> Sequence[TilePosition]:
         """
         Finds all empty (TileValue.ZERO) positions on the board.
 
-        :return: List of TilePosition objects marking empty cells.
+        :return: Read-only sequence of TilePosition objects marking empty cells.
+        """
+
+    def get_empty_cells_count(self) -> int:
+        """
+        Counts empty (TileValue.ZERO) positions on the board.
+
+        :return: Number of empty cells.
+        """
+
+    def update_cells(self, positions: Iterable[TilePosition]) -> None:
+        """
+        Notifies the board that tiles at the given positions were replaced.
+
+        :param positions: Positions whose tiles may have changed.
         """
 
     @classmethod
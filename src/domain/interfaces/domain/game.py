@@ -1,6 +1,7 @@
 from typing import Protocol
 
 from src.domain.dataclasses_.game_result import GameState
+from src.domain.dataclasses_.game_snapshot import GameSnapshot
 from src.domain.enums_.move_direction import MoveDirection
 
 
@@ -26,3 +27,18 @@ class IGame(Protocol):
         :return: Updated game state after move processing
         :raises: ValueError if move cannot be processed
         """
+
+    def get_snapshot(self) -> GameSnapshot:
+        """
+        Captures the current game so it can be suspended.
+
+        :return: Packed board, score, result and generator state
+        """
+
+    def restore_snapshot(self, snapshot: GameSnapshot) -> None:
+        """
+        Continues the game from a snapshot.
+
+        :param snapshot: Snapshot taken from a game of the same dimension
+        :raises ValueError: If the snapshot does not fit the board
+        """
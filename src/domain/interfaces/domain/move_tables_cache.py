@@ -0,0 +1,24 @@
+from typing import Protocol
+
+
+class IMoveTablesCache(Protocol):
+    """
+    Defines persistent storage for precomputed move tables.
+
+    Implementations decide where the bytes live (file, memory, ...); the
+    tables themselves are responsible for validating what they load.
+    """
+
+    def load(self) -> bytes | None:
+        """
+        Reads previously stored tables.
+
+        :return: Stored bytes or None if nothing is cached yet
+        """
+
+    def save(self, data: bytes) -> None:
+        """
+        Stores generated tables for future runs.
+
+        :param data: Serialized tables
+        """
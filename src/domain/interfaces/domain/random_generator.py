@@ -0,0 +1,59 @@
+from collections.abc import Sequence
+from typing import Any, Protocol, TypeVar
+
+_ItemT = TypeVar("_ItemT")
+
+
+class IRandomGenerator(Protocol):
+    """
+    Defines the source of randomness of a single game.
+
+    random.Random satisfies this protocol; every game owns its own instance,
+    so games can be reproduced from their seed and parallel games never share
+    hidden state.
+    """
+
+    def seed(self, seed: int, /) -> None:
+        """
+        Restarts the generator from a seed.
+
+        :param seed: Seed value
+        """
+
+    def random(self) -> float:
+        """
+        Draws a float uniformly from [0, 1).
+
+        :return: Random float
+        """
+
+    def randrange(self, stop: int, /) -> int:
+        """
+        Draws an integer uniformly from [0, stop).
+
+        :param stop: Exclusive upper bound (positive)
+        :return: Random integer
+        """
+
+    def choice(self, seq: Sequence[_ItemT]) -> _ItemT:
+        """
+        Picks a uniformly random element of a non-empty sequence.
+
+        :param seq: Sequence to pick from
+        :return: Chosen element
+        :raises IndexError: If the sequence is empty
+        """
+
+    def getstate(self) -> Any:
+        """
+        Captures the internal state of the generator.
+
+        :return: Opaque state accepted by setstate
+        """
+
+    def setstate(self, state: Any) -> None:
+        """
+        Restores a state captured by getstate.
+
+        :param state: State returned by getstate
+        """
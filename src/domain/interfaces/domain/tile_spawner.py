@@ -1,7 +1,12 @@
-from typing import Protocol
+from collections.abc import Sequence
+from typing import Protocol, TypeVar
 
 from src.domain.dataclasses_.tile import Tile
 from src.domain.dataclasses_.tile_position import TilePosition
+from src.domain.enums_.tile_value import TileValue
+from src.domain.interfaces.domain.random_generator import IRandomGenerator
+
+_CellT = TypeVar("_CellT")
 
 
 class ITileSpawner(Protocol):
@@ -15,13 +20,47 @@ class ITileSpawner(Protocol):
         self,
         board: list[list[Tile]],
         qty: int,
-        empty_cells: list[TilePosition],
-    ) -> None:
+        empty_cells: Sequence[TilePosition],
+    ) -> list[TilePosition]:
         """
         Spawns new tiles on specified empty positions of the game board.
 
         :param board: 2D list representing the current game board state to be modified
-        :param qty: Number of tiles to spawn (typically 1 or 2)
+        :param qty: Number of tiles to spawn (1 up to the number of empty cells)
         :param empty_cells: List of available positions where new tiles can be placed
+        :return: Positions that received a new tile
+        :raises ValueError: If invalid quantity of tiles is requested
+        """
+
+    def get_random_generator(self) -> IRandomGenerator:
+        """
+        Returns the random generator new tiles are drawn from.
+
+        :return: Random generator of the game
+        """
+
+    def pick_spawns(
+        self,
+        qty: int,
+        empty_cells: Sequence[_CellT],
+    ) -> list[tuple[_CellT, TileValue]]:
+        """
+        Chooses cells and values for new tiles without modifying any board.
+
+        :param qty: Number of tiles to spawn (1 up to the number of empty cells)
+        :param empty_cells: Available cells in any board-specific representation
+        :return: (cell, value) pairs in the order they were picked
+        :raises ValueError: If invalid quantity of tiles is requested
+        """
+
+    def pick_spawns_in_mask(
+        self, qty: int, empty_mask: int
+    ) -> list[tuple[int, TileValue]]:
+        """
+        Chooses cells and values for new tiles of a packed board.
+
+        :param qty: Number of tiles to spawn (1 up to the number of set bits)
+        :param empty_mask: Integer with a set bit for every empty cell
+        :return: (bit position, value) pairs in the order they were picked
         :raises ValueError: If invalid quantity of tiles is requested
         """
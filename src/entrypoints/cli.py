@@ -1,11 +1,14 @@
+from src.entrypoints.di.cli.container import GameEngine
 from src.entrypoints.di.cli.facade import Dependencies, dependencies_facade
 
 
-def start_cli_app() -> None:
+def start_cli_app(engine: GameEngine = GameEngine.CLASSIC) -> None:
     """
     Initializes and starts the 2048 CLI application.
     Creates all necessary dependencies and executes the main game loop.
+
+    :param engine: Game logic implementation to use
     """
-    deps: Dependencies = dependencies_facade()
+    deps: Dependencies = dependencies_facade(engine=engine)
 
     return deps.game_loop.execute()
@@ -1,17 +1,46 @@
+import os
+import random
+from enum import Enum
+from pathlib import Path
+
 from src.application.ports.presenter import IPresenter
 from src.application.ports.view import IView
 from src.application.use_cases.game_use_case import GameLoopUseCase
 from src.domain.dataclasses_.dimension import Dimension
+from src.domain.entities.array_board import ArrayBoard
+from src.domain.entities.array_board_game import ArrayBoardGame
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.bit_board_game import BitBoardGame
 from src.domain.entities.board import Board
+from src.domain.entities.counter_random import CounterRandom
 from src.domain.entities.game import Game
+from src.domain.entities.game_history import GameHistory
+from src.domain.entities.move_tables import MoveTables
 from src.domain.entities.tile_spawner import TileSpawner
+from src.domain.enums_.random_generator_kind import RandomGeneratorKind
 from src.domain.interfaces.domain.board import IBoard
 from src.domain.interfaces.domain.game import IGame
+from src.domain.interfaces.domain.random_generator import IRandomGenerator
 from src.domain.interfaces.domain.tile_spawner import ITileSpawner
+from src.infrastructure.move_tables_cache import FileMoveTablesCache
 from src.presentation.cli.presenter import CliPresenter
 from src.presentation.cli.unix_view import UnixCliView
 
 
+class GameEngine(Enum):
+    """
+    Available implementations of the game logic.
+
+    CLASSIC keeps the board as a 2D list of Tile objects, BITBOARD packs it
+    into a single integer (4 bits per cell) and ARRAY keeps it as a flat
+    byte array whose moves scale linearly, for large boards.
+    """
+
+    CLASSIC = "classic"
+    BITBOARD = "bitboard"
+    ARRAY = "array"
+
+
 def create_dimension_dependency() -> Dimension:
     return Dimension(rows=4, cols=4)
 
@@ -20,16 +49,68 @@ def create_board_dependency(dimension: Dimension) -> IBoard:
     return Board.create(dimension=dimension)
 
 
+def create_bit_board_dependency(dimension: Dimension) -> BitBoard:
+    return BitBoard.create(dimension=dimension)
+
+
+def create_array_board_dependency(dimension: Dimension) -> ArrayBoard:
+    return ArrayBoard.create(dimension=dimension)
+
+
+def create_random_generator_dependency(
+    kind: RandomGeneratorKind = RandomGeneratorKind.MERSENNE,
+    seed: int | None = None,
+) -> IRandomGenerator:
+    if kind is RandomGeneratorKind.COUNTER:
+        return CounterRandom(seed=seed if seed is not None else random.getrandbits(64))
+    return random.Random(seed)
+
+
 def create_tile_spawner_dependency(
     tile2_spawn_chance: int | None = None,
+    rng: IRandomGenerator | None = None,
 ) -> ITileSpawner:
-    return TileSpawner(tile2_spawn_chance=tile2_spawn_chance)
+    return TileSpawner(tile2_spawn_chance=tile2_spawn_chance, rng=rng)
+
+
+def create_move_tables_dependency(cache_path: Path | None = None) -> MoveTables:
+    if cache_path is None:
+        cache_dir = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        cache_path = Path(cache_dir) / "2048-clean-architecture" / "move_tables.bin"
+    return MoveTables(cache=FileMoveTablesCache(path=cache_path))
 
 
-def create_game_dependency(board: IBoard, tile_spawner: ITileSpawner) -> IGame:
+def create_game_dependency(
+    board: IBoard,
+    tile_spawner: ITileSpawner,
+    move_tables: MoveTables | None = None,
+) -> IGame:
     return Game(
         board=board,
         tile_spawner=tile_spawner,
+        move_tables=move_tables,
+    )
+
+
+def create_bit_board_game_dependency(
+    board: BitBoard,
+    tile_spawner: ITileSpawner,
+    move_tables: MoveTables | None = None,
+) -> IGame:
+    return BitBoardGame(
+        board=board,
+        tile_spawner=tile_spawner,
+        move_tables=move_tables,
+    )
+
+
+def create_array_board_game_dependency(
+    board: ArrayBoard,
+    tile_spawner: ITileSpawner,
+) -> IGame:
+    return ArrayBoardGame(
+        board=board,
+        tile_spawner=tile_spawner,
     )
 
 
@@ -41,13 +122,21 @@ def create_view_dependency() -> IView:
     return UnixCliView()
 
 
+def create_game_history_dependency(
+    max_bytes: int = GameHistory.DEFAULT_MAX_BYTES,
+) -> GameHistory:
+    return GameHistory(max_bytes=max_bytes)
+
+
 def create_game_loop_dependency(
     game: IGame,
     presenter: IPresenter,
     view: IView,
+    history: GameHistory | None = None,
 ) -> GameLoopUseCase:
     return GameLoopUseCase(
         game=game,
         presenter=presenter,
         view=view,
+        history=history,
     )
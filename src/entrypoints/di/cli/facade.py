@@ -1,12 +1,22 @@
 from dataclasses import dataclass
 
 from src.application.use_cases.game_use_case import GameLoopUseCase
+from src.domain.entities.game_history import GameHistory
+from src.domain.interfaces.domain.game import IGame
 from src.entrypoints.di.cli.container import (
+    GameEngine,
+    create_array_board_dependency,
+    create_array_board_game_dependency,
+    create_bit_board_dependency,
+    create_bit_board_game_dependency,
     create_board_dependency,
     create_dimension_dependency,
     create_game_dependency,
+    create_game_history_dependency,
     create_game_loop_dependency,
+    create_move_tables_dependency,
     create_presenter_dependency,
+    create_random_generator_dependency,
     create_tile_spawner_dependency,
     create_view_dependency,
 )
@@ -23,25 +33,52 @@ class Dependencies:
     game_loop: GameLoopUseCase
 
 
-def dependencies_facade() -> Dependencies:
+def dependencies_facade(
+    engine: GameEngine = GameEngine.CLASSIC,
+    history_max_bytes: int = GameHistory.DEFAULT_MAX_BYTES,
+) -> Dependencies:
     """
     Creates and wires all application dependencies for CLI version of 2048.
     Builds the dependency graph in proper initialization order.
 
+    :param engine: Game logic implementation to wire
+    :param history_max_bytes: Memory the undo/redo history may use, 0 to
+           disable undo
     :return: Fully initialized Dependencies container ready for game execution
     """
     dimension = create_dimension_dependency()
 
-    board = create_board_dependency(dimension=dimension)
+    rng = create_random_generator_dependency()
 
-    tile_spawner = create_tile_spawner_dependency()
+    tile_spawner = create_tile_spawner_dependency(rng=rng)
 
-    game = create_game_dependency(board=board, tile_spawner=tile_spawner)
+    move_tables = create_move_tables_dependency()
+
+    game: IGame
+    if engine is GameEngine.BITBOARD:
+        bit_board = create_bit_board_dependency(dimension=dimension)
+        game = create_bit_board_game_dependency(
+            board=bit_board, tile_spawner=tile_spawner, move_tables=move_tables
+        )
+    elif engine is GameEngine.ARRAY:
+        array_board = create_array_board_dependency(dimension=dimension)
+        game = create_array_board_game_dependency(
+            board=array_board, tile_spawner=tile_spawner
+        )
+    else:
+        board = create_board_dependency(dimension=dimension)
+        game = create_game_dependency(
+            board=board, tile_spawner=tile_spawner, move_tables=move_tables
+        )
 
     presenter = create_presenter_dependency()
 
     view = create_view_dependency()
 
-    game_loop = create_game_loop_dependency(game=game, presenter=presenter, view=view)
+    history = create_game_history_dependency(max_bytes=history_max_bytes)
+
+    game_loop = create_game_loop_dependency(
+        game=game, presenter=presenter, view=view, history=history
+    )
 
     return Dependencies(game_loop=game_loop)
@@ -0,0 +1,34 @@
+from src.application.ports.async_view import IAsyncView
+from src.application.ports.presenter import IPresenter
+from src.application.use_cases.async_game_use_case import AsyncGameLoopUseCase
+from src.application.use_cases.game_sessions_use_case import GameSessionsUseCase
+from src.domain.entities.bit_board_game import BitBoardGame
+from src.domain.interfaces.domain.game import IGame
+from src.domain.interfaces.domain.random_generator import IRandomGenerator
+from src.presentation.remote.latency import LatencyStats
+
+
+def create_game_sessions_dependency(
+    game: BitBoardGame,
+    rng: IRandomGenerator,
+    max_sessions: int,
+    idle_ttl: float | None,
+) -> GameSessionsUseCase:
+    return GameSessionsUseCase(
+        game=game,
+        rng=rng,
+        max_sessions=max_sessions,
+        idle_ttl=idle_ttl,
+    )
+
+
+def create_latency_stats_dependency() -> LatencyStats:
+    return LatencyStats()
+
+
+def create_stream_game_loop_dependency(
+    game: IGame,
+    presenter: IPresenter,
+    view: IAsyncView,
+) -> AsyncGameLoopUseCase:
+    return AsyncGameLoopUseCase(game=game, presenter=presenter, view=view)
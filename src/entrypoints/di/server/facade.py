@@ -0,0 +1,95 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from src.application.ports.async_view import IAsyncView
+from src.application.use_cases.async_game_use_case import AsyncGameLoopUseCase
+from src.application.use_cases.game_sessions_use_case import GameSessionsUseCase
+from src.domain.entities.bit_board_game import BitBoardGame
+from src.domain.enums_.random_generator_kind import RandomGeneratorKind
+from src.entrypoints.di.cli.container import (
+    create_bit_board_dependency,
+    create_dimension_dependency,
+    create_move_tables_dependency,
+    create_presenter_dependency,
+    create_random_generator_dependency,
+    create_tile_spawner_dependency,
+)
+from src.entrypoints.di.server.container import (
+    create_game_sessions_dependency,
+    create_latency_stats_dependency,
+    create_stream_game_loop_dependency,
+)
+from src.presentation.remote.latency import LatencyStats
+
+
+@dataclass
+class ServerDependencies:
+    """
+    Container for the dependencies of the multi-session game server.
+
+    :param sessions: Session table played on one shared packed engine
+    :param latency: Move latency statistics
+    :param dim: Board dimension of the hosted games
+    :param new_stream_game: Creates the game loop of a client that plays one
+           game per connection
+    """
+
+    sessions: GameSessionsUseCase
+    latency: LatencyStats
+    dim: int
+    new_stream_game: Callable[[IAsyncView], AsyncGameLoopUseCase]
+
+
+def server_dependencies_facade(
+    max_sessions: int,
+    idle_ttl: float | None,
+) -> ServerDependencies:
+    """
+    Creates and wires the dependencies of the game server.
+
+    Sessions use the counter-based generator, whose state is two integers,
+    so a stored session stays a handful of integers. A stream client gets
+    its own packed game, sharing only the move tables.
+
+    :param max_sessions: Largest number of sessions kept
+    :param idle_ttl: Seconds after which an unused session is evicted
+    :return: Fully initialized ServerDependencies container
+    """
+    dimension = create_dimension_dependency()
+
+    rng = create_random_generator_dependency(kind=RandomGeneratorKind.COUNTER)
+
+    tile_spawner = create_tile_spawner_dependency(rng=rng)
+
+    move_tables = create_move_tables_dependency()
+
+    game = BitBoardGame(
+        board=create_bit_board_dependency(dimension=dimension),
+        tile_spawner=tile_spawner,
+        move_tables=move_tables,
+    )
+
+    sessions = create_game_sessions_dependency(
+        game=game, rng=rng, max_sessions=max_sessions, idle_ttl=idle_ttl
+    )
+
+    presenter = create_presenter_dependency()
+
+    def new_stream_game(view: IAsyncView) -> AsyncGameLoopUseCase:
+        stream_game = BitBoardGame(
+            board=create_bit_board_dependency(dimension=dimension),
+            tile_spawner=create_tile_spawner_dependency(
+                rng=create_random_generator_dependency()
+            ),
+            move_tables=move_tables,
+        )
+        return create_stream_game_loop_dependency(
+            game=stream_game, presenter=presenter, view=view
+        )
+
+    return ServerDependencies(
+        sessions=sessions,
+        latency=create_latency_stats_dependency(),
+        dim=dimension.rows,
+        new_stream_game=new_stream_game,
+    )
@@ -0,0 +1,55 @@
+from enum import Enum
+
+from src.application.ports.move_policy import IMovePolicy
+from src.application.use_cases.self_play_use_case import SelfPlayUseCase
+from src.domain.entities.move_tables import MoveTables
+from src.domain.interfaces.domain.game import IGame
+from src.presentation.ai.expectimax_policy import ExpectimaxMovePolicy
+from src.presentation.ai.monte_carlo_policy import MonteCarloMovePolicy
+from src.presentation.ai.position_recording_policy import PositionRecordingPolicy
+from src.presentation.ai.random_policy import RandomMovePolicy
+from src.presentation.ai.recording_policy import RecordingMovePolicy
+
+
+class MovePolicyName(Enum):
+    """Move policies available for headless games."""
+
+    RANDOM = "random"
+    EXPECTIMAX = "expectimax"
+    MONTE_CARLO = "monte-carlo"
+
+
+def create_move_policy_dependency(
+    policy: MovePolicyName,
+    move_tables: MoveTables,
+    seed: int | None = None,
+) -> IMovePolicy:
+    if policy is MovePolicyName.RANDOM:
+        return RandomMovePolicy(seed=seed)
+    if policy is MovePolicyName.EXPECTIMAX:
+        return ExpectimaxMovePolicy(move_tables=move_tables)
+    if policy is MovePolicyName.MONTE_CARLO:
+        return MonteCarloMovePolicy(move_tables=move_tables, seed=seed)
+    raise ValueError(f"Unknown move policy: {policy}")
+
+
+def create_recording_policy_dependency(policy: IMovePolicy) -> RecordingMovePolicy:
+    return RecordingMovePolicy(policy=policy)
+
+
+def create_position_recording_policy_dependency(
+    policy: IMovePolicy,
+) -> PositionRecordingPolicy:
+    return PositionRecordingPolicy(policy=policy)
+
+
+def create_self_play_dependency(
+    game: IGame,
+    policy: IMovePolicy,
+    max_moves: int | None = None,
+) -> SelfPlayUseCase:
+    return SelfPlayUseCase(
+        game=game,
+        policy=policy,
+        max_moves=max_moves,
+    )
@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+
+from src.application.use_cases.self_play_use_case import SelfPlayUseCase
+from src.domain.entities.move_tables import MoveTables
+from src.domain.enums_.random_generator_kind import RandomGeneratorKind
+from src.domain.interfaces.domain.game import IGame
+from src.entrypoints.di.cli.container import (
+    GameEngine,
+    create_array_board_dependency,
+    create_array_board_game_dependency,
+    create_bit_board_dependency,
+    create_bit_board_game_dependency,
+    create_board_dependency,
+    create_dimension_dependency,
+    create_game_dependency,
+    create_random_generator_dependency,
+    create_tile_spawner_dependency,
+)
+from src.entrypoints.di.simulation.container import (
+    MovePolicyName,
+    create_move_policy_dependency,
+    create_position_recording_policy_dependency,
+    create_recording_policy_dependency,
+    create_self_play_dependency,
+)
+from src.presentation.ai.position_recording_policy import PositionRecordingPolicy
+from src.presentation.ai.recording_policy import RecordingMovePolicy
+
+
+@dataclass
+class SimulationDependencies:
+    """
+    Container for all dependencies required to play one headless game.
+
+    :param self_play: Use case playing a single game with a move policy
+    :param recorder: Policy wrapper holding the played moves, None unless
+           recording was requested
+    :param position_recorder: Policy wrapper holding the played positions,
+           None unless position recording was requested
+    """
+
+    self_play: SelfPlayUseCase
+    recorder: RecordingMovePolicy | None = None
+    position_recorder: PositionRecordingPolicy | None = None
+
+
+def simulation_dependencies_facade(
+    engine: GameEngine,
+    policy: MovePolicyName,
+    move_tables: MoveTables,
+    policy_seed: int | None = None,
+    max_moves: int | None = None,
+    seed: int | None = None,
+    rng_kind: RandomGeneratorKind = RandomGeneratorKind.MERSENNE,
+    record: bool = False,
+    record_positions: bool = False,
+) -> SimulationDependencies:
+    """
+    Creates and wires the dependencies of a single headless game.
+
+    :param engine: Game logic implementation to wire
+    :param policy: Move policy playing the game
+    :param move_tables: Shared precomputed row moves
+    :param policy_seed: Seed of the move policy
+    :param max_moves: Move limit of the game, None for no limit
+    :param seed: Seed of the tile spawner generator, random if None
+    :param rng_kind: Generator used by the tile spawner
+    :param record: Wrap the policy to record the played moves
+    :param record_positions: Wrap the policy to record the played positions
+    :return: Fully initialized SimulationDependencies container
+    """
+    dimension = create_dimension_dependency()
+
+    rng = create_random_generator_dependency(kind=rng_kind, seed=seed)
+
+    tile_spawner = create_tile_spawner_dependency(rng=rng)
+
+    game: IGame
+    if engine is GameEngine.BITBOARD:
+        bit_board = create_bit_board_dependency(dimension=dimension)
+        game = create_bit_board_game_dependency(
+            board=bit_board, tile_spawner=tile_spawner, move_tables=move_tables
+        )
+    elif engine is GameEngine.ARRAY:
+        array_board = create_array_board_dependency(dimension=dimension)
+        game = create_array_board_game_dependency(
+            board=array_board, tile_spawner=tile_spawner
+        )
+    else:
+        board = create_board_dependency(dimension=dimension)
+        game = create_game_dependency(
+            board=board, tile_spawner=tile_spawner, move_tables=move_tables
+        )
+
+    move_policy = create_move_policy_dependency(
+        policy=policy, move_tables=move_tables, seed=policy_seed
+    )
+
+    recorder = None
+    if record:
+        recorder = create_recording_policy_dependency(policy=move_policy)
+        move_policy = recorder
+
+    position_recorder = None
+    if record_positions:
+        position_recorder = create_position_recording_policy_dependency(
+            policy=move_policy
+        )
+        move_policy = position_recorder
+
+    self_play = create_self_play_dependency(
+        game=game, policy=move_policy, max_moves=max_moves
+    )
+
+    return SimulationDependencies(
+        self_play=self_play, recorder=recorder, position_recorder=position_recorder
+    )
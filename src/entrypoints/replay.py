@@ -0,0 +1,167 @@
+import argparse
+import functools
+import json
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.domain.dataclasses_.dimension import Dimension
+from src.domain.dataclasses_.game_replay import GameReplay
+from src.domain.dataclasses_.game_summary import GameSummary
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.bit_board_game import BitBoardGame
+from src.domain.entities.move_tables import MoveTables
+from src.entrypoints.di.cli.container import (
+    create_move_tables_dependency,
+    create_random_generator_dependency,
+    create_tile_spawner_dependency,
+)
+from src.infrastructure.replay_log import FileReplayLog
+
+
+@dataclass(frozen=True)
+class ReplayChunk:
+    """A batch of replays checked by one worker task."""
+
+    first_replay: int
+    replays: tuple[GameReplay, ...]
+
+
+@functools.cache
+def _get_move_tables() -> MoveTables:
+    """Loads move tables once per worker process."""
+    return create_move_tables_dependency()
+
+
+def replay_game(replay: GameReplay, move_tables: MoveTables) -> GameSummary:
+    """
+    Re-simulates a recorded game on the packed engine.
+
+    :param replay: Recorded game
+    :param move_tables: Precomputed row moves
+    :return: Summary of the re-simulated game
+    """
+    rng = create_random_generator_dependency(kind=replay.rng_kind, seed=replay.seed)
+    game = BitBoardGame(
+        board=BitBoard.create(Dimension(rows=replay.dimension, cols=replay.dimension)),
+        tile_spawner=create_tile_spawner_dependency(rng=rng),
+        move_tables=move_tables,
+    )
+    game.start()
+    return game.apply_moves(replay.moves)
+
+
+def check_chunk(chunk: ReplayChunk) -> list[int]:
+    """
+    Replays all games of a chunk in the current process.
+
+    :param chunk: Replays to check
+    :return: Indices of the replays whose outcome differs from the recording
+    """
+    move_tables = _get_move_tables()
+    mismatches: list[int] = []
+    for offset, replay in enumerate(chunk.replays):
+        summary = replay_game(replay, move_tables)
+        if summary.score != replay.score or summary.max_tile != replay.max_tile:
+            mismatches.append(chunk.first_replay + offset)
+    return mismatches
+
+
+def run_replays(
+    replays: list[GameReplay],
+    workers: int,
+    chunk_size: int | None = None,
+) -> list[int]:
+    """
+    Re-simulates recorded games and compares them with their recordings,
+    spreading them over a process pool.
+
+    :param replays: Recorded games
+    :param workers: Number of worker processes (1 replays in the current process)
+    :param chunk_size: Replays per worker task, chosen automatically if None
+    :return: Sorted indices of the replays whose outcome differs
+    """
+    if chunk_size is None:
+        chunk_size = max(1, min(5000, len(replays) // (workers * 8) or 1))
+
+    chunks = list(_split_into_chunks(replays, chunk_size))
+    mismatches: list[int] = []
+
+    if workers == 1:
+        for chunk in chunks:
+            mismatches.extend(check_chunk(chunk))
+        return mismatches
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_mismatches in executor.map(check_chunk, chunks):
+            mismatches.extend(chunk_mismatches)
+    return mismatches
+
+
+def _split_into_chunks(
+    replays: list[GameReplay], chunk_size: int
+) -> Iterator[ReplayChunk]:
+    for first_replay in range(0, len(replays), chunk_size):
+        yield ReplayChunk(
+            first_replay=first_replay,
+            replays=tuple(replays[first_replay : first_replay + chunk_size]),
+        )
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.replay",
+        description="Re-simulates a replay log and reports diverging games.",
+    )
+    parser.add_argument("log", type=Path, help="replay log written by --record")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="worker processes (default: all cores)",
+    )
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="print JSON only")
+    return parser.parse_args(argv)
+
+
+def start_replay(argv: list[str] | None = None) -> None:
+    """
+    Parses command line arguments, replays the log and prints the result.
+    Exits with status 1 if any game diverges from its recording.
+
+    :param argv: Command line arguments, sys.argv is used if None
+    """
+    args = _parse_args(argv)
+    if args.workers < 1:
+        raise SystemExit("--workers must be positive")
+
+    try:
+        replays = FileReplayLog(path=args.log).load()
+    except (OSError, ValueError) as error:
+        raise SystemExit(f"Cannot read {args.log}: {error}")
+
+    started = time.perf_counter()
+    mismatches = run_replays(replays, args.workers, args.chunk_size)
+    elapsed = time.perf_counter() - started
+
+    summary = {
+        "games": len(replays),
+        "moves": sum(len(replay.moves) for replay in replays),
+        "mismatches": len(mismatches),
+        "first_mismatches": mismatches[:10],
+        "elapsed_sec": round(elapsed, 3),
+        "games_per_sec": round(len(replays) / elapsed, 1) if elapsed else None,
+    }
+
+    if args.json:
+        print(json.dumps(summary))
+    else:
+        for key, value in summary.items():
+            print(f"{key:>16}: {value}")
+
+    if mismatches:
+        raise SystemExit(1)
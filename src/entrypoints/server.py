@@ -0,0 +1,104 @@
+import argparse
+import asyncio
+import contextlib
+import json
+
+from src.entrypoints.di.server.facade import (
+    ServerDependencies,
+    server_dependencies_facade,
+)
+from src.presentation.remote.session_server import create_session_server
+from src.presentation.remote.stream_view import create_stream_server
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.server",
+        description="Serves many concurrent 2048 games over a JSON line protocol.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=2048)
+    parser.add_argument(
+        "--stream-port",
+        type=int,
+        default=None,
+        help="port for clients playing one game per connection with plain "
+        "move lines (disabled if omitted)",
+    )
+    parser.add_argument("--max-sessions", type=int, default=100_000)
+    parser.add_argument(
+        "--idle-ttl",
+        type=float,
+        default=600.0,
+        help="seconds before an unused session is evicted (0 to disable)",
+    )
+    parser.add_argument(
+        "--stats-interval",
+        type=float,
+        default=10.0,
+        help="seconds between latency reports (0 to disable)",
+    )
+    return parser.parse_args(argv)
+
+
+async def serve(deps: ServerDependencies, args: argparse.Namespace) -> None:
+    """
+    Runs the server until cancelled, printing statistics periodically.
+    With --stream-port, one-game-per-connection clients are served too.
+
+    :param deps: Wired server dependencies
+    :param args: Parsed command line arguments
+    """
+    server = await create_session_server(
+        sessions=deps.sessions,
+        latency=deps.latency,
+        dim=deps.dim,
+        host=args.host,
+        port=args.port,
+    )
+    async with contextlib.AsyncExitStack() as servers:
+        await servers.enter_async_context(server)
+        host, port = server.sockets[0].getsockname()[:2]
+        print(f"Listening on {host}:{port}", flush=True)
+        if args.stream_port is not None:
+            stream_server = await servers.enter_async_context(
+                await create_stream_server(
+                    new_game_loop=deps.new_stream_game,
+                    host=args.host,
+                    port=args.stream_port,
+                )
+            )
+            host, port = stream_server.sockets[0].getsockname()[:2]
+            print(f"Streaming games on {host}:{port}", flush=True)
+        if args.stats_interval <= 0:
+            await server.serve_forever()
+            return
+        while True:
+            await asyncio.sleep(args.stats_interval)
+            stats = {
+                "sessions": deps.sessions.get_sessions_count(),
+                "moves": deps.latency.get_total(),
+                "p50_us": deps.latency.get_percentile_us(50),
+                "p99_us": deps.latency.get_percentile_us(99),
+            }
+            print(json.dumps(stats), flush=True)
+
+
+def start_server(argv: list[str] | None = None) -> None:
+    """
+    Parses command line arguments and runs the game server.
+
+    :param argv: Command line arguments, sys.argv is used if None
+    """
+    args = _parse_args(argv)
+    if args.max_sessions < 1:
+        raise SystemExit("--max-sessions must be positive")
+
+    deps = server_dependencies_facade(
+        max_sessions=args.max_sessions,
+        idle_ttl=args.idle_ttl or None,
+    )
+    try:
+        asyncio.run(serve(deps, args))
+    except KeyboardInterrupt:
+        pass
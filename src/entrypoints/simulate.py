@@ -0,0 +1,321 @@
+import argparse
+import functools
+import json
+import os
+import random
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.domain.dataclasses_.game_replay import GameReplay
+from src.domain.dataclasses_.simulation_report import SimulationReport
+from src.domain.entities.move_tables import MoveTables
+from src.domain.enums_.random_generator_kind import RandomGeneratorKind
+from src.entrypoints.di.cli.container import (
+    GameEngine,
+    create_move_tables_dependency,
+)
+from src.entrypoints.di.simulation.container import MovePolicyName
+from src.entrypoints.di.simulation.facade import simulation_dependencies_facade
+from src.infrastructure.position_dataset import (
+    PositionDatasetWriter,
+    find_shards,
+    get_shard_path,
+)
+from src.infrastructure.replay_log import FileReplayLog
+
+# keeps the policy generator independent from the spawner generator
+_POLICY_SEED_OFFSET = 1 << 64
+
+
+@dataclass(frozen=True)
+class SimulationChunk:
+    """
+    A batch of games played by one worker task.
+
+    Game ``i`` of the simulation seeds its own tile spawner generator with
+    ``seed + i`` (and its move policy with a seed derived from it), so
+    results don't depend on how games are distributed between workers.
+    When ``dataset`` is set, the played positions are written to the shard
+    of the dataset numbered after the chunk's first game.
+    """
+
+    first_game: int
+    games: int
+    seed: int
+    engine: GameEngine
+    policy: MovePolicyName
+    max_moves: int | None
+    rng_kind: RandomGeneratorKind
+    record: bool
+    dataset: Path | None = None
+
+
+@functools.cache
+def _get_move_tables() -> MoveTables:
+    """Loads move tables once per worker process."""
+    return create_move_tables_dependency()
+
+
+def play_chunk(chunk: SimulationChunk) -> SimulationReport:
+    """
+    Plays all games of a chunk in the current process.
+
+    :param chunk: Games to play
+    :return: Statistics of the played games
+    """
+    report = SimulationReport()
+    writer = None
+    if chunk.dataset is not None:
+        writer = PositionDatasetWriter(
+            path=get_shard_path(chunk.dataset, chunk.first_game), dimension=4
+        )
+    try:
+        for game_idx in range(chunk.first_game, chunk.first_game + chunk.games):
+            game_seed = chunk.seed + game_idx
+            deps = simulation_dependencies_facade(
+                engine=chunk.engine,
+                policy=chunk.policy,
+                move_tables=_get_move_tables(),
+                policy_seed=game_seed + _POLICY_SEED_OFFSET,
+                max_moves=chunk.max_moves,
+                seed=game_seed,
+                rng_kind=chunk.rng_kind,
+                record=chunk.record,
+                record_positions=writer is not None,
+            )
+            summary = deps.self_play.execute()
+
+            replay = None
+            if deps.recorder is not None:
+                replay = GameReplay(
+                    seed=game_seed,
+                    rng_kind=chunk.rng_kind,
+                    dimension=4,
+                    moves=deps.recorder.get_moves(),
+                    score=summary.score,
+                    max_tile=summary.max_tile,
+                )
+            if writer is not None and deps.position_recorder is not None:
+                writer.write(deps.position_recorder.get_records(summary.score))
+            report.add(summary, replay)
+    finally:
+        if writer is not None:
+            writer.close()
+    return report
+
+
+def run_simulation(
+    games: int,
+    workers: int,
+    engine: GameEngine = GameEngine.BITBOARD,
+    policy: MovePolicyName = MovePolicyName.RANDOM,
+    seed: int = 0,
+    max_moves: int | None = None,
+    chunk_size: int | None = None,
+    rng_kind: RandomGeneratorKind = RandomGeneratorKind.MERSENNE,
+    record: bool = False,
+    dataset: Path | None = None,
+) -> SimulationReport:
+    """
+    Plays ``games`` headless games, spreading them over a process pool.
+
+    :param games: Number of games to play
+    :param workers: Number of worker processes (1 plays in the current process)
+    :param engine: Game logic implementation
+    :param policy: Move policy playing the games
+    :param seed: Base seed of the simulation
+    :param max_moves: Move limit per game, None for no limit
+    :param chunk_size: Games per worker task, chosen automatically if None
+    :param rng_kind: Random generator of the tile spawners
+    :param record: Keep a replay of every game in the report
+    :param dataset: Write the played positions to shards of this dataset,
+           replacing its previous shards
+    :return: Aggregated statistics of all games
+    """
+    if chunk_size is None:
+        # small enough to balance the load, big enough to amortize IPC
+        chunk_size = max(1, min(1000, games // (workers * 8) or 1))
+
+    if dataset is not None:
+        for shard in find_shards(dataset):
+            shard.unlink()
+
+    chunks = list(
+        _split_into_chunks(
+            games,
+            chunk_size,
+            seed,
+            engine,
+            policy,
+            max_moves,
+            rng_kind,
+            record,
+            dataset,
+        )
+    )
+    report = SimulationReport()
+
+    if workers == 1:
+        for chunk in chunks:
+            report.merge(play_chunk(chunk))
+        return report
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_report in executor.map(play_chunk, chunks):
+            report.merge(chunk_report)
+    return report
+
+
+def _split_into_chunks(
+    games: int,
+    chunk_size: int,
+    seed: int,
+    engine: GameEngine,
+    policy: MovePolicyName,
+    max_moves: int | None,
+    rng_kind: RandomGeneratorKind,
+    record: bool,
+    dataset: Path | None,
+) -> Iterator[SimulationChunk]:
+    for first_game in range(0, games, chunk_size):
+        yield SimulationChunk(
+            first_game=first_game,
+            games=min(chunk_size, games - first_game),
+            seed=seed,
+            engine=engine,
+            policy=policy,
+            max_moves=max_moves,
+            rng_kind=rng_kind,
+            record=record,
+            dataset=dataset,
+        )
+
+
+def format_report(report: SimulationReport, elapsed: float) -> dict[str, object]:
+    """
+    Summarizes score, max tile and move count distributions.
+
+    :param report: Aggregated statistics
+    :param elapsed: Wall-clock time of the simulation in seconds
+    :return: JSON-serializable summary
+    """
+
+    def distribution(values: list[int]) -> dict[str, float]:
+        return {
+            "mean": sum(values) / len(values) if values else 0.0,
+            "min": min(values, default=0),
+            "p50": SimulationReport.percentile(values, 50),
+            "p90": SimulationReport.percentile(values, 90),
+            "p99": SimulationReport.percentile(values, 99),
+            "max": max(values, default=0),
+        }
+
+    total_moves = sum(report.moves)
+    return {
+        "games": report.games,
+        "wins": report.wins,
+        "elapsed_sec": round(elapsed, 3),
+        "games_per_sec": round(report.games / elapsed, 1) if elapsed else None,
+        "moves_per_sec": round(total_moves / elapsed, 1) if elapsed else None,
+        "score": distribution(report.scores),
+        "moves": distribution(report.moves),
+        "max_tile": {
+            str(tile): count for tile, count in sorted(report.max_tiles.items())
+        },
+    }
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.simulate",
+        description="Plays 2048 games without a user interface and prints statistics.",
+    )
+    parser.add_argument("--games", type=int, default=1000, help="games to play")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="worker processes (default: all cores)",
+    )
+    parser.add_argument(
+        "--policy",
+        choices=[policy.value for policy in MovePolicyName],
+        default=MovePolicyName.RANDOM.value,
+    )
+    parser.add_argument(
+        "--engine",
+        choices=[engine.value for engine in GameEngine],
+        default=GameEngine.BITBOARD.value,
+    )
+    parser.add_argument(
+        "--seed", type=int, default=None, help="base seed (random if omitted)"
+    )
+    parser.add_argument("--max-moves", type=int, default=None)
+    parser.add_argument(
+        "--rng",
+        choices=[kind.name.lower() for kind in RandomGeneratorKind],
+        default=RandomGeneratorKind.MERSENNE.name.lower(),
+        help="random generator of the tile spawner",
+    )
+    parser.add_argument(
+        "--record",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="write a binary replay log of all games",
+    )
+    parser.add_argument(
+        "--dataset",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="write every played position to a sharded training dataset",
+    )
+    parser.add_argument("--chunk-size", type=int, default=None)
+    parser.add_argument("--json", action="store_true", help="print JSON only")
+    return parser.parse_args(argv)
+
+
+def start_simulation(argv: list[str] | None = None) -> None:
+    """
+    Parses command line arguments, runs the simulation and prints the report.
+
+    :param argv: Command line arguments, sys.argv is used if None
+    """
+    args = _parse_args(argv)
+    if args.games < 1 or args.workers < 1:
+        raise SystemExit("--games and --workers must be positive")
+
+    seed = args.seed if args.seed is not None else random.randrange(2**32)
+    # game i is seeded with seed + i, which replay logs store as u64
+    if not 0 <= seed <= 2**64 - args.games:
+        raise SystemExit("--seed must be non-negative and seed + games fit 64 bits")
+
+    started = time.perf_counter()
+    report = run_simulation(
+        games=args.games,
+        workers=args.workers,
+        engine=GameEngine(args.engine),
+        policy=MovePolicyName(args.policy),
+        seed=seed,
+        max_moves=args.max_moves,
+        chunk_size=args.chunk_size,
+        rng_kind=RandomGeneratorKind[args.rng.upper()],
+        record=args.record is not None,
+        dataset=args.dataset,
+    )
+    summary = format_report(report, time.perf_counter() - started)
+    summary["seed"] = seed
+
+    if args.record is not None:
+        FileReplayLog(path=args.record).save(report.replays)
+
+    if args.json:
+        print(json.dumps(summary))
+        return
+
+    for key, value in summary.items():
+        print(f"{key:>14}: {value}")
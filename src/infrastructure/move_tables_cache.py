@@ -0,0 +1,49 @@
+import os
+import tempfile
+from pathlib import Path
+
+
+class FileMoveTablesCache:
+    """
+    Stores precomputed move tables in a single binary file.
+
+    Writes are atomic (temporary file + rename), so concurrent processes
+    never observe a half-written cache. Any I/O error is treated as a cache
+    miss: the tables are simply regenerated in memory.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        :param path: Location of the cache file (parent directories are created on save)
+        """
+        self._path = path
+
+    def load(self) -> bytes | None:
+        """
+        Reads previously stored tables.
+
+        :return: File content or None if the file is missing or unreadable
+        """
+        try:
+            return self._path.read_bytes()
+        except OSError:
+            return None
+
+    def save(self, data: bytes) -> None:
+        """
+        Atomically writes generated tables to the cache file.
+
+        :param data: Serialized tables
+        """
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self._path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as tmp_file:
+                    tmp_file.write(data)
+                os.replace(tmp_name, self._path)
+            except OSError:
+                os.unlink(tmp_name)
+                raise
+        except OSError:
+            return
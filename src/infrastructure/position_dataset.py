@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import mmap
+import struct
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from types import TracebackType
+from typing import TYPE_CHECKING
+
+from src.domain.dataclasses_.position_record import PositionRecord
+from src.domain.entities.bit_board import BitBoard
+from src.domain.enums_.move_direction import MoveDirection
+
+if TYPE_CHECKING:
+    import numpy as np
+
+_MAGIC = b"2048DS"
+_VERSION = 1
+# magic, version, board dimension, record size; padded to keep records aligned
+_HEADER = struct.Struct("<6sBBH6x")
+_CELL_WORD_BITS = 64
+
+_DIRECTIONS: tuple[MoveDirection, ...] = (
+    MoveDirection.UP,
+    MoveDirection.DOWN,
+    MoveDirection.LEFT,
+    MoveDirection.RIGHT,
+)
+_CODES = {direction: code for code, direction in enumerate(_DIRECTIONS)}
+
+
+def _get_cell_words(dimension: int) -> int:
+    """Number of u64 words holding a packed board of the given dimension."""
+    cells_bits = dimension * dimension * BitBoard.CELL_BITS
+    return max(1, -(-cells_bits // _CELL_WORD_BITS))
+
+
+def _get_record_struct(dimension: int) -> struct.Struct:
+    """
+    Layout of one record (little-endian, unpadded): the packed board as u64
+    words (one for a 4×4 board), the move code (u8, UP/DOWN/LEFT/RIGHT as
+    0-3), the score delta and the final score (u32 each).
+    """
+    return struct.Struct(f"<{_get_cell_words(dimension)}QBII")
+
+
+def get_shard_path(path: Path, shard: int) -> Path:
+    """
+    Returns the file of one shard of a dataset, so that parallel workers
+    never write to the same file: ``games.ds`` becomes ``games-00000042.ds``.
+
+    :param path: Location of the whole dataset
+    :param shard: Shard number
+    :return: Location of the shard
+    """
+    return path.with_name(f"{path.stem}-{shard:08d}{path.suffix}")
+
+
+def find_shards(path: Path) -> list[Path]:
+    """
+    Lists the existing shards of a dataset.
+
+    :param path: Location of the whole dataset, as given to get_shard_path
+    :return: Shard files ordered by shard number
+    """
+    return sorted(path.parent.glob(f"{path.stem}-{'[0-9]' * 8}{path.suffix}"))
+
+
+class PositionDatasetWriter:
+    """
+    Streams position records into a file of fixed-width records.
+
+    Records are buffered and written in large blocks; nothing but the
+    current block is kept in memory, so a worker can produce datasets far
+    larger than RAM. Use as a context manager or call close().
+    """
+
+    def __init__(self, path: Path, dimension: int, buffer_records: int = 8192):
+        """
+        Creates (or replaces) the dataset file.
+
+        :param path: Location of the dataset file
+        :param dimension: Board dimension of all records
+        :param buffer_records: Records kept in memory between writes
+        :raises OSError: If the file cannot be created
+        """
+        self._record = _get_record_struct(dimension)
+        self._cell_words = _get_cell_words(dimension)
+        self._buffer = bytearray()
+        self._buffer_size = buffer_records * self._record.size
+        self._count = 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(path, "wb")
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, dimension, self._record.size))
+
+    def write(self, records: Iterable[PositionRecord]) -> None:
+        """
+        Appends records to the dataset.
+
+        :param records: Records to store
+        :raises ValueError: If a record does not fit the format
+        :raises OSError: If the file cannot be written
+        """
+        word_mask = (1 << _CELL_WORD_BITS) - 1
+        for record in records:
+            cells = record.cells
+            words = [
+                (cells >> (idx * _CELL_WORD_BITS)) & word_mask
+                for idx in range(self._cell_words)
+            ]
+            if cells >> (self._cell_words * _CELL_WORD_BITS):
+                raise ValueError("Record cells do not fit the board dimension")
+            try:
+                self._buffer += self._record.pack(
+                    *words,
+                    _CODES[record.move],
+                    record.score_delta,
+                    record.final_score,
+                )
+            except struct.error as error:
+                raise ValueError(f"Record cannot be encoded: {error}") from error
+            self._count += 1
+            if len(self._buffer) >= self._buffer_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered records to the file.
+
+        :raises OSError: If the file cannot be written
+        """
+        self._file.write(self._buffer)
+        self._file.flush()
+        self._buffer.clear()
+
+    def get_count(self) -> int:
+        """
+        Returns the number of records written so far.
+
+        :return: Records count
+        """
+        return self._count
+
+    def close(self) -> None:
+        """
+        Writes the remaining records and closes the file.
+
+        :raises OSError: If the file cannot be written
+        """
+        if self._file.closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._file.close()
+
+    def __enter__(self) -> PositionDatasetWriter:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class PositionDataset:
+    """
+    Read-only view of a dataset written by PositionDatasetWriter.
+
+    The file is memory-mapped: records are decoded on access and pages are
+    loaded by the OS as they are touched, so opening a dataset costs nothing
+    regardless of its size. A record cut short by an interrupted writer is
+    ignored. Use as a context manager or call close().
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Maps the dataset file into memory.
+
+        :param path: Location of the dataset file
+        :raises ValueError: If the file is not a valid dataset
+        :raises OSError: If the file cannot be read
+        """
+        self._path = path
+        with open(path, "rb") as dataset_file:
+            header = dataset_file.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                raise ValueError("Truncated dataset header")
+            magic, version, dimension, record_size = _HEADER.unpack(header)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError("Unknown dataset format")
+            self._record = _get_record_struct(dimension)
+            if record_size != self._record.size:
+                raise ValueError("Dataset record size does not match its dimension")
+            self._map = mmap.mmap(dataset_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._dimension: int = dimension
+        self._cell_words = _get_cell_words(dimension)
+        self._count: int = (len(self._map) - _HEADER.size) // record_size
+        self._view = memoryview(self._map)[
+            _HEADER.size : _HEADER.size + self._count * record_size
+        ]
+
+    def get_dimension(self) -> int:
+        """
+        Returns the board dimension of the records.
+
+        :return: Board dimension
+        """
+        return self._dimension
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, idx: int) -> PositionRecord:
+        """
+        Decodes one record.
+
+        :param idx: Record index, negative values count from the end
+        :return: Decoded record
+        :raises IndexError: If there is no such record
+        """
+        if idx < 0:
+            idx += self._count
+        if not 0 <= idx < self._count:
+            raise IndexError("Dataset record index out of range")
+        *words, move, score_delta, final_score = self._record.unpack_from(
+            self._view, idx * self._record.size
+        )
+        cells = 0
+        for word_idx, word in enumerate(words):
+            cells |= word << (word_idx * _CELL_WORD_BITS)
+        return PositionRecord(
+            cells=cells,
+            move=_DIRECTIONS[move],
+            score_delta=score_delta,
+            final_score=final_score,
+        )
+
+    def __iter__(self) -> Iterator[PositionRecord]:
+        for idx in range(self._count):
+            yield self[idx]
+
+    def get_buffer(self) -> memoryview:
+        """
+        Returns the raw records without copying them; see
+        _get_record_struct for the layout. The view must be released before
+        the dataset is closed.
+
+        :return: Read-only view of all complete records
+        """
+        return self._view[:]
+
+    def to_numpy(self) -> np.ndarray:
+        """
+        Exposes the records as a NumPy structured array backed by the file
+        (fields ``cells``, ``move``, ``score_delta`` and ``final_score``).
+        The array maps the file on its own and stays valid after close().
+
+        Requires NumPy, which is an optional dependency of the project.
+
+        :return: Read-only memory-mapped array of all complete records
+        :raises ImportError: If NumPy is not installed
+        """
+        import numpy as np
+
+        cells: tuple[str, str] | tuple[str, str, tuple[int]] = ("cells", "<u8")
+        if self._cell_words > 1:
+            cells = ("cells", "<u8", (self._cell_words,))
+        dtype = np.dtype(
+            [cells, ("move", "u1"), ("score_delta", "<u4"), ("final_score", "<u4")]
+        )
+        if not self._count:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(
+            self._path,
+            dtype=dtype,
+            mode="r",
+            offset=_HEADER.size,
+            shape=(self._count,),
+        )
+
+    def close(self) -> None:
+        """
+        Unmaps the file.
+
+        :raises BufferError: If a view returned by get_buffer is still alive
+        """
+        self._view.release()
+        self._map.close()
+
+    def __enter__(self) -> PositionDataset:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
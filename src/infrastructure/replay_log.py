@@ -0,0 +1,161 @@
+import os
+import struct
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+
+from src.domain.dataclasses_.game_replay import GameReplay
+from src.domain.enums_.move_direction import MoveDirection
+from src.domain.enums_.random_generator_kind import RandomGeneratorKind
+
+_MAGIC = b"2048RL"
+# bumped whenever the same seed starts producing different games (2: spawn
+# cells are sampled without retries)
+_VERSION = 2
+_HEADER = struct.Struct("<6sBI")  # magic, version, replays count
+_RECORD = struct.Struct("<QBBIII")  # seed, rng, dimension, score, max tile, moves
+
+# two bits per move, four moves per byte
+_DIRECTIONS: tuple[MoveDirection, ...] = (
+    MoveDirection.UP,
+    MoveDirection.DOWN,
+    MoveDirection.LEFT,
+    MoveDirection.RIGHT,
+)
+_CODES = {direction: code for code, direction in enumerate(_DIRECTIONS)}
+
+
+def encode_replays(replays: Iterable[GameReplay]) -> bytes:
+    """
+    Serializes replays into the compact binary log format.
+
+    Layout (little-endian): header ``2048RL``, version byte and replay count,
+    then for every replay seed (u64), generator kind (u8), board dimension
+    (u8), score, max tile and move count (u32 each) followed by the moves
+    packed two bits apiece.
+
+    :param replays: Replays to serialize
+    :return: Serialized log
+    :raises ValueError: If a field does not fit its binary representation
+    """
+    chunks = [b""]
+    count = 0
+    for replay in replays:
+        try:
+            chunks.append(
+                _RECORD.pack(
+                    replay.seed,
+                    replay.rng_kind.value,
+                    replay.dimension,
+                    replay.score,
+                    replay.max_tile,
+                    len(replay.moves),
+                )
+            )
+        except struct.error as error:
+            raise ValueError(f"Replay cannot be encoded: {error}") from error
+        chunks.append(_pack_moves(replay.moves))
+        count += 1
+    chunks[0] = _HEADER.pack(_MAGIC, _VERSION, count)
+    return b"".join(chunks)
+
+
+def decode_replays(data: bytes) -> list[GameReplay]:
+    """
+    Parses a log produced by encode_replays.
+
+    :param data: Serialized log
+    :return: Replays in the order they were written
+    :raises ValueError: If the data is not a valid replay log
+    """
+    try:
+        magic, version, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Unknown replay log format")
+
+        replays: list[GameReplay] = []
+        offset = _HEADER.size
+        for _ in range(count):
+            seed, rng, dimension, score, max_tile, moves_qty = _RECORD.unpack_from(
+                data, offset
+            )
+            offset += _RECORD.size
+            packed_size = (moves_qty + 3) // 4
+            if offset + packed_size > len(data):
+                raise ValueError("Truncated replay log")
+            moves = _unpack_moves(data[offset : offset + packed_size], moves_qty)
+            offset += packed_size
+            replays.append(
+                GameReplay(
+                    seed=seed,
+                    rng_kind=RandomGeneratorKind(rng),
+                    dimension=dimension,
+                    moves=moves,
+                    score=score,
+                    max_tile=max_tile,
+                )
+            )
+    except struct.error as error:
+        raise ValueError("Truncated replay log") from error
+
+    if offset != len(data):
+        raise ValueError("Unexpected data after the last replay")
+    return replays
+
+
+def _pack_moves(moves: tuple[MoveDirection, ...]) -> bytes:
+    packed = bytearray((len(moves) + 3) // 4)
+    for idx, move in enumerate(moves):
+        packed[idx >> 2] |= _CODES[move] << ((idx & 3) * 2)
+    return bytes(packed)
+
+
+def _unpack_moves(packed: bytes, moves_qty: int) -> tuple[MoveDirection, ...]:
+    return tuple(
+        _DIRECTIONS[(packed[idx >> 2] >> ((idx & 3) * 2)) & 3]
+        for idx in range(moves_qty)
+    )
+
+
+class FileReplayLog:
+    """
+    Stores replays in a single binary file.
+
+    Writes are atomic (temporary file + rename), so a reader never observes
+    a half-written log.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        :param path: Location of the log file
+        """
+        self._path = path
+
+    def save(self, replays: Iterable[GameReplay]) -> None:
+        """
+        Writes the log atomically, replacing any previous one.
+
+        :param replays: Replays to store
+        :raises ValueError: If a replay cannot be encoded
+        :raises OSError: If the file cannot be written
+        """
+        data = encode_replays(replays)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self._path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_name, self._path)
+        except OSError:
+            os.unlink(tmp_name)
+            raise
+
+    def load(self) -> list[GameReplay]:
+        """
+        Reads all replays of the log.
+
+        :return: Stored replays
+        :raises ValueError: If the file is not a valid replay log
+        :raises OSError: If the file cannot be read
+        """
+        return decode_replays(self._path.read_bytes())
@@ -0,0 +1,417 @@
+import json
+import mmap
+import os
+import struct
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+from src.domain.dataclasses_.game_snapshot import GameSnapshot
+from src.domain.enums_.game_result import GameResult
+from src.domain.enums_.tile_value import TileValue
+
+_MAGIC = b"2048SN"
+_VERSION = 1
+_HEADER = struct.Struct("<6sB")  # magic, version
+
+_RESULTS: tuple[GameResult | None, ...] = (None, GameResult.WIN, GameResult.LOSE)
+_RESULT_CODES = {result: code for code, result in enumerate(_RESULTS)}
+
+# generator state codes stored in bits 2-3 of the flags byte
+_NO_RNG = 0
+_COUNTER_RNG = 1
+_MERSENNE_RNG = 2
+
+_COUNTER_SEED = struct.Struct("<Q")
+_MERSENNE_VERSION = 3
+_MERSENNE_WORDS = struct.Struct("<625I")  # 624 state words and the position
+_GAUSS = struct.Struct("<d")
+
+Buffer = bytes | bytearray | memoryview
+
+
+def encode_snapshot(snapshot: GameSnapshot) -> bytes:
+    """
+    Serializes a snapshot into the compact binary format.
+
+    Layout: flags (u8: result in bits 0-1, generator in bits 2-3), board
+    dimension (u8), the packed board (4 bits per cell, little-endian), the
+    score (varint) and the generator state: nothing, a counter-based state
+    (seed u64 and counter varint) or a Mersenne Twister state (625 u32 words
+    and the optional cached gaussian). A 4×4 position takes 12-14 bytes,
+    with a counter-based generator about 10 more.
+
+    :param snapshot: Snapshot to serialize
+    :return: Encoded snapshot
+    :raises ValueError: If a field cannot be represented; use
+            snapshot_to_json for such snapshots
+    """
+    rng_code, rng_data = _encode_rng_state(snapshot.rng_state)
+    cells_size = (snapshot.dimension * snapshot.dimension + 1) // 2
+    if not 0 < snapshot.dimension < 256 or snapshot.score < 0:
+        raise ValueError("Snapshot dimension or score out of range")
+    try:
+        cells = snapshot.cells.to_bytes(cells_size, "little")
+    except OverflowError as error:
+        raise ValueError("Cells do not fit the board dimension") from error
+    return b"".join(
+        (
+            bytes((_RESULT_CODES[snapshot.result] | rng_code << 2, snapshot.dimension)),
+            cells,
+            _encode_varint(snapshot.score),
+            rng_data,
+        )
+    )
+
+
+def decode_snapshot(data: Buffer, offset: int = 0) -> tuple[GameSnapshot, int]:
+    """
+    Parses a snapshot encoded by encode_snapshot without copying the input:
+    fields are read straight from the buffer (e.g. a memoryview of a
+    memory-mapped file).
+
+    :param data: Buffer holding the snapshot
+    :param offset: Position of the snapshot in the buffer
+    :return: Decoded snapshot and the position right after it
+    :raises ValueError: If the data is not a valid snapshot
+    """
+    view = memoryview(data)
+    try:
+        flags, dimension = view[offset], view[offset + 1]
+        offset += 2
+        cells_size = (dimension * dimension + 1) // 2
+        if offset + cells_size > len(view):
+            raise ValueError("Truncated snapshot")
+        cells = int.from_bytes(view[offset : offset + cells_size], "little")
+        offset += cells_size
+        score, offset = _decode_varint(view, offset)
+        rng_state, offset = _decode_rng_state(flags >> 2, view, offset)
+        result = _RESULTS[flags & 0b11]
+    except (IndexError, struct.error) as error:
+        raise ValueError("Truncated or invalid snapshot") from error
+
+    snapshot = GameSnapshot(
+        dimension=dimension,
+        cells=cells,
+        score=score,
+        result=result,
+        rng_state=rng_state,
+    )
+    return snapshot, offset
+
+
+def snapshot_to_json(snapshot: GameSnapshot) -> str:
+    """
+    Serializes a snapshot as readable JSON, the fallback for snapshots the
+    binary format cannot hold (e.g. another generator's state).
+
+    :param snapshot: Snapshot to serialize
+    :return: JSON document
+    :raises TypeError: If the generator state is not JSON-serializable
+    """
+    dim = snapshot.dimension
+    tiles = [
+        [
+            TileValue.from_exponent(
+                (snapshot.cells >> ((row_idx * dim + col_idx) * 4)) & 0xF
+            ).value
+            for col_idx in range(dim)
+        ]
+        for row_idx in range(dim)
+    ]
+    return json.dumps(
+        {
+            "tiles": tiles,
+            "score": snapshot.score,
+            "result": snapshot.result.name.lower() if snapshot.result else None,
+            "rng_state": snapshot.rng_state,
+        }
+    )
+
+
+def snapshot_from_json(document: str) -> GameSnapshot:
+    """
+    Parses a snapshot serialized by snapshot_to_json.
+
+    :param document: JSON document
+    :return: Decoded snapshot; lists of the generator state become tuples,
+             as random generators expect
+    :raises ValueError: If the document is not a valid snapshot
+    """
+    try:
+        data = json.loads(document)
+        tiles = data["tiles"]
+        if any(len(row) != len(tiles) for row in tiles):
+            raise ValueError("Snapshot tiles do not form a square board")
+        score = int(data["score"])
+        if score < 0:
+            raise ValueError("Snapshot score out of range")
+        cells = 0
+        for idx, value in enumerate(value for row in tiles for value in row):
+            cells |= TileValue(value).exponent << (idx * 4)
+        result = data["result"]
+        return GameSnapshot(
+            dimension=len(tiles),
+            cells=cells,
+            score=score,
+            result=GameResult[result.upper()] if result is not None else None,
+            rng_state=_to_tuples(data["rng_state"]),
+        )
+    except (KeyError, TypeError, AttributeError) as error:
+        raise ValueError(f"Invalid snapshot document: {error}") from error
+
+
+class FileSnapshotLog:
+    """
+    Append-only binary file of snapshots: a header, then every snapshot
+    prefixed by its length (varint).
+
+    Appending never rewrites earlier records, so suspending a game costs a
+    single small write. Reading maps the file into memory and decodes the
+    records in place, so large position corpora are streamed rather than
+    loaded. A last record cut short by an interrupted append is ignored when
+    reading and dropped by the next append.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        :param path: Location of the log file
+        """
+        self._path = path
+
+    def append(self, snapshots: Iterable[GameSnapshot], sync: bool = False) -> None:
+        """
+        Appends snapshots to the end of the log with one write. A record cut
+        short by an interrupted append is truncated first, otherwise its
+        length would swallow the new records.
+
+        :param snapshots: Snapshots to store
+        :param sync: Flush the file to disk before returning
+        :raises ValueError: If a snapshot cannot be encoded, or the file is
+                not a valid snapshot log
+        :raises OSError: If the file cannot be written
+        """
+        chunks: list[bytes] = []
+        for snapshot in snapshots:
+            record = encode_snapshot(snapshot)
+            chunks.append(_encode_varint(len(record)))
+            chunks.append(record)
+
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._path, "a+b") as log_file:
+            size = log_file.tell()
+            if size == 0:
+                chunks.insert(0, _HEADER.pack(_MAGIC, _VERSION))
+            else:
+                with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    end = self._get_records_end(mapped)
+                if end < size:
+                    log_file.truncate(end)
+            log_file.write(b"".join(chunks))
+            if sync:
+                log_file.flush()
+                os.fsync(log_file.fileno())
+
+    def __iter__(self) -> Iterator[GameSnapshot]:
+        """
+        Decodes the snapshots one by one from the memory-mapped file.
+
+        :return: Iterator over the stored snapshots in write order
+        :raises ValueError: If the file is not a valid snapshot log
+        :raises OSError: If the file cannot be read
+        """
+        with open(self._path, "rb") as log_file:
+            if os.fstat(log_file.fileno()).st_size == 0:
+                return
+            with mmap.mmap(log_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield from self._iter_records(mapped)
+
+    def load(self) -> list[GameSnapshot]:
+        """
+        Reads all snapshots of the log.
+
+        :return: Stored snapshots in write order
+        :raises ValueError: If the file is not a valid snapshot log
+        :raises OSError: If the file cannot be read
+        """
+        return list(self)
+
+    def load_last(self) -> GameSnapshot | None:
+        """
+        Reads the most recent snapshot, e.g. to resume a suspended game.
+
+        :return: Last stored snapshot, None if the log is empty
+        :raises ValueError: If the file is not a valid snapshot log
+        :raises OSError: If the file cannot be read
+        """
+        last = None
+        for last in self:
+            pass
+        return last
+
+    @staticmethod
+    def _iter_records(mapped: mmap.mmap) -> Iterator[GameSnapshot]:
+        """
+        Walks the framed records of a mapped log, up to the last complete one.
+
+        :param mapped: Whole log file
+        :return: Iterator over the decoded snapshots
+        :raises ValueError: If the data is not a valid snapshot log
+        """
+        FileSnapshotLog._check_header(mapped)
+
+        size = len(mapped)
+        offset = _HEADER.size
+        while offset < size:
+            # errors are raised only once the views into the map are gone:
+            # a traceback holding one would keep the map from being closed
+            error_message = None
+            with memoryview(mapped) as view:
+                try:
+                    length, offset = _decode_varint(view, offset)
+                except IndexError:
+                    # the length of a record cut short by an interrupted append
+                    return
+                end = offset + length
+                if end > size:
+                    return
+                try:
+                    snapshot, decoded_end = decode_snapshot(view[:end], offset)
+                    if decoded_end != end:
+                        raise ValueError("Corrupted snapshot record")
+                except ValueError as error:
+                    error_message = str(error)
+            if error_message is not None:
+                raise ValueError(error_message)
+            offset = end
+            yield snapshot
+
+    @staticmethod
+    def _get_records_end(mapped: mmap.mmap) -> int:
+        """
+        Finds where the last complete record of a mapped log ends, skipping
+        over the records by their lengths without decoding them.
+
+        :param mapped: Whole log file
+        :return: Size of the log without a record cut short at its end
+        :raises ValueError: If the data is not a valid snapshot log
+        """
+        FileSnapshotLog._check_header(mapped)
+
+        size = len(mapped)
+        end = offset = _HEADER.size
+        with memoryview(mapped) as view:
+            while offset < size:
+                try:
+                    length, offset = _decode_varint(view, offset)
+                except IndexError:
+                    break
+                offset += length
+                if offset > size:
+                    break
+                end = offset
+        return end
+
+    @staticmethod
+    def _check_header(mapped: mmap.mmap) -> None:
+        """
+        Checks the magic and version at the start of a mapped log.
+
+        :param mapped: Whole log file
+        :raises ValueError: If the file is not a snapshot log of this version
+        """
+        try:
+            magic, version = _HEADER.unpack_from(mapped)
+        except struct.error as error:
+            raise ValueError("Truncated snapshot log") from error
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Unknown snapshot log format")
+
+
+def _encode_rng_state(state: Any) -> tuple[int, bytes]:
+    """
+    Recognizes and serializes the state of a supported generator.
+
+    :param state: State returned by getstate, None for no generator
+    :return: Generator code and its serialized state
+    :raises ValueError: If the state is of an unknown generator or does not
+            fit its binary representation
+    """
+    if state is None:
+        return _NO_RNG, b""
+    try:
+        if len(state) == 2 and all(isinstance(part, int) for part in state):
+            seed, counter = state
+            if counter < 0:
+                raise ValueError("Generator counter out of range")
+            return _COUNTER_RNG, _COUNTER_SEED.pack(seed) + _encode_varint(counter)
+        if len(state) == 3 and state[0] == _MERSENNE_VERSION:
+            _, words, gauss = state
+            data = _MERSENNE_WORDS.pack(*words)
+            if gauss is None:
+                return _MERSENNE_RNG, data + b"\x00"
+            return _MERSENNE_RNG, data + b"\x01" + _GAUSS.pack(gauss)
+    except struct.error as error:
+        raise ValueError(f"Generator state cannot be encoded: {error}") from error
+    raise ValueError("Unsupported generator state, use the JSON format")
+
+
+def _decode_rng_state(code: int, view: memoryview, offset: int) -> tuple[Any, int]:
+    """
+    Parses a generator state written by _encode_rng_state.
+
+    :param code: Generator code
+    :param view: Buffer holding the state
+    :param offset: Position of the state
+    :return: Generator state and the position right after it
+    :raises ValueError: If the code is unknown
+    """
+    if code == _NO_RNG:
+        return None, offset
+    if code == _COUNTER_RNG:
+        (seed,) = _COUNTER_SEED.unpack_from(view, offset)
+        counter, offset = _decode_varint(view, offset + _COUNTER_SEED.size)
+        return (seed, counter), offset
+    if code == _MERSENNE_RNG:
+        words = _MERSENNE_WORDS.unpack_from(view, offset)
+        offset += _MERSENNE_WORDS.size
+        gauss = None
+        if view[offset]:
+            (gauss,) = _GAUSS.unpack_from(view, offset + 1)
+            offset += _GAUSS.size
+        return (_MERSENNE_VERSION, words, gauss), offset + 1
+    raise ValueError(f"Unknown generator code: {code}")
+
+
+def _encode_varint(value: int) -> bytes:
+    """Encodes a non-negative integer 7 bits per byte, lowest bits first."""
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append(value & 0x7F | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _decode_varint(view: memoryview, offset: int) -> tuple[int, int]:
+    """
+    Decodes an integer written by _encode_varint.
+
+    :return: Value and the position right after it
+    :raises IndexError: If the buffer ends inside the integer
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = view[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _to_tuples(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_to_tuples(item) for item in value)
+    return value
@@ -0,0 +1,243 @@
+import time
+
+from src.domain.dataclasses_.game_result import GameState
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.move_tables import MoveTables
+from src.domain.enums_.move_direction import MoveDirection
+from src.presentation.ai.heuristic import RowHeuristic
+
+
+class _SearchTimeout(Exception):
+    """Raised inside the search when the time budget of a move is exhausted."""
+
+
+class ExpectimaxMovePolicy:
+    """
+    Chooses moves with an expectimax search over packed 4×4 boards.
+
+    Player nodes take the best of the four moves, chance nodes average over
+    every empty cell receiving a 2 or a 4 with the spawn probabilities used
+    by TileSpawner. The search is bounded by:
+    - depth: number of player moves to look ahead (iterative deepening up to
+      ``max_depth``),
+    - time: deepening stops once ``time_budget`` seconds are spent, the move
+      of the last fully searched depth is played,
+    - probability: branches less likely than ``probability_cutoff`` are
+      evaluated statically instead of being expanded.
+
+    Evaluated chance nodes are memoized in a transposition table keyed on the
+    packed board itself, cleared before every move and whenever it reaches
+    ``table_size`` entries.
+    """
+
+    def __init__(
+        self,
+        move_tables: MoveTables,
+        heuristic: RowHeuristic | None = None,
+        max_depth: int = 3,
+        time_budget: float | None = 0.04,
+        probability_cutoff: float = 1e-4,
+        table_size: int = 1 << 18,
+        tile2_spawn_chance: float | None = None,
+    ) -> None:
+        """
+        :param move_tables: Precomputed row moves
+        :param heuristic: Static board evaluation, a default one is created if omitted
+        :param max_depth: Maximal number of player moves to look ahead (≥1)
+        :param time_budget: Seconds allowed per move, None for no limit
+        :param probability_cutoff: Branches less likely than this are not expanded
+        :param table_size: Maximal number of transposition table entries
+        :param tile2_spawn_chance: Probability of spawning a 2 (must match the spawner)
+        :raises ValueError: If max_depth is less than 1
+        """
+        if max_depth < 1:
+            raise ValueError("max_depth must be at least 1")
+
+        self._move_tables = move_tables
+        self._heuristic = heuristic or RowHeuristic()
+        self._max_depth = max_depth
+        self._time_budget = time_budget
+        self._probability_cutoff = probability_cutoff
+        self._table_size = table_size
+        self._tile2_chance = tile2_spawn_chance or 0.9
+        self._table: dict[int, tuple[int, float]] = {}
+        self._deadline: float | None = None
+
+    def choose_move(self, game_state: GameState) -> MoveDirection:
+        """
+        Searches the best move for the given game state.
+
+        :param game_state: Current state of a 4×4 game
+        :return: Move with the highest expected evaluation
+        """
+        return self.choose_move_for_cells(
+            BitBoard.from_tiles(game_state.tiles).get_cells()
+        )
+
+    def choose_move_for_cells(self, cells: int) -> MoveDirection:
+        """
+        Searches the best move for a packed 4×4 board.
+
+        :param cells: Packed board
+        :return: Move with the highest expected evaluation (UP if no move is legal)
+        """
+        successors = [
+            (direction, moved)
+            for direction, moved in self._get_successors(cells)
+            if moved != cells
+        ]
+        if not successors:
+            return MoveDirection.UP
+
+        self._table.clear()
+        self._deadline = None
+        started = time.perf_counter()
+        best_direction = successors[0][0]
+
+        for depth in range(1, self._max_depth + 1):
+            try:
+                best_direction = self._search_root(successors, depth)
+            except _SearchTimeout:
+                break
+            if self._time_budget is not None:
+                # depth 1 always completes, deeper searches obey the deadline
+                self._deadline = started + self._time_budget
+                if time.perf_counter() >= self._deadline:
+                    break
+
+        return best_direction
+
+    def _search_root(
+        self, successors: list[tuple[MoveDirection, int]], depth: int
+    ) -> MoveDirection:
+        """
+        Evaluates every legal first move to the given depth.
+
+        :param successors: Legal moves with their resulting boards
+        :param depth: Number of player moves to look ahead
+        :return: Best move
+        """
+        best_direction = successors[0][0]
+        best_value = -1.0
+        for direction, moved in successors:
+            value = self._chance(moved, depth - 1, 1.0)
+            if value > best_value:
+                best_direction, best_value = direction, value
+        return best_direction
+
+    def _chance(self, cells: int, depth: int, probability: float) -> float:
+        """
+        Expected value of a board on which a new tile is about to spawn.
+
+        :param cells: Packed board
+        :param depth: Player moves left to search
+        :param probability: Probability of reaching this node
+        :return: Expected evaluation
+        """
+        if depth == 0 or probability < self._probability_cutoff:
+            return self._heuristic.evaluate(cells)
+
+        cached = self._table.get(cells)
+        if cached is not None and cached[0] >= depth:
+            return cached[1]
+
+        empty_shifts = [
+            shift
+            for shift in range(0, 64, BitBoard.CELL_BITS)
+            if not (cells >> shift) & 0xF
+        ]
+        if not empty_shifts:
+            return self._heuristic.evaluate(cells)
+
+        tile2_chance = self._tile2_chance
+        tile4_chance = 1.0 - tile2_chance
+        cell_probability = probability / len(empty_shifts)
+        total = 0.0
+        for shift in empty_shifts:
+            total += tile2_chance * self._max(
+                cells | (1 << shift), depth, cell_probability * tile2_chance
+            )
+            total += tile4_chance * self._max(
+                cells | (2 << shift), depth, cell_probability * tile4_chance
+            )
+        value = total / len(empty_shifts)
+
+        if len(self._table) >= self._table_size:
+            self._table.clear()
+        self._table[cells] = (depth, value)
+        return value
+
+    def _max(self, cells: int, depth: int, probability: float) -> float:
+        """
+        Value of a board on which the player is about to move.
+
+        :param cells: Packed board
+        :param depth: Player moves left to search (including this one)
+        :param probability: Probability of reaching this node
+        :return: Evaluation of the best move, 0 if the game is lost
+        """
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise _SearchTimeout
+
+        best = 0.0
+        for _, moved in self._get_successors(cells):
+            if moved != cells:
+                value = self._chance(moved, depth - 1, probability)
+                if value > best:
+                    best = value
+        return best
+
+    def _get_successors(self, cells: int) -> list[tuple[MoveDirection, int]]:
+        """
+        Moves the board in all four directions (scores are not needed).
+
+        :param cells: Packed board
+        :return: Direction and resulting board for UP, DOWN, LEFT, RIGHT
+        """
+        left = self._move_tables.left_rows
+        right = self._move_tables.right_rows
+        transposed = BitBoard.transpose(cells, MoveTables.ROW_CELLS)
+
+        rows = (
+            cells & 0xFFFF,
+            (cells >> 16) & 0xFFFF,
+            (cells >> 32) & 0xFFFF,
+            cells >> 48,
+        )
+        columns = (
+            transposed & 0xFFFF,
+            (transposed >> 16) & 0xFFFF,
+            (transposed >> 32) & 0xFFFF,
+            transposed >> 48,
+        )
+
+        up = (
+            left[columns[0]]
+            | left[columns[1]] << 16
+            | left[columns[2]] << 32
+            | left[columns[3]] << 48
+        )
+        down = (
+            right[columns[0]]
+            | right[columns[1]] << 16
+            | right[columns[2]] << 32
+            | right[columns[3]] << 48
+        )
+        return [
+            (MoveDirection.UP, BitBoard.transpose(up, MoveTables.ROW_CELLS)),
+            (MoveDirection.DOWN, BitBoard.transpose(down, MoveTables.ROW_CELLS)),
+            (
+                MoveDirection.LEFT,
+                left[rows[0]]
+                | left[rows[1]] << 16
+                | left[rows[2]] << 32
+                | left[rows[3]] << 48,
+            ),
+            (
+                MoveDirection.RIGHT,
+                right[rows[0]]
+                | right[rows[1]] << 16
+                | right[rows[2]] << 32
+                | right[rows[3]] << 48,
+            ),
+        ]
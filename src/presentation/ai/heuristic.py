@@ -0,0 +1,108 @@
+from typing import ClassVar
+
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.move_tables import MoveTables
+
+
+class RowHeuristic:
+    """
+    Static evaluation of packed 4×4 boards for search-based policies.
+
+    Every row and every column is scored independently and the scores are
+    summed, so the evaluation of all 65536 possible rows is tabulated once
+    (lazily, on first use). A row is rewarded for empty cells, pending
+    merges and monotonic ordering, and penalized for large scattered tiles.
+
+    The row table only depends on the weights below, so it is shared by all
+    instances.
+    """
+
+    _LOST_PENALTY = 200000.0
+    _MONOTONICITY_POWER = 4.0
+    _MONOTONICITY_WEIGHT = 47.0
+    _SUM_POWER = 3.5
+    _SUM_WEIGHT = 11.0
+    _MERGES_WEIGHT = 700.0
+    _EMPTY_WEIGHT = 270.0
+
+    _row_scores: ClassVar[list[float] | None] = None
+
+    def evaluate(self, cells: int) -> float:
+        """
+        Scores a packed 4×4 board, higher is better.
+
+        :param cells: Packed board
+        :return: Heuristic value of the board
+        """
+        scores = RowHeuristic._row_scores
+        if scores is None:
+            scores = RowHeuristic._row_scores = self._build()
+
+        transposed = BitBoard.transpose(cells, MoveTables.ROW_CELLS)
+        return (
+            scores[cells & 0xFFFF]
+            + scores[(cells >> 16) & 0xFFFF]
+            + scores[(cells >> 32) & 0xFFFF]
+            + scores[cells >> 48]
+            + scores[transposed & 0xFFFF]
+            + scores[(transposed >> 16) & 0xFFFF]
+            + scores[(transposed >> 32) & 0xFFFF]
+            + scores[transposed >> 48]
+        )
+
+    def _build(self) -> list[float]:
+        """
+        Evaluates every possible packed row.
+
+        :return: Heuristic value indexed by the packed row
+        """
+        return [self._evaluate_row(row) for row in range(MoveTables.ROWS_QTY)]
+
+    def _evaluate_row(self, row: int) -> float:
+        """
+        Scores a single packed row.
+
+        :param row: Packed row, column 0 in the lowest nibble
+        :return: Heuristic value of the row
+        """
+        line = [
+            (row >> (idx * BitBoard.CELL_BITS)) & BitBoard.CELL_MASK
+            for idx in range(MoveTables.ROW_CELLS)
+        ]
+
+        tiles_sum = 0.0
+        empty = 0
+        merges = 0
+        previous = 0
+        equal_run = 0
+        for exponent in line:
+            tiles_sum += exponent**self._SUM_POWER
+            if exponent == 0:
+                empty += 1
+                continue
+            if exponent == previous:
+                equal_run += 1
+            elif equal_run > 0:
+                merges += 1 + equal_run
+                equal_run = 0
+            previous = exponent
+        if equal_run > 0:
+            merges += 1 + equal_run
+
+        monotonicity_left = 0.0
+        monotonicity_right = 0.0
+        for idx in range(1, MoveTables.ROW_CELLS):
+            before = line[idx - 1] ** self._MONOTONICITY_POWER
+            after = line[idx] ** self._MONOTONICITY_POWER
+            if line[idx - 1] > line[idx]:
+                monotonicity_left += before - after
+            else:
+                monotonicity_right += after - before
+
+        return (
+            self._LOST_PENALTY
+            + self._EMPTY_WEIGHT * empty
+            + self._MERGES_WEIGHT * merges
+            - self._MONOTONICITY_WEIGHT * min(monotonicity_left, monotonicity_right)
+            - self._SUM_WEIGHT * tiles_sum
+        )
@@ -0,0 +1,214 @@
+import random
+import threading
+import time
+from concurrent.futures import Executor, wait
+from dataclasses import dataclass
+
+from src.domain.dataclasses_.game_result import GameState
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.move_tables import MoveTables
+from src.domain.enums_.move_direction import MoveDirection
+from src.presentation.ai.rollout import RolloutEngine
+
+
+@dataclass(frozen=True)
+class RolloutTask:
+    """
+    A batch of rollouts from one board, executed by a single worker.
+
+    ``deadline`` is wall-clock time (time.time) so that it means the same
+    moment in every worker process.
+    """
+
+    move_tables: MoveTables
+    cells: int
+    rollouts: int
+    seed: int
+    deadline: float | None
+    tile2_spawn_chance: float | None
+    max_moves: int | None
+
+
+_worker_state = threading.local()
+
+
+def run_rollouts(task: RolloutTask) -> tuple[int, int]:
+    """
+    Plays the rollouts of a task, stopping early once the deadline passes.
+    At least one rollout is always played.
+
+    The RolloutEngine is created once per worker thread (or process) and
+    reused by every following task.
+
+    :param task: Rollouts to play
+    :return: Total score of the played rollouts and their number
+    """
+    engine: RolloutEngine | None = getattr(_worker_state, "engine", None)
+    if engine is None:
+        engine = _worker_state.engine = RolloutEngine(
+            move_tables=task.move_tables,
+            tile2_spawn_chance=task.tile2_spawn_chance,
+            max_moves=task.max_moves,
+        )
+    engine.reset(
+        seed=task.seed,
+        tile2_spawn_chance=task.tile2_spawn_chance,
+        max_moves=task.max_moves,
+    )
+
+    total = 0
+    played = 0
+    while played < task.rollouts:
+        total += engine.play(task.cells)
+        played += 1
+        if task.deadline is not None and time.time() >= task.deadline:
+            break
+    return total, played
+
+
+class MonteCarloMovePolicy:
+    """
+    Chooses moves by random rollouts: for every legal move, ``rollouts``
+    random games are played to the end from the resulting board and the move
+    with the highest mean final score wins.
+
+    Rollouts of each move are split into ``tasks_per_move`` tasks. Without an
+    executor they run in the calling thread; with a ThreadPoolExecutor or
+    ProcessPoolExecutor they run concurrently. All tasks of a decision share
+    one deadline (``time_budget``): tasks still queued when it passes are
+    cancelled and running ones are not waited for, so no decision takes
+    longer than the budget.
+    """
+
+    def __init__(
+        self,
+        move_tables: MoveTables,
+        rollouts: int = 50,
+        time_budget: float | None = None,
+        executor: Executor | None = None,
+        tasks_per_move: int = 1,
+        seed: int | None = None,
+        tile2_spawn_chance: float | None = None,
+        max_rollout_moves: int | None = None,
+    ) -> None:
+        """
+        :param move_tables: Precomputed row moves
+        :param rollouts: Rollouts per legal move (K)
+        :param time_budget: Seconds allowed per decision, None for no limit
+        :param executor: Pool running the rollout tasks, None to run them inline
+        :param tasks_per_move: Number of tasks the rollouts of a move are split into
+        :param seed: Seed of the policy random generator
+        :param tile2_spawn_chance: Probability of spawning a 2 (must match the spawner)
+        :param max_rollout_moves: Move limit of a single rollout, None for no limit
+        :raises ValueError: If rollouts or tasks_per_move is not positive
+        """
+        if rollouts < 1 or tasks_per_move < 1:
+            raise ValueError("rollouts and tasks_per_move must be positive")
+
+        self._move_tables = move_tables
+        self._rollouts = rollouts
+        self._time_budget = time_budget
+        self._executor = executor
+        self._tasks_per_move = min(tasks_per_move, rollouts)
+        self._random = random.Random(seed)
+        self._tile2_spawn_chance = tile2_spawn_chance
+        self._max_rollout_moves = max_rollout_moves
+
+    def choose_move(self, game_state: GameState) -> MoveDirection:
+        """
+        Picks the move with the best mean rollout score.
+
+        :param game_state: Current state of a 4×4 game
+        :return: Chosen move direction
+        """
+        return self.choose_move_for_cells(
+            BitBoard.from_tiles(game_state.tiles).get_cells()
+        )
+
+    def choose_move_for_cells(self, cells: int) -> MoveDirection:
+        """
+        Picks the move with the best mean rollout score for a packed board.
+
+        :param cells: Packed 4×4 board
+        :return: Chosen move direction (UP if no move is legal)
+        """
+        candidates: list[tuple[MoveDirection, int, int]] = []
+        for direction in MoveDirection:
+            moved, gained = self._move_tables.move(cells, direction)
+            if moved != cells:
+                candidates.append((direction, moved, gained))
+        if not candidates:
+            return MoveDirection.UP
+        if len(candidates) == 1:
+            return candidates[0][0]
+
+        deadline = (
+            time.time() + self._time_budget if self._time_budget is not None else None
+        )
+        tasks = [
+            (idx, self._create_task(moved, rollouts, deadline))
+            for idx, (_, moved, _) in enumerate(candidates)
+            for rollouts in self._split_rollouts()
+        ]
+
+        totals = [0] * len(candidates)
+        played = [0] * len(candidates)
+        for idx, (total, count) in self._run_tasks(tasks, deadline):
+            totals[idx] += total
+            played[idx] += count
+
+        best_direction = candidates[0][0]
+        best_mean = -1.0
+        for idx, (direction, _, gained) in enumerate(candidates):
+            if not played[idx]:
+                continue
+            mean = gained + totals[idx] / played[idx]
+            if mean > best_mean:
+                best_direction, best_mean = direction, mean
+        return best_direction
+
+    def _split_rollouts(self) -> list[int]:
+        """
+        Splits the rollouts of one move into nearly equal task sizes.
+
+        :return: Number of rollouts of every task
+        """
+        base, extra = divmod(self._rollouts, self._tasks_per_move)
+        return [base + (1 if idx < extra else 0) for idx in range(self._tasks_per_move)]
+
+    def _create_task(
+        self, cells: int, rollouts: int, deadline: float | None
+    ) -> RolloutTask:
+        return RolloutTask(
+            move_tables=self._move_tables,
+            cells=cells,
+            rollouts=rollouts,
+            seed=self._random.getrandbits(64),
+            deadline=deadline,
+            tile2_spawn_chance=self._tile2_spawn_chance,
+            max_moves=self._max_rollout_moves,
+        )
+
+    def _run_tasks(
+        self, tasks: list[tuple[int, RolloutTask]], deadline: float | None
+    ) -> list[tuple[int, tuple[int, int]]]:
+        """
+        Executes rollout tasks inline or on the executor, respecting the deadline.
+
+        :param tasks: Candidate index and task pairs
+        :param deadline: time.time() by which the decision must be made, None
+               for no limit; tasks still running then are abandoned
+        :return: Candidate index and (total score, rollouts played) of every
+                 finished task
+        """
+        if self._executor is None:
+            return [(idx, run_rollouts(task)) for idx, task in tasks]
+
+        futures = {
+            self._executor.submit(run_rollouts, task): idx for idx, task in tasks
+        }
+        timeout = None if deadline is None else max(0.0, deadline - time.time())
+        done, not_done = wait(futures, timeout=timeout)
+        for future in not_done:
+            future.cancel()
+        return [(futures[future], future.result()) for future in done]
@@ -0,0 +1,55 @@
+from src.application.ports.move_policy import IMovePolicy
+from src.domain.dataclasses_.game_result import GameState
+from src.domain.dataclasses_.position_record import PositionRecord
+from src.domain.entities.bit_board import BitBoard
+from src.domain.enums_.move_direction import MoveDirection
+
+
+class PositionRecordingPolicy:
+    """
+    Wraps another policy and remembers every position it was asked about
+    together with the chosen move, so that the played game can be turned
+    into training samples.
+
+    The score earned by a move is only known from the next position (or
+    from the final score for the last move), so records are built once the
+    game is over.
+    """
+
+    def __init__(self, policy: IMovePolicy) -> None:
+        """
+        :param policy: Policy actually choosing the moves
+        """
+        self._policy = policy
+        self._positions: list[tuple[int, MoveDirection, int]] = []
+
+    def choose_move(self, game_state: GameState) -> MoveDirection:
+        """
+        Delegates the decision and records the position and the move.
+
+        :param game_state: Current state of the game
+        :return: Move chosen by the wrapped policy
+        """
+        move = self._policy.choose_move(game_state)
+        cells = BitBoard.from_tiles(game_state.tiles).get_cells()
+        self._positions.append((cells, move, game_state.score))
+        return move
+
+    def get_records(self, final_score: int) -> list[PositionRecord]:
+        """
+        Builds the samples of the recorded positions.
+
+        :param final_score: Score of the game after the last move
+        :return: Records in the order the moves were played
+        """
+        scores_after = [score for _, _, score in self._positions[1:]]
+        scores_after.append(final_score)
+        return [
+            PositionRecord(
+                cells=cells,
+                move=move,
+                score_delta=score_after - score,
+                final_score=final_score,
+            )
+            for (cells, move, score), score_after in zip(self._positions, scores_after)
+        ]
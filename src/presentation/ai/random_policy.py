@@ -0,0 +1,25 @@
+import random
+
+from src.domain.dataclasses_.game_result import GameState
+from src.domain.enums_.move_direction import MoveDirection
+
+
+class RandomMovePolicy:
+    """Plays uniformly random moves. Useful as a baseline and for load testing."""
+
+    _MOVES = tuple(MoveDirection)
+
+    def __init__(self, seed: int | None = None) -> None:
+        """
+        :param seed: Seed of the policy's own random generator
+        """
+        self._random = random.Random(seed)
+
+    def choose_move(self, game_state: GameState) -> MoveDirection:
+        """
+        Picks one of the four directions at random, ignoring the board.
+
+        :param game_state: Current state of the game
+        :return: Random move direction
+        """
+        return self._random.choice(self._MOVES)
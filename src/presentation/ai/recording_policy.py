@@ -0,0 +1,36 @@
+from src.application.ports.move_policy import IMovePolicy
+from src.domain.dataclasses_.game_result import GameState
+from src.domain.enums_.move_direction import MoveDirection
+
+
+class RecordingMovePolicy:
+    """
+    Wraps another policy and remembers every move it chooses, so that the
+    played game can be stored as a replay.
+    """
+
+    def __init__(self, policy: IMovePolicy) -> None:
+        """
+        :param policy: Policy actually choosing the moves
+        """
+        self._policy = policy
+        self._moves: list[MoveDirection] = []
+
+    def choose_move(self, game_state: GameState) -> MoveDirection:
+        """
+        Delegates the decision and records it.
+
+        :param game_state: Current state of the game
+        :return: Move chosen by the wrapped policy
+        """
+        move = self._policy.choose_move(game_state)
+        self._moves.append(move)
+        return move
+
+    def get_moves(self) -> tuple[MoveDirection, ...]:
+        """
+        Returns all moves chosen so far.
+
+        :return: Moves in the order they were played
+        """
+        return tuple(self._moves)
@@ -0,0 +1,114 @@
+import random
+
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.move_tables import MoveTables
+
+
+class RolloutEngine:
+    """
+    Plays random games to the end on packed 4×4 boards.
+
+    The whole game state of a rollout is a single integer, so starting a
+    rollout costs nothing: no Game, Board or Tile objects are created and
+    nothing is copied. One engine (with its own random generator) is meant
+    to be reused for any number of rollouts.
+    """
+
+    _LOW_BITS = 0x1111_1111_1111_1111
+
+    def __init__(
+        self,
+        move_tables: MoveTables,
+        seed: int | None = None,
+        tile2_spawn_chance: float | None = None,
+        max_moves: int | None = None,
+    ) -> None:
+        """
+        :param move_tables: Precomputed row moves
+        :param seed: Seed of the rollout random generator
+        :param tile2_spawn_chance: Probability of spawning a 2 instead of a 4
+        :param max_moves: Stop a rollout after this many moves, None for no limit
+        """
+        self._move_tables = move_tables
+        self._random = random.Random(seed)
+        self._tile2_chance = tile2_spawn_chance or 0.9
+        self._max_moves = max_moves
+
+    def reset(
+        self,
+        seed: int | None = None,
+        tile2_spawn_chance: float | None = None,
+        max_moves: int | None = None,
+    ) -> None:
+        """
+        Reseeds the engine and replaces its settings, keeping the move tables.
+
+        :param seed: Seed of the rollout random generator
+        :param tile2_spawn_chance: Probability of spawning a 2 instead of a 4
+        :param max_moves: Stop a rollout after this many moves, None for no limit
+        """
+        self._random.seed(seed)
+        self._tile2_chance = tile2_spawn_chance or 0.9
+        self._max_moves = max_moves
+
+    def play(self, cells: int) -> int:
+        """
+        Spawns a tile on the board and plays uniformly random legal moves
+        until no move is left.
+
+        :param cells: Packed board right after a player move
+        :return: Score gained during the rollout
+        """
+        left = self._move_tables.left_rows
+        right = self._move_tables.right_rows
+        left_scores = self._move_tables.left_scores
+        right_scores = self._move_tables.right_scores
+        rng = self._random
+        transpose = BitBoard.transpose
+
+        score = 0
+        moves = 0
+        while self._max_moves is None or moves < self._max_moves:
+            cells = self._spawn(cells)
+            transposed = transpose(cells, 4)
+
+            legal: list[tuple[int, int]] = []
+            for board, vertical in ((cells, False), (transposed, True)):
+                row0 = board & 0xFFFF
+                row1 = (board >> 16) & 0xFFFF
+                row2 = (board >> 32) & 0xFFFF
+                row3 = board >> 48
+                for rows, scores in ((left, left_scores), (right, right_scores)):
+                    moved = (
+                        rows[row0]
+                        | rows[row1] << 16
+                        | rows[row2] << 32
+                        | rows[row3] << 48
+                    )
+                    if moved == board:
+                        continue
+                    gained = scores[row0] + scores[row1] + scores[row2] + scores[row3]
+                    legal.append((transpose(moved, 4) if vertical else moved, gained))
+
+            if not legal:
+                break
+            cells, gained = legal[rng.randrange(len(legal))]
+            score += gained
+            moves += 1
+
+        return score
+
+    def _spawn(self, cells: int) -> int:
+        """
+        Places a 2 (or a 4) on a random empty cell.
+
+        :param cells: Packed board with at least one empty cell
+        :return: Packed board with the new tile
+        """
+        occupied = cells | (cells >> 1)
+        occupied |= occupied >> 2
+        empty = ~occupied & self._LOW_BITS
+        exponent = 1 if self._random.random() < self._tile2_chance else 2
+        for _ in range(self._random.randrange(empty.bit_count())):
+            empty &= empty - 1
+        return cells | exponent << ((empty & -empty).bit_length() - 1)
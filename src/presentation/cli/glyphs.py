@@ -0,0 +1,41 @@
+from collections.abc import Callable
+from functools import cache
+
+from src.domain.enums_.tile_value import TileValue
+
+TileGlyph = tuple[str, str, str]
+"""Fully styled top, middle and bottom lines of a rendered tile."""
+
+
+@cache
+def get_tile_glyphs(
+    tile_width: int,
+    color_scheme: Callable[[int], str],
+    default_color: str,
+) -> dict[int, TileGlyph]:
+    """
+    Renders every possible tile once.
+
+    Results are cached per (tile_width, color_scheme, default_color), so all
+    views with the same look share one table and a frame only does a lookup
+    per tile, with no formatting or color resolution.
+
+    :param tile_width: Width of each tile in characters
+    :param color_scheme: Maps a tile value to its ANSI color code
+           (e.g. TileColor.get_color)
+    :param default_color: ANSI reset color code
+    :return: Glyph of every tile value, blank lines for an empty tile
+    """
+    glyphs: dict[int, TileGlyph] = {
+        TileValue.ZERO: (" " * (tile_width + 2),) * 3,
+    }
+    for value in TileValue:
+        if value is TileValue.ZERO:
+            continue
+        color = color_scheme(value)
+        glyphs[value] = (
+            f"{color}┌{'─' * tile_width}┐{default_color}",
+            f"{color}│{value:^{tile_width}}│{default_color}",
+            f"{color}└{'─' * tile_width}┘{default_color}",
+        )
+    return glyphs
@@ -0,0 +1,143 @@
+import atexit
+import os
+import select
+import sys
+import termios
+import tty
+from collections import deque
+from typing import Any
+
+from src.domain.enums_.game_command import GameCommand
+from src.domain.enums_.move_direction import MoveDirection
+
+
+class RawInputReader:
+    """
+    Reads arrow keys from a terminal kept in raw mode for the whole session.
+
+    Raw mode is entered once, on the first read, and restored by close (also
+    registered with atexit). Input is read with select and os.read in
+    chunks, so every key already typed is fetched with one system call.
+    All complete escape sequences in the buffer are decoded at once, and the
+    moves are queued: held-down arrow keys are processed at full speed and
+    keys typed while a frame is drawn are not lost.
+
+    Both CSI (``ESC [ A``) and SS3 (``ESC O A``) arrow sequences are
+    recognized, as well as ``u`` (undo) and ``r`` (redo); other keys are
+    ignored. A lone Escape (no sequence following
+    within ``escape_timeout``) is discarded.
+
+    Unix only: relies on termios and select on a file descriptor.
+    """
+
+    _CTRL_C = 0x03
+    _ESCAPE = 0x1B
+    _SEQUENCE_LEN = 3
+    _READ_SIZE = 1024
+    _MOVES = {
+        prefix + key: move
+        for prefix in (b"\x1b[", b"\x1bO")
+        for key, move in (
+            (b"A", MoveDirection.UP),
+            (b"B", MoveDirection.DOWN),
+            (b"C", MoveDirection.RIGHT),
+            (b"D", MoveDirection.LEFT),
+        )
+    }
+    _COMMANDS = {
+        ord(key): command
+        for keys, command in (("uU", GameCommand.UNDO), ("rR", GameCommand.REDO))
+        for key in keys
+    }
+
+    def __init__(self, fd: int | None = None, escape_timeout: float = 0.05) -> None:
+        """
+        :param fd: File descriptor to read from, stdin if omitted
+        :param escape_timeout: Seconds to wait for the rest of an escape sequence
+        """
+        self._fd = fd
+        self._escape_timeout = escape_timeout
+        self._buffer = bytearray()
+        self._moves: deque[MoveDirection | GameCommand] = deque()
+        self._saved_settings: list[Any] | None = None
+        self._opened = False
+
+    def open(self) -> None:
+        """
+        Switches the terminal to raw mode (a no-op for non-terminal input
+        and when already open).
+        """
+        if self._opened:
+            return
+        self._opened = True
+        fd = self._get_fd()
+        if os.isatty(fd):
+            self._saved_settings = termios.tcgetattr(fd)
+            tty.setraw(fd)
+            atexit.register(self.close)
+
+    def close(self) -> None:
+        """Restores the original terminal settings."""
+        if self._saved_settings is not None:
+            termios.tcsetattr(self._get_fd(), termios.TCSADRAIN, self._saved_settings)
+            self._saved_settings = None
+        self._opened = False
+
+    def read_move(self) -> MoveDirection | GameCommand:
+        """
+        Returns the next queued move, waiting for input if there is none.
+
+        :return: Move (or command) of the oldest unprocessed key
+        :raises KeyboardInterrupt: When Ctrl+C is pressed
+        :raises EOFError: When the input is closed
+        """
+        self.open()
+        fd = self._get_fd()
+        while not self._moves:
+            timeout = self._escape_timeout if self._buffer else None
+            ready, _, _ = select.select([fd], [], [], timeout)
+            if not ready:
+                # the escape sequence never completed: it was the Escape key
+                del self._buffer[:1]
+            else:
+                data = os.read(fd, self._READ_SIZE)
+                if not data:
+                    raise EOFError("Input closed")
+                self._buffer += data
+            self._decode()
+        return self._moves.popleft()
+
+    def _decode(self) -> None:
+        """
+        Moves every complete arrow sequence and command key from the buffer
+        to the queue, keeping an incomplete trailing sequence for the next
+        read.
+
+        :raises KeyboardInterrupt: When the buffer contains Ctrl+C
+        """
+        buffer = self._buffer
+        idx = 0
+        while idx < len(buffer):
+            byte = buffer[idx]
+            if byte == self._CTRL_C:
+                buffer.clear()
+                self._moves.clear()
+                raise KeyboardInterrupt("Exit")
+            if byte != self._ESCAPE:
+                command = self._COMMANDS.get(byte)
+                if command is not None:
+                    self._moves.append(command)
+                idx += 1
+                continue
+            if len(buffer) - idx < self._SEQUENCE_LEN:
+                break
+            move = self._MOVES.get(bytes(buffer[idx : idx + self._SEQUENCE_LEN]))
+            if move is None:
+                idx += 1
+                continue
+            self._moves.append(move)
+            idx += self._SEQUENCE_LEN
+        del buffer[:idx]
+
+    def _get_fd(self) -> int:
+        return self._fd if self._fd is not None else sys.stdin.fileno()
@@ -1,3 +1,6 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
 from dataclasses import dataclass
 from enum import Enum
 
@@ -6,7 +9,7 @@ from enum import Enum
 class PresenterOutput:
     """Container for all data required to render the 2048 game in a command-line interface."""
 
-    tiles: list[list[str]]
+    tiles: Sequence[Sequence[int]]
     score: str
     message: str
 
@@ -43,16 +46,19 @@ class TileColor(Enum):
         :param value: Numeric tile value (2, 4, 8, ..., 2048)
         :return: Corresponding ANSI color code string, default reset code if not found
         """
-        return {
-            2: cls.TWO.value,
-            4: cls.FOUR.value,
-            8: cls.EIGHT.value,
-            16: cls.SIXTEEN.value,
-            32: cls.THIRTYTWO.value,
-            64: cls.SIXTYFOUR.value,
-            128: cls.ONETWOEIGHT.value,
-            256: cls.TWOFIVESIX.value,
-            512: cls.FIVEONETWO.value,
-            1024: cls.TENTWENTY4.value,
-            2048: cls.TWENTY48.value,
-        }.get(value, cls.EMPTY.value)
+        return _COLORS_BY_VALUE.get(value, cls.EMPTY.value)
+
+
+_COLORS_BY_VALUE: dict[int, str] = {
+    2: TileColor.TWO.value,
+    4: TileColor.FOUR.value,
+    8: TileColor.EIGHT.value,
+    16: TileColor.SIXTEEN.value,
+    32: TileColor.THIRTYTWO.value,
+    64: TileColor.SIXTYFOUR.value,
+    128: TileColor.ONETWOEIGHT.value,
+    256: TileColor.TWOFIVESIX.value,
+    512: TileColor.FIVEONETWO.value,
+    1024: TileColor.TENTWENTY4.value,
+    2048: TileColor.TWENTY48.value,
+}
@@ -2,7 +2,6 @@ from src.application.ports.presenter_output import IPresenterOutput
 from src.domain.dataclasses_.game_result import GameState
 from src.domain.enums_.game_result import GameResult
 from src.domain.enums_.game_status import GameStatus
-from src.domain.enums_.tile_value import TileValue
 from src.presentation.cli.models import PresenterOutput
 
 
@@ -37,13 +36,8 @@ class CliPresenter:
         :param game_state: Current game state
         :return: Formatted tiles, score and message
         """
-        formatted_board = []
-
-        for row in game_state.tiles:
-            formatted_row = [
-                str(tile.value) if tile.value != TileValue.ZERO else "" for tile in row
-            ]
-            formatted_board.append(formatted_row)
+        # numeric values only, the view owns their (cached) formatting
+        formatted_board = [[tile.value for tile in row] for row in game_state.tiles]
 
         message = self._in_progress_message
         if game_state.status == GameStatus.COMPLETED:
@@ -0,0 +1,76 @@
+import sys
+from typing import TextIO
+
+Frame = dict[tuple[int, int], str]
+"""Screen content: styled text keyed by its 1-based (row, column) position."""
+
+
+class TerminalRenderer:
+    """
+    Draws frames on an ANSI terminal, sending only what changed.
+
+    A frame is a set of text spans placed at fixed screen positions (e.g.
+    one span per tile component). The previous frame is kept, and every
+    following frame is compared with it span by span: only changed spans are
+    written, each prefixed with a cursor-addressing escape. The whole update
+    is built in one buffer and written with a single write and flush.
+
+    The screen is cleared and fully redrawn only for the first frame and
+    whenever the layout (the set of span positions) changes.
+    """
+
+    _CLEAR = "\033[H\033[J"
+
+    def __init__(self, stream: TextIO | None = None) -> None:
+        """
+        :param stream: Output terminal stream, sys.stdout (looked up on every
+               write) if omitted
+        """
+        self._stream = stream
+        self._previous: Frame | None = None
+
+    def render(self, frame: Frame) -> int:
+        """
+        Brings the screen from the previous frame to the given one.
+
+        Spans with varying length should end with an erase-line escape
+        (``\\033[K``) so that a shorter text does not leave old characters
+        behind.
+
+        :param frame: Complete new frame
+        :return: Number of characters written (0 if nothing changed)
+        """
+        previous = self._previous
+        if previous is None or previous.keys() != frame.keys():
+            parts = [self._CLEAR]
+            changed = sorted(frame)
+        else:
+            parts = []
+            changed = sorted(
+                position
+                for position, text in frame.items()
+                if previous[position] != text
+            )
+        self._previous = dict(frame)
+
+        if not changed:
+            return 0
+
+        for row, col in changed:
+            parts.append(f"\033[{row};{col}H")
+            parts.append(frame[row, col])
+        # park the cursor below the frame, where any other output belongs
+        parts.append(f"\033[{max(row for row, _ in frame) + 1};1H")
+
+        output = "".join(parts)
+        stream = self._stream or sys.stdout
+        stream.write(output)
+        stream.flush()
+        return len(output)
+
+    def invalidate(self) -> None:
+        """
+        Forgets the previous frame, so the next one is drawn from scratch
+        (e.g. after something else has written to the terminal).
+        """
+        self._previous = None
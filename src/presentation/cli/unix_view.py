@@ -1,10 +1,13 @@
 import sys
-import termios
-import tty
+from collections.abc import Callable
 
 from src.application.ports.presenter_output import IPresenterOutput
+from src.domain.enums_.game_command import GameCommand
 from src.domain.enums_.move_direction import MoveDirection
+from src.presentation.cli.glyphs import get_tile_glyphs
+from src.presentation.cli.input_reader import RawInputReader
 from src.presentation.cli.models import TileColor
+from src.presentation.cli.renderer import Frame, TerminalRenderer
 
 
 class UnixCliView:
@@ -15,7 +18,8 @@ class UnixCliView:
     Features:
     - Responsive board rendering with customizable tile width
     - ANSI color support for tiles and borders (requires a compatible terminal)
-    - Arrow key input handling (via terminal raw mode)
+    - Arrow key input handling (via terminal raw mode), ``u`` to undo and
+      ``r`` to redo a move
     - Terminal state preservation (resets settings on exit)
 
     Compatibility:
@@ -27,17 +31,24 @@ class UnixCliView:
     _DEFAULT_TILE_WIDTH = 6
     _DEFAULT_COLOR = "\033[0m"
     _DEFAULT_BORDER_COLOR = "\033[0;37m"
+    _ERASE_LINE = "\033[K"
 
     def __init__(
         self,
         tile_width: int = _DEFAULT_TILE_WIDTH,
         default_color: str = _DEFAULT_COLOR,
         border_color: str = _DEFAULT_BORDER_COLOR,
+        renderer: TerminalRenderer | None = None,
+        color_scheme: Callable[[int], str] = TileColor.get_color,
+        input_reader: RawInputReader | None = None,
     ):
         """
         :param tile_width: Minimum width for each tile (≥4)
         :param default_color: ANSI reset color code
         :param border_color: ANSI color code for borders
+        :param renderer: Terminal renderer, a new one writing to stdout if omitted
+        :param color_scheme: Maps a tile value to its ANSI color code
+        :param input_reader: Keyboard reader, a new one reading stdin if omitted
         :raises ValueError: If tile_width is too small
         """
         if tile_width < 4:
@@ -46,6 +57,13 @@ class UnixCliView:
         self._tile_width = tile_width
         self._default_color = default_color
         self._border_color = border_color
+        self._renderer = renderer if renderer is not None else TerminalRenderer()
+        self._glyphs = get_tile_glyphs(tile_width, color_scheme, default_color)
+        self._separator = self._get_separator()
+        self._borders: dict[int, tuple[str, str]] = {}
+        self._input_reader = (
+            input_reader if input_reader is not None else RawInputReader()
+        )
 
     def display(self, data: IPresenterOutput) -> None:
         """
@@ -55,156 +73,103 @@ class UnixCliView:
         - Game board with colored tiles
         - Decorative borders
 
-        :param data: Prepared render data containing tiles, colors, and game info
-        """
-        self._clear_screen()
-        print(data.message, data.score, sep="\n")  # display game info
-
-        dim = len(data.tiles)
-
-        self._display_board_header(dim, self._tile_width)
-
-        for row_i in range(dim):
-            for component in self._get_tile_components(self._tile_width):
-                self._display_separator()
-                for tile in data.tiles[row_i]:
-                    formatted_tile = self._format_tile(tile)
-                    tile_color = self._get_tile_color(tile)
-
-                    self._display_tile_component(
-                        formatted_tile, tile_color, component, self._tile_width
-                    )
-                self._display_separator()
-                print()
-
-            if row_i == dim - 1:
-                self._display_board_footer(dim, self._tile_width)
+        Only the parts that differ from the previous frame reach the terminal.
 
-    def get_next_move(self) -> MoveDirection:
+        :param data: Prepared render data containing tiles, colors, and game info
         """
-        Captures and returns the player's move direction from keyboard input.
-        Continuously polls for input until a valid arrow key is pressed.
-        Handles Ctrl+C interrupt for graceful exit.
+        self._renderer.render(self._build_frame(data))
 
-        :return: Valid move direction from arrow key input
+    def _build_frame(self, data: IPresenterOutput) -> Frame:
         """
-        while True:
-            try:
-                key = self._get_key()
-            except KeyboardInterrupt:
-                print("Bye-bye!")
-                sys.exit(0)
+        Lays out the game interface as screen spans: a span per info line,
+        border line, separator and tile component.
 
-            if key == "\x1b[A":
-                return MoveDirection.UP
-            elif key == "\x1b[B":
-                return MoveDirection.DOWN
-            elif key == "\x1b[C":
-                return MoveDirection.RIGHT
-            elif key == "\x1b[D":
-                return MoveDirection.LEFT
-
-    def _get_key(self) -> str:
+        :param data: Prepared render data containing tiles, colors, and game info
+        :return: Frame for the terminal renderer
         """
-        Reads a single key press from stdin in raw mode, handling escape sequences.
-        Supports arrow keys (returns escape sequences) and interrupts on Ctrl+C.
+        dim = len(data.tiles)
+        cell_width = self._tile_width + 2
+        last_col = 2 + dim * cell_width
+        separator = self._separator
+        header, footer = self._get_borders(dim)
+
+        frame: Frame = {
+            (1, 1): f"{data.message}{self._ERASE_LINE}",
+            (2, 1): f"{data.score}{self._ERASE_LINE}",
+            (3, 1): header,
+        }
+
+        row = 4
+        for tiles_row in data.tiles:
+            glyphs = [self._glyphs[tile] for tile in tiles_row]
+            for component_i in range(3):
+                frame[row, 1] = separator
+                for col_i, glyph in enumerate(glyphs):
+                    frame[row, 2 + col_i * cell_width] = glyph[component_i]
+                frame[row, last_col] = separator
+                row += 1
+
+        frame[row, 1] = footer
+        return frame
+
+    def get_next_move(self) -> MoveDirection | GameCommand:
+        """
+        Captures and returns the player's move direction from keyboard input,
+        or the undo/redo command of the ``u``/``r`` keys.
+        Keys typed ahead are queued by the input reader, so fast or held-down
+        arrow keys are all processed in order.
+        Handles Ctrl+C interrupt for graceful exit.
 
-        :return: String representing the pressed key or escape sequence
-        :raises KeyboardInterrupt: When Ctrl+C is pressed
+        :return: Valid move direction from arrow key input, or a command
         """
-        file_descriptor = sys.stdin.fileno()
-        original_terminal_settings = termios.tcgetattr(file_descriptor)
-
         try:
-            tty.setraw(sys.stdin.fileno())
-            key_press = sys.stdin.read(1)
-
-            if key_press == "\x03":  # Ctrl+C
-                raise KeyboardInterrupt("Exit")
+            return self._input_reader.read_move()
+        except (KeyboardInterrupt, EOFError):
+            self._input_reader.close()
+            print("Bye-bye!")
+            sys.exit(0)
 
-            if key_press == "\x1b":  # Escape sequence (arrow keys etc)
-                key_press += sys.stdin.read(2)
-
-            return key_press
-
-        finally:
-            # Restore original terminal settings
-            termios.tcsetattr(
-                file_descriptor, termios.TCSADRAIN, original_terminal_settings
-            )
-
-    def _format_tile(self, tile: str) -> str:
-        """Centers tile value or returns empty space"""
-        if tile:
-            return f"{tile:^{self._tile_width}}"
-        return " " * self._tile_width
-
-    def _get_tile_color(self, tile: str) -> str:
-        """Returns ANSI color code for given tile value"""
-        if tile:
-            return TileColor.get_color(int(tile))
-        return TileColor.EMPTY.value
-
-    def _get_tile_components(self, tile_width: int) -> tuple[str, ...]:
+    def _get_borders(self, dim: int) -> tuple[str, str]:
         """
-        Generates the top, middle, and bottom components for tile rendering.
+        Returns the styled top and bottom borders of a board, built once per
+        dimension.
 
-        :param tile_width: Width of each tile in characters
-        :return: Tuple of three strings representing tile components
+        :param dim: Board dimension (number of tiles per side)
+        :return: Header and footer lines
         """
-        top = f"┌{'─' * tile_width}┐"
-        mid = "│{}│"
-        bot = f"└{'─' * tile_width}┘"
-
-        return top, mid, bot
-
-    def _clear_screen(self) -> None:
-        """Clears the terminal screen and moves cursor to home position."""
-        print("\033[H\033[J", end="")
+        borders = self._borders.get(dim)
+        if borders is None:
+            borders = self._borders[dim] = (
+                self._get_board_header(dim, self._tile_width),
+                self._get_board_footer(dim, self._tile_width),
+            )
+        return borders
 
-    def _display_board_header(self, dim: int, tile_width: int) -> None:
+    def _get_board_header(self, dim: int, tile_width: int) -> str:
         """
-        Renders the top border of the game board.
+        Builds the top border of the game board.
 
         :param dim: Board dimension (number of tiles per side)
         :param tile_width: Width of each tile in characters
+        :return: Styled border line
         """
         header = f"┌{'─' * dim * (tile_width + 2)}┐"
-        print(self._apply_border_style(header))
-
-    def _display_separator(self) -> None:
-        """Prints a vertical separator with configured border color."""
-        print(f"{self._border_color}│{self._default_color}", end="")
+        return self._apply_border_style(header)
 
-    def _display_tile_component(
-        self,
-        tile: str,
-        color: str,
-        component: str,
-        tile_width: int,
-    ) -> None:
-        """
-        Renders a single component of a tile with proper coloring.
-
-        :param tile: Tile content to display
-        :param color: ANSI color code for the tile
-        :param component: Which tile component to render (top/mid/bottom)
-        :param tile_width: Width of the tile in characters
-        """
-        if tile.strip().isdigit():
-            print(f"{color}{component.format(tile)}{self._default_color}", end="")
-        else:
-            print(" " * (tile_width + 2), end="")
+    def _get_separator(self) -> str:
+        """Returns a vertical separator with configured border color."""
+        return f"{self._border_color}│{self._default_color}"
 
-    def _display_board_footer(self, dim: int, tile_width: int) -> None:
+    def _get_board_footer(self, dim: int, tile_width: int) -> str:
         """
-        Renders the bottom border of the game board.
+        Builds the bottom border of the game board.
 
         :param dim: Board dimension (number of tiles per side)
         :param tile_width: Width of each tile in characters
+        :return: Styled border line
         """
         footer = f"└{'─' * dim * (tile_width + 2)}┘"
-        print(self._apply_border_style(footer))
+        return self._apply_border_style(footer)
 
     def _apply_border_style(self, border: str) -> str:
         """
@@ -0,0 +1,43 @@
+from collections import deque
+
+from src.domain.dataclasses_.simulation_report import SimulationReport
+
+
+class LatencyStats:
+    """
+    Keeps the durations of the most recent requests and reports their
+    percentiles. Memory is bounded by ``window``; older samples are dropped.
+    """
+
+    def __init__(self, window: int = 100_000) -> None:
+        """
+        :param window: Number of most recent samples kept
+        """
+        self._samples: deque[int] = deque(maxlen=window)
+        self._total = 0
+
+    def record(self, nanoseconds: int) -> None:
+        """
+        Adds the duration of one request.
+
+        :param nanoseconds: Duration of the request
+        """
+        self._samples.append(nanoseconds)
+        self._total += 1
+
+    def get_total(self) -> int:
+        """
+        Returns the number of samples recorded since the start.
+
+        :return: Samples count
+        """
+        return self._total
+
+    def get_percentile_us(self, percent: float) -> float:
+        """
+        Returns a percentile of the kept samples.
+
+        :param percent: Percentile in range 0-100
+        :return: Duration in microseconds (0 for no samples)
+        """
+        return SimulationReport.percentile(list(self._samples), percent) / 1000
@@ -0,0 +1,237 @@
+import asyncio
+import json
+import time
+from typing import Any
+
+from src.application.use_cases.game_sessions_use_case import GameSessionsUseCase
+from src.domain.dataclasses_.game_session import GameSession
+from src.domain.entities.bit_board import BitBoard
+from src.domain.enums_.move_direction import MoveDirection
+from src.domain.enums_.tile_value import TileValue
+from src.presentation.remote.latency import LatencyStats
+
+
+class SessionServerProtocol(asyncio.Protocol):
+    """
+    Line protocol of the multi-session game server, one JSON object per line
+    in both directions. Requests:
+    - ``{"op": "new", "seed": 1}`` starts a game (seed is optional),
+    - ``{"op": "move", "session": "...", "direction": "up"}`` makes a move,
+    - ``{"op": "get", "session": "..."}`` returns the current state,
+    - ``{"op": "close", "session": "..."}`` ends a session,
+    - ``{"op": "stats"}`` reports the sessions count, the number of moves
+      served and the p50/p99 move latency (parsing to encoded response).
+
+    Game responses hold ``session``, ``tiles`` (numeric values, 0 for
+    empty), ``score``, ``moves`` and ``result`` (null, "win" or "lose");
+    failures are answered with ``{"error": "..."}``. Responses come in
+    request order, so clients may pipeline requests.
+
+    All complete lines of a received chunk are handled at once and their
+    responses sent with one write. Reading from a client is paused while its
+    transport buffer is full.
+    """
+
+    _MAX_LINE = 64 * 1024
+    _VALUES = [TileValue.from_exponent(exponent).value for exponent in range(16)]
+    # rows of up to this many cells are formatted once and cached
+    _CACHED_ROW_CELLS = 4
+    # calling the enum costs more than a dict lookup
+    _DIRECTIONS = {direction.value: direction for direction in MoveDirection}
+    # json.loads without its per-call type and encoding checks
+    _decode = json.JSONDecoder().decode
+
+    def __init__(
+        self, sessions: GameSessionsUseCase, latency: LatencyStats, dim: int
+    ) -> None:
+        """
+        :param sessions: Session table shared by all connections
+        :param latency: Move latency statistics shared by all connections
+        :param dim: Board dimension of the hosted games
+        """
+        self._sessions = sessions
+        self._latency = latency
+        self._dim = dim
+        self._shifts = range(0, dim * dim * BitBoard.CELL_BITS, BitBoard.CELL_BITS)
+        self._row_bits = dim * BitBoard.CELL_BITS
+        self._row_shifts = range(0, dim * self._row_bits, self._row_bits)
+        self._row_mask = (1 << self._row_bits) - 1
+        # formatted row by packed row, for small rows only (16^dim entries)
+        self._rows: dict[int, str] | None = (
+            {} if dim <= self._CACHED_ROW_CELLS else None
+        )
+        self._transport: asyncio.Transport | None = None
+        self._buffer = b""
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        if isinstance(transport, asyncio.Transport):
+            self._transport = transport
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self._transport = None
+
+    def pause_writing(self) -> None:
+        if self._transport is not None:
+            self._transport.pause_reading()
+
+    def resume_writing(self) -> None:
+        if self._transport is not None:
+            self._transport.resume_reading()
+
+    def data_received(self, data: bytes) -> None:
+        if self._transport is None:
+            return
+        *lines, self._buffer = (self._buffer + data).split(b"\n")
+        responses = [self.handle_line(line) for line in lines if line.strip()]
+        if len(self._buffer) > self._MAX_LINE:
+            responses.append(self._encode({"error": "Line too long"}))
+            self._buffer = b""
+        if responses:
+            self._transport.write(b"".join(responses))
+
+    def handle_line(self, line: bytes) -> bytes:
+        """
+        Handles a single request line.
+
+        :param line: JSON request without the line break
+        :return: Encoded response line
+        """
+        started = time.perf_counter_ns()
+        request: Any = None
+        try:
+            request = self._decode(line.decode())
+            if not isinstance(request, dict):
+                raise ValueError("Request must be a JSON object")
+            encoded = self._dispatch(request)
+        except KeyError as error:
+            encoded = self._encode(
+                {"error": f"Unknown session or missing field: {error}"}
+            )
+        except (ValueError, TypeError) as error:
+            encoded = self._encode({"error": str(error)})
+        except RecursionError:
+            encoded = self._encode({"error": "Request nested too deeply"})
+        except Exception as error:
+            # a failing request must not take the connection's callback down
+            encoded = self._encode({"error": f"Internal error: {error!r}"})
+        if isinstance(request, dict) and request.get("op") == "move":
+            self._latency.record(time.perf_counter_ns() - started)
+        return encoded
+
+    def _dispatch(self, request: dict[str, Any]) -> bytes:
+        """
+        Executes a decoded request.
+
+        :param request: JSON request object
+        :return: Encoded response line
+        :raises KeyError: If the session or a required field is missing
+        :raises ValueError: If a field has an invalid value
+        """
+        op = request.get("op")
+        if op == "move":
+            direction = request["direction"]
+            return self._present(
+                self._sessions.move(
+                    request["session"],
+                    self._DIRECTIONS.get(direction) or MoveDirection(direction),
+                )
+            )
+        if op == "new":
+            seed = request.get("seed")
+            if seed is not None and not isinstance(seed, int):
+                raise ValueError("seed must be an integer")
+            return self._present(self._sessions.create(seed=seed))
+        if op == "get":
+            return self._present(self._sessions.get(request["session"]))
+        if op == "close":
+            self._sessions.close(request["session"])
+            return self._encode({"closed": request["session"]})
+        if op == "stats":
+            return self._encode(
+                {
+                    "sessions": self._sessions.get_sessions_count(),
+                    "moves": self._latency.get_total(),
+                    "p50_us": self._latency.get_percentile_us(50),
+                    "p99_us": self._latency.get_percentile_us(99),
+                }
+            )
+        raise ValueError(f"Unknown op: {op}")
+
+    def _present(self, session: GameSession) -> bytes:
+        """
+        Encodes a session as its JSON response line.
+
+        Formatted directly instead of through json.dumps, which would cost
+        more than the move itself: the session id is URL-safe and all other
+        fields are numbers, so no escaping is needed.
+
+        :param session: Game session
+        :return: Encoded response line
+        """
+        cells = session.cells
+        rows = self._rows
+        if rows is None:
+            values = self._VALUES
+            mask = BitBoard.CELL_MASK
+            flat = [values[(cells >> shift) & mask] for shift in self._shifts]
+            dim = self._dim
+            tiles = str([flat[idx : idx + dim] for idx in range(0, dim * dim, dim)])
+        else:
+            row_mask = self._row_mask
+            formatted = []
+            for shift in self._row_shifts:
+                row = (cells >> shift) & row_mask
+                text = rows.get(row)
+                if text is None:
+                    text = rows[row] = self._format_row(row)
+                formatted.append(text)
+            tiles = f"[{', '.join(formatted)}]"
+        result = f'"{session.result.name.lower()}"' if session.result else "null"
+        return (
+            f'{{"session":"{session.session_id}","tiles":{tiles},'
+            f'"score":{session.score},"moves":{session.moves},"result":{result}}}\n'
+        ).encode()
+
+    def _format_row(self, row: int) -> str:
+        """
+        Formats one packed row like a JSON list of tile values.
+
+        :param row: Packed row, one nibble per cell
+        :return: e.g. ``[2, 0, 0, 4]``
+        """
+        values = self._VALUES
+        return str(
+            [
+                values[(row >> shift) & BitBoard.CELL_MASK]
+                for shift in range(0, self._row_bits, BitBoard.CELL_BITS)
+            ]
+        )
+
+    @staticmethod
+    def _encode(response: dict[str, Any]) -> bytes:
+        return json.dumps(response, separators=(",", ":")).encode() + b"\n"
+
+
+async def create_session_server(
+    sessions: GameSessionsUseCase,
+    latency: LatencyStats,
+    dim: int,
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> asyncio.Server:
+    """
+    Starts listening for game clients on a TCP port.
+
+    :param sessions: Session table shared by all connections
+    :param latency: Move latency statistics
+    :param dim: Board dimension of the hosted games
+    :param host: Interface to bind
+    :param port: Port to bind, 0 for any free port
+    :return: Running server
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.create_server(
+        lambda: SessionServerProtocol(sessions=sessions, latency=latency, dim=dim),
+        host,
+        port,
+    )
@@ -0,0 +1,85 @@
+import asyncio
+import json
+from collections.abc import Callable
+
+from src.application.ports.async_view import IAsyncView
+from src.application.ports.presenter_output import IPresenterOutput
+from src.application.use_cases.async_game_use_case import AsyncGameLoopUseCase
+from src.domain.enums_.move_direction import MoveDirection
+
+
+class StreamView:
+    """
+    Serves a game over an asyncio stream (TCP or Unix socket connection)
+    with a line protocol:
+    - every frame is sent as one JSON object per line with ``tiles``
+      (numeric values, 0 for empty), ``score`` and ``message``,
+    - the client sends one move per line: ``up``, ``down``, ``left`` or
+      ``right``; other lines are ignored.
+
+    display waits for the transport to drain, so a client that does not read
+    its frames pauses its own game.
+    """
+
+    _MOVES = {direction.value: direction for direction in MoveDirection}
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """
+        :param reader: Incoming side of the client connection
+        :param writer: Outgoing side of the client connection
+        """
+        self._reader = reader
+        self._writer = writer
+
+    async def display(self, data: IPresenterOutput) -> None:
+        """
+        Sends a frame as a JSON line.
+
+        :param data: Prepared render data containing tiles, score and message
+        """
+        frame = {"tiles": data.tiles, "score": data.score, "message": data.message}
+        self._writer.write(json.dumps(frame, separators=(",", ":")).encode() + b"\n")
+        await self._writer.drain()
+
+    async def get_next_move(self) -> MoveDirection:
+        """
+        Reads lines until one holds a valid move.
+
+        :return: Move direction sent by the client
+        :raises EOFError: If the client closed the connection
+        """
+        while True:
+            line = await self._reader.readline()
+            if not line:
+                raise EOFError("Client disconnected")
+            move = self._MOVES.get(line.strip().decode(errors="replace").lower())
+            if move is not None:
+                return move
+
+
+async def create_stream_server(
+    new_game_loop: Callable[[IAsyncView], AsyncGameLoopUseCase],
+    host: str = "127.0.0.1",
+    port: int = 0,
+) -> asyncio.Server:
+    """
+    Starts listening for clients that each play one game over a StreamView.
+
+    A game lives as long as its connection: it is dropped when the client
+    disconnects and the connection is closed once the game is completed.
+
+    :param new_game_loop: Creates the game loop of a new connection
+    :param host: Interface to bind
+    :param port: Port to bind, 0 for any free port
+    :return: Running server
+    """
+
+    async def play(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await new_game_loop(StreamView(reader=reader, writer=writer)).execute()
+        except* (EOFError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(play, host, port)
@@ -0,0 +1,4 @@
+from src.entrypoints.replay import start_replay
+
+if __name__ == "__main__":
+    start_replay()
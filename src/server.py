@@ -0,0 +1,4 @@
+from src.entrypoints.server import start_server
+
+if __name__ == "__main__":
+    start_server()
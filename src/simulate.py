@@ -0,0 +1,4 @@
+from src.entrypoints.simulate import start_simulation
+
+if __name__ == "__main__":
+    start_simulation()
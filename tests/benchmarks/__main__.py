@@ -0,0 +1,85 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from tests.benchmarks.cases import SIZES, get_cases
+from tests.benchmarks.runner import compare, find_regressions, measure, to_report
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.benchmarks",
+        description="Times the game engine and rendering hot paths.",
+    )
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: tuple(int(size) for size in value.split(",")),
+        default=SIZES,
+        help="comma-separated board sizes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "-k", dest="keyword", default="", help="run cases whose name contains this"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="samples per case")
+    parser.add_argument(
+        "--min-time", type=float, default=0.1, help="seconds per sample"
+    )
+    parser.add_argument(
+        "--json", type=Path, default=None, metavar="PATH", help="write the report"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="compare with a report written by --json",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="slowdown flagged as a regression (default: 0.1, i.e. 10%%)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Runs the benchmarks, prints their timings and optionally compares them
+    with a baseline.
+
+    :param argv: Command line arguments, sys.argv is used if None
+    :return: Exit status, 1 if a regression was found
+    """
+    args = _parse_args(argv)
+    measurements = []
+    for case in get_cases(args.sizes):
+        if args.keyword not in case.name:
+            continue
+        measurement = measure(case, repeat=args.repeat, min_time=args.min_time)
+        measurements.append(measurement)
+        print(
+            f"{measurement.key:<40} {measurement.best_ns / 1000:>12.2f} us"
+            f" (median {measurement.median_ns / 1000:.2f} us)",
+            flush=True,
+        )
+
+    report = to_report(measurements)
+    if args.json is not None:
+        args.json.write_text(json.dumps(report, indent=2))
+
+    if args.baseline is None:
+        return 0
+
+    comparisons = compare(report, json.loads(args.baseline.read_text()))
+    regressions = find_regressions(comparisons, args.threshold)
+    print(f"\ncompared with {args.baseline}:")
+    for comparison in comparisons:
+        flag = "  REGRESSION" if comparison in regressions else ""
+        print(f"{comparison.key:<40} {comparison.ratio:>8.2f}x{flag}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,250 @@
+import io
+import itertools
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from src.application.use_cases.self_play_use_case import SelfPlayUseCase
+from src.domain.dataclasses_.dimension import Dimension
+from src.domain.dataclasses_.game_result import GameState
+from src.domain.dataclasses_.game_snapshot import GameSnapshot
+from src.domain.dataclasses_.tile import Tile
+from src.domain.entities.array_board import ArrayBoard
+from src.domain.entities.array_board_game import ArrayBoardGame
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.board import Board
+from src.domain.entities.game import Game
+from src.domain.entities.tile_spawner import TileSpawner
+from src.domain.enums_.game_result import GameResult
+from src.domain.enums_.move_direction import MoveDirection
+from src.domain.enums_.tile_value import TileValue
+from src.domain.interfaces.domain.game import IGame
+from src.presentation.ai.random_policy import RandomMovePolicy
+from src.presentation.cli.presenter import CliPresenter
+from src.presentation.cli.renderer import TerminalRenderer
+from src.presentation.cli.unix_view import UnixCliView
+
+Operation = Callable[[], object]
+Reset = Callable[[], None]
+
+SIZES = (4, 8, 12, 16)
+# positions a make_move benchmark cycles through, so that no single board
+# layout dominates the result
+_POSITIONS = 16
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """
+    One measured operation on one board size.
+
+    ``create`` builds a fresh fixture and returns the operation to time and,
+    for operations that change their fixture, a reset bringing it back to a
+    representative state before every call. Resets are not timed.
+    """
+
+    name: str
+    size: int
+    create: Callable[[], tuple[Operation, Reset | None]]
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.size}]"
+
+
+class _NullStream(io.StringIO):
+    """Text stream discarding everything written to it."""
+
+    def write(self, text: str) -> int:
+        return len(text)
+
+
+def _create_game(size: int, seed: int) -> Game:
+    return Game(
+        board=Board.create(Dimension(rows=size, cols=size)),
+        tile_spawner=TileSpawner(rng=random.Random(seed)),
+    )
+
+
+def _create_array_game(size: int, seed: int) -> ArrayBoardGame:
+    return ArrayBoardGame(
+        board=ArrayBoard.create(Dimension(rows=size, cols=size)),
+        tile_spawner=TileSpawner(rng=random.Random(seed)),
+    )
+
+
+def _play_positions(size: int, qty: int, seed: int = 0) -> list[GameSnapshot]:
+    """
+    Collects mid-game positions of a random game: the boards following the
+    first ``size * size`` moves, a point where the board is well filled but
+    rarely lost. All engines play identical games, so the one scaling best
+    to large boards plays them.
+    """
+    positions: list[GameSnapshot] = []
+    moves_rng = random.Random(seed)
+    game_seed = seed
+    while len(positions) < qty:
+        game = _create_array_game(size, game_seed)
+        game_seed += 1
+        state = game.start()
+        for move_idx in itertools.count():
+            state = game.make_move(moves_rng.choice(list(MoveDirection)))
+            # a won game goes on, only a lost one cannot provide positions
+            if state.result is GameResult.LOSE or len(positions) == qty:
+                break
+            if move_idx >= size * size:
+                positions.append(game.get_snapshot())
+    return positions
+
+
+def _make_move_case(
+    size: int,
+    direction: MoveDirection,
+    name: str = "game",
+    create_game: Callable[[int, int], IGame] = _create_game,
+) -> BenchmarkCase:
+    def create() -> tuple[Operation, Reset]:
+        game = create_game(size, 0)
+        positions = itertools.cycle(_play_positions(size, _POSITIONS))
+
+        def reset() -> None:
+            game.restore_snapshot(next(positions))
+
+        return lambda: game.make_move(direction), reset
+
+    return BenchmarkCase(
+        name=f"{name}.make_move.{direction.value}", size=size, create=create
+    )
+
+
+def _array_make_move_case(size: int, direction: MoveDirection) -> BenchmarkCase:
+    return _make_move_case(size, direction, "array_game", _create_array_game)
+
+
+def _successors_case(size: int) -> BenchmarkCase:
+    def create() -> tuple[Operation, Reset]:
+        game = _create_game(size, 0)
+        positions = itertools.cycle(_play_positions(size, _POSITIONS))
+
+        def reset() -> None:
+            # restoring drops the previews cached for the previous board
+            game.restore_snapshot(next(positions))
+
+        return game.successors, reset
+
+    return BenchmarkCase(name="game.successors", size=size, create=create)
+
+
+def _get_empty_tiles_positions_case(size: int) -> BenchmarkCase:
+    def create() -> tuple[Operation, None]:
+        board = Board.create(Dimension(rows=size, cols=size))
+        game = Game(board=board, tile_spawner=TileSpawner())
+        game.restore_snapshot(_play_positions(size, 1)[0])
+        return board.get_empty_tiles_positions, None
+
+    return BenchmarkCase(
+        name="board.get_empty_tiles_positions", size=size, create=create
+    )
+
+
+def _spawn_case(size: int) -> BenchmarkCase:
+    def create() -> tuple[Operation, None]:
+        board = Board.create(Dimension(rows=size, cols=size))
+        spawner = TileSpawner(rng=random.Random(0))
+        tiles = board.get_tiles()
+        # the board index is not updated, so every call picks among all cells
+        empty_cells = list(board.get_empty_tiles_positions())
+        return lambda: spawner.spawn(tiles, 1, empty_cells), None
+
+    return BenchmarkCase(name="tile_spawner.spawn", size=size, create=create)
+
+
+def _get_legal_moves_mask_case(size: int) -> BenchmarkCase:
+    def create() -> tuple[Operation, Reset]:
+        # a full board without equal neighbours: every pair is compared
+        values = (TileValue.ONE, TileValue.TWO)
+        tiles = [
+            [Tile(value=values[(row + col) % 2]) for col in range(size)]
+            for row in range(size)
+        ]
+        game = Game(board=Board(tiles), tile_spawner=TileSpawner())
+        snapshot = game.get_snapshot()
+
+        def reset() -> None:
+            # the mask is cached until the board changes, restoring drops it
+            game.restore_snapshot(snapshot)
+
+        return game.get_legal_moves_mask, reset
+
+    return BenchmarkCase(name="game.get_legal_moves_mask", size=size, create=create)
+
+
+def _random_game_case(size: int) -> BenchmarkCase:
+    def create() -> tuple[Operation, Reset]:
+        seeds = iter(range(1 << 30))
+        self_play: list[SelfPlayUseCase] = []
+
+        def reset() -> None:
+            seed = next(seeds)
+            self_play[:] = [
+                SelfPlayUseCase(
+                    game=_create_game(size, seed), policy=RandomMovePolicy(seed=seed)
+                )
+            ]
+
+        return lambda: self_play[0].execute(), reset
+
+    return BenchmarkCase(name="random_game", size=size, create=create)
+
+
+def _mid_game_states(size: int) -> list[GameState]:
+    return [BitBoard.to_game_state(position) for position in _play_positions(size, 2)]
+
+
+def _present_case(size: int) -> BenchmarkCase:
+    def create() -> tuple[Operation, None]:
+        presenter = CliPresenter()
+        state = _mid_game_states(size)[0]
+        return lambda: presenter.present(state), None
+
+    return BenchmarkCase(name="presenter.present", size=size, create=create)
+
+
+def _display_case(size: int) -> BenchmarkCase:
+    def create() -> tuple[Operation, None]:
+        view = UnixCliView(renderer=TerminalRenderer(stream=_NullStream()))
+        presenter = CliPresenter()
+        # alternate two frames, so every call redraws what a move changes
+        outputs = itertools.cycle(
+            [presenter.present(state) for state in _mid_game_states(size)]
+        )
+        return lambda: view.display(next(outputs)), None
+
+    return BenchmarkCase(name="view.display", size=size, create=create)
+
+
+def get_cases(sizes: tuple[int, ...] = SIZES) -> list[BenchmarkCase]:
+    """
+    Lists all benchmarks for the given board sizes.
+
+    :param sizes: Board dimensions to measure
+    :return: Benchmark cases, grouped by operation
+    """
+    factories: list[Callable[[int], BenchmarkCase]] = [
+        *(
+            lambda size, direction=direction: _make_move_case(size, direction)
+            for direction in MoveDirection
+        ),
+        *(
+            lambda size, direction=direction: _array_make_move_case(size, direction)
+            for direction in MoveDirection
+        ),
+        _successors_case,
+        _get_empty_tiles_positions_case,
+        _spawn_case,
+        _get_legal_moves_mask_case,
+        _random_game_case,
+        _present_case,
+        _display_case,
+    ]
+    return [factory(size) for factory in factories for size in sizes]
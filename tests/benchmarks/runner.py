@@ -0,0 +1,165 @@
+import gc
+import platform
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from tests.benchmarks.cases import BenchmarkCase, Operation, Reset
+
+
+@dataclass(frozen=True)
+class Measurement:
+    """
+    Timing of one benchmark case.
+
+    ``best_ns`` (the fastest sample) is what comparisons use: it is the
+    least disturbed by other processes. ``median_ns`` shows the spread.
+    """
+
+    name: str
+    size: int
+    best_ns: float
+    median_ns: float
+    calls: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}[{self.size}]"
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Timing of a case against its baseline."""
+
+    key: str
+    baseline_ns: float
+    current_ns: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current_ns / self.baseline_ns if self.baseline_ns else 1.0
+
+
+def measure(case: BenchmarkCase, repeat: int = 5, min_time: float = 0.1) -> Measurement:
+    """
+    Times a case: ``repeat`` samples of at least ``min_time`` seconds each,
+    with the garbage collector disabled like timeit does.
+
+    Operations without a reset run in a calibrated loop; the others are
+    timed call by call so that their resets are excluded.
+
+    :param case: Benchmark to run
+    :param repeat: Number of samples
+    :param min_time: Minimum duration of a sample in seconds
+    :return: Time per call of the best and the median sample
+    """
+    operation, reset = case.create()
+    budget_ns = int(min_time * 1e9)
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        if reset is None:
+            loops = _calibrate(operation, budget_ns)
+            samples = [_time_loop(operation, loops) / loops for _ in range(repeat)]
+            calls = loops * repeat
+        else:
+            samples = []
+            calls = 0
+            for _ in range(repeat):
+                sample_ns, sample_calls = _time_calls(operation, reset, budget_ns)
+                samples.append(sample_ns / sample_calls)
+                calls += sample_calls
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return Measurement(
+        name=case.name,
+        size=case.size,
+        best_ns=min(samples),
+        median_ns=statistics.median(samples),
+        calls=calls,
+    )
+
+
+def _calibrate(operation: Operation, budget_ns: int) -> int:
+    loops = 1
+    while True:
+        elapsed = _time_loop(operation, loops)
+        if elapsed >= budget_ns:
+            return loops
+        # aim slightly above the budget to avoid another round
+        loops = max(loops * 2, int(loops * budget_ns * 1.2 / max(elapsed, 1)))
+
+
+def _time_loop(operation: Operation, loops: int) -> int:
+    started = time.perf_counter_ns()
+    for _ in range(loops):
+        operation()
+    return time.perf_counter_ns() - started
+
+
+def _time_calls(operation: Operation, reset: Reset, budget_ns: int) -> tuple[int, int]:
+    elapsed = 0
+    calls = 0
+    while elapsed < budget_ns or not calls:
+        reset()
+        started = time.perf_counter_ns()
+        operation()
+        elapsed += time.perf_counter_ns() - started
+        calls += 1
+    return elapsed, calls
+
+
+def to_report(measurements: list[Measurement]) -> dict[str, Any]:
+    """
+    Builds the JSON report of a run.
+
+    :param measurements: Timings of all cases
+    :return: JSON-serializable report, also the baseline format
+    """
+    return {
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": {
+            measurement.key: asdict(measurement) for measurement in measurements
+        },
+    }
+
+
+def compare(report: dict[str, Any], baseline: dict[str, Any]) -> list[Comparison]:
+    """
+    Matches the cases of a report with a baseline report.
+
+    :param report: Report of the current run
+    :param baseline: Report of a reference run
+    :return: Comparisons of all cases present in both reports
+    """
+    baseline_results = baseline.get("results", {})
+    return [
+        Comparison(
+            key=key,
+            baseline_ns=baseline_results[key]["best_ns"],
+            current_ns=result["best_ns"],
+        )
+        for key, result in report["results"].items()
+        if key in baseline_results
+    ]
+
+
+def find_regressions(
+    comparisons: list[Comparison], threshold: float
+) -> list[Comparison]:
+    """
+    Selects the cases that got slower than allowed.
+
+    :param comparisons: Cases compared with their baseline
+    :param threshold: Tolerated slowdown, e.g. 0.1 for 10%
+    :return: Comparisons whose time grew by more than the threshold
+    """
+    return [
+        comparison for comparison in comparisons if comparison.ratio > 1 + threshold
+    ]
@@ -0,0 +1,61 @@
+import json
+
+import pytest
+
+from tests.benchmarks.__main__ import main
+from tests.benchmarks.cases import BenchmarkCase, get_cases
+from tests.benchmarks.runner import Comparison, compare, find_regressions, measure
+
+
+@pytest.mark.parametrize("case", get_cases(sizes=(4, 5)), ids=lambda case: case.key)
+def test_benchmark(case: BenchmarkCase, request: pytest.FixtureRequest):
+    # timed by pytest-benchmark when it is installed, run once otherwise
+    if not request.config.pluginmanager.hasplugin("benchmark"):
+        assert measure(case, repeat=1, min_time=0).calls >= 1
+        return
+
+    benchmark = request.getfixturevalue("benchmark")
+    operation, reset = case.create()
+    if reset is None:
+        benchmark(operation)
+    else:
+        benchmark.pedantic(operation, setup=reset, rounds=20)
+
+
+def test_find_regressions():
+    report = {"results": {"a[4]": {"best_ns": 125}, "b[4]": {"best_ns": 105}}}
+    baseline = {"results": {"a[4]": {"best_ns": 100}, "b[4]": {"best_ns": 100}}}
+
+    comparisons = compare(report, baseline)
+
+    assert [comparison.key for comparison in comparisons] == ["a[4]", "b[4]"]
+    assert find_regressions(comparisons, threshold=0.1) == [
+        Comparison(key="a[4]", baseline_ns=100, current_ns=125)
+    ]
+
+
+def test_main_compares_with_baseline(tmp_path, capsys):
+    report_path = tmp_path / "report.json"
+    args = ["--sizes", "4", "-k", "presenter", "--repeat", "1", "--min-time", "0"]
+
+    assert main([*args, "--json", str(report_path)]) == 0
+    report = json.loads(report_path.read_text())
+    assert list(report["results"]) == ["presenter.present[4]"]
+
+    report["results"]["presenter.present[4]"]["best_ns"] /= 1000
+    report_path.write_text(json.dumps(report))
+    assert main([*args, "--baseline", str(report_path)]) == 1
+    assert "REGRESSION" in capsys.readouterr().out
+
+
+def test_array_game_scales_linearly():
+    def per_cell_ns(size: int) -> float:
+        (case,) = [
+            case
+            for case in get_cases(sizes=(size,))
+            if case.name == "array_game.make_move.up"
+        ]
+        return measure(case, repeat=3, min_time=0.05).best_ns / (size * size)
+
+    # 16 times more cells; a quadratic engine would spend 4 times more per cell
+    assert per_cell_ns(64) < 2.5 * per_cell_ns(16)
@@ -0,0 +1,56 @@
+import random
+import tracemalloc
+
+import src.domain.dataclasses_.tile as tile_module
+import src.domain.dataclasses_.tile_position as tile_position_module
+from src.domain.dataclasses_.dimension import Dimension
+from src.domain.dataclasses_.tile import Tile
+from src.domain.entities.board import Board
+from src.domain.entities.game import Game
+from src.domain.entities.tile_spawner import TileSpawner
+from src.domain.enums_.move_direction import MoveDirection
+from src.domain.enums_.tile_value import TileValue
+
+_DIMENSION = Dimension(rows=16, cols=16)
+
+
+def _allocated_in(snapshot: tracemalloc.Snapshot, filename: str) -> int:
+    traces = snapshot.filter_traces([tracemalloc.Filter(True, filename)])
+    return sum(stat.size for stat in traces.statistics("filename"))
+
+
+def test_board_create_16x16_memory():
+    Board.create(_DIMENSION)  # warm up the flyweights
+
+    tracemalloc.start()
+    board = Board.create(_DIMENSION)
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tiles = {id(tile) for row in board.get_tiles() for tile in row}
+    assert len(tiles) == 1, f"{len(tiles)} Tile instances"
+    # the 16 row lists and the empty-cell index, no per-cell objects
+    assert allocated < 16 * 1024, f"{allocated} bytes"
+
+
+def test_moves_16x16_do_not_allocate_tiles():
+    game = Game(
+        board=Board.create(_DIMENSION), tile_spawner=TileSpawner(rng=random.Random(0))
+    )
+    moves_rng = random.Random(0)
+    game.start()
+    for _ in range(50):
+        game.make_move(moves_rng.choice(list(MoveDirection)))
+    for value in TileValue:
+        Tile(value=value)  # every flyweight exists before measuring
+
+    tracemalloc.start()
+    for _ in range(200):
+        game.make_move(moves_rng.choice(list(MoveDirection)))
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    tiles_allocated = _allocated_in(snapshot, tile_module.__file__)
+    positions_allocated = _allocated_in(snapshot, tile_position_module.__file__)
+    assert tiles_allocated == 0, f"Tile {tiles_allocated} bytes"
+    assert positions_allocated == 0, f"TilePosition {positions_allocated} bytes"
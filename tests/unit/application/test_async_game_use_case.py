@@ -0,0 +1,176 @@
+import asyncio
+import itertools
+import json
+import random
+
+import pytest
+
+from src.application.ports.async_view import IAsyncView
+from src.application.use_cases.async_game_use_case import AsyncGameLoopUseCase
+from src.domain.dataclasses_.dimension import Dimension
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.bit_board_game import BitBoardGame
+from src.domain.entities.tile_spawner import TileSpawner
+from src.domain.enums_.move_direction import MoveDirection
+from src.presentation.cli.models import PresenterOutput
+from src.presentation.cli.presenter import CliPresenter
+from src.presentation.remote.stream_view import StreamView, create_stream_server
+
+
+class ScriptedView:
+    def __init__(self, frames_gate: asyncio.Event | None = None) -> None:
+        self.frames: list[PresenterOutput] = []
+        self.moves_read = 0
+        self._moves = itertools.cycle(list(MoveDirection))
+        self._frames_gate = frames_gate
+
+    async def display(self, data: PresenterOutput) -> None:
+        if self._frames_gate is not None:
+            await self._frames_gate.wait()
+        self.frames.append(data)
+
+    async def get_next_move(self) -> MoveDirection:
+        self.moves_read += 1
+        await asyncio.sleep(0)
+        return next(self._moves)
+
+
+class DisconnectingView(ScriptedView):
+    async def get_next_move(self) -> MoveDirection:
+        raise EOFError("Client disconnected")
+
+
+def _create_game(seed: int) -> BitBoardGame:
+    return BitBoardGame(
+        board=BitBoard.create(Dimension(rows=4, cols=4)),
+        tile_spawner=TileSpawner(rng=random.Random(seed)),
+    )
+
+
+def test_execute_plays_until_completed():
+    view = ScriptedView()
+    use_case = AsyncGameLoopUseCase(
+        game=_create_game(1), presenter=CliPresenter(), view=view
+    )
+
+    asyncio.run(use_case.execute())
+
+    assert len(view.frames) > 2
+    assert view.frames[-1].message != view.frames[0].message
+
+
+def test_slow_view_pauses_input():
+    async def run() -> ScriptedView:
+        gate = asyncio.Event()
+        view = ScriptedView(frames_gate=gate)
+        use_case = AsyncGameLoopUseCase(
+            game=_create_game(2),
+            presenter=CliPresenter(),
+            view=view,
+            max_pending_moves=2,
+            max_pending_frames=1,
+        )
+        task = asyncio.create_task(use_case.execute())
+        for _ in range(50):
+            await asyncio.sleep(0)
+        # one frame in display, one queued, one move being applied, two queued
+        # and one more read by the input task that waits for a free slot
+        assert view.moves_read <= 6
+        gate.set()
+        await task
+        return view
+
+    view = asyncio.run(run())
+    assert view.moves_read > 6
+
+
+def test_disconnect_stops_the_game():
+    use_case = AsyncGameLoopUseCase(
+        game=_create_game(3), presenter=CliPresenter(), view=DisconnectingView()
+    )
+
+    with pytest.raises(ExceptionGroup) as error:
+        asyncio.run(use_case.execute())
+    assert error.group_contains(EOFError)
+
+
+def test_invalid_queue_size():
+    with pytest.raises(ValueError):
+        AsyncGameLoopUseCase(
+            game=_create_game(4),
+            presenter=CliPresenter(),
+            view=ScriptedView(),
+            max_pending_frames=0,
+        )
+
+
+def test_concurrent_sessions_over_sockets():
+    sessions = 20
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        seed = int((await reader.readline()).decode())
+        use_case = AsyncGameLoopUseCase(
+            game=_create_game(seed),
+            presenter=CliPresenter(),
+            view=StreamView(reader=reader, writer=writer),
+        )
+        await use_case.execute()
+        writer.close()
+        await writer.wait_closed()
+
+    async def play(port: int, seed: int) -> int:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"{seed}\n".encode())
+        moves = itertools.cycle([b"up\n", b"left\n", b"down\n", b"right\n"])
+        frames = 0
+        while line := await reader.readline():
+            assert set(json.loads(line)) == {"tiles", "score", "message"}
+            frames += 1
+            writer.write(next(moves))
+        writer.close()
+        return frames
+
+    async def run() -> list[int]:
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await asyncio.gather(
+                *(play(port, seed) for seed in range(sessions))
+            )
+
+    frames = asyncio.run(run())
+    assert len(frames) == sessions
+    assert all(count > 2 for count in frames)
+
+
+def test_stream_server_plays_one_game_per_connection():
+    def new_game_loop(view: IAsyncView) -> AsyncGameLoopUseCase:
+        return AsyncGameLoopUseCase(
+            game=_create_game(seed=7), presenter=CliPresenter(), view=view
+        )
+
+    async def play(port: int) -> int:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        moves = itertools.cycle([b"up\n", b"left\n", b"down\n", b"right\n"])
+        frames = 0
+        while line := await reader.readline():
+            frames += 1
+            writer.write(next(moves))
+        writer.close()
+        return frames
+
+    async def leave(port: int) -> None:
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await reader.readline()
+        writer.close()
+        await writer.wait_closed()
+
+    async def run() -> list[int]:
+        server = await create_stream_server(new_game_loop=new_game_loop)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            await leave(port)
+            return await asyncio.gather(play(port), play(port))
+
+    first, second = asyncio.run(run())
+    assert first == second > 2
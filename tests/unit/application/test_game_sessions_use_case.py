@@ -0,0 +1,102 @@
+import pytest
+
+from src.application.use_cases.game_sessions_use_case import GameSessionsUseCase
+from src.domain.dataclasses_.dimension import Dimension
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.bit_board_game import BitBoardGame
+from src.domain.entities.counter_random import CounterRandom
+from src.domain.entities.tile_spawner import TileSpawner
+from src.domain.enums_.game_result import GameResult
+from src.domain.enums_.move_direction import MoveDirection
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _create_game(rng: CounterRandom, move_tables=None) -> BitBoardGame:
+    return BitBoardGame(
+        board=BitBoard.create(Dimension(rows=4, cols=4)),
+        tile_spawner=TileSpawner(rng=rng),
+        move_tables=move_tables,
+    )
+
+
+def _create_sessions(**kwargs) -> GameSessionsUseCase:
+    rng = CounterRandom()
+    return GameSessionsUseCase(game=_create_game(rng), rng=rng, **kwargs)
+
+
+def test_interleaved_sessions_play_like_separate_games():
+    sessions = _create_sessions()
+    first = sessions.create(seed=1).session_id
+    second = sessions.create(seed=2).session_id
+    moves = [MoveDirection.LEFT, MoveDirection.UP, MoveDirection.RIGHT] * 5
+
+    for move in moves:
+        sessions.move(first, move)
+        sessions.move(second, move)
+
+    for session_id, seed in ((first, 1), (second, 2)):
+        game = _create_game(CounterRandom(seed))
+        game.start()
+        summary = game.apply_moves(moves)
+        session = sessions.get(session_id)
+        assert session.cells == game.get_cells()
+        assert session.score == summary.score
+        assert session.moves == len(moves)
+
+
+def test_completed_session_ignores_moves():
+    sessions = _create_sessions()
+    session = sessions.create(seed=3)
+    while session.result is None:
+        for move in MoveDirection:
+            session = sessions.move(session.session_id, move)
+
+    cells, moves = session.cells, session.moves
+    session = sessions.move(session.session_id, MoveDirection.UP)
+    assert session.result in (GameResult.WIN, GameResult.LOSE)
+    assert (session.cells, session.moves) == (cells, moves)
+
+
+def test_idle_sessions_are_evicted():
+    clock = FakeClock()
+    sessions = _create_sessions(idle_ttl=10.0, clock=clock)
+    idle = sessions.create(seed=1).session_id
+    clock.now = 5.0
+    active = sessions.create(seed=2).session_id
+    clock.now = 12.0
+    sessions.move(active, MoveDirection.LEFT)
+
+    with pytest.raises(KeyError):
+        sessions.get(idle)
+    assert sessions.get(active).session_id == active
+    assert sessions.get_sessions_count() == 1
+
+
+def test_least_recently_used_session_is_evicted():
+    sessions = _create_sessions(max_sessions=2)
+    first = sessions.create(seed=1).session_id
+    second = sessions.create(seed=2).session_id
+    sessions.get(first)
+    sessions.create(seed=3)
+
+    with pytest.raises(KeyError):
+        sessions.get(second)
+    assert sessions.get_sessions_count() == 2
+
+
+def test_unknown_and_closed_sessions():
+    sessions = _create_sessions()
+    session_id = sessions.create(seed=1).session_id
+    sessions.close(session_id)
+
+    with pytest.raises(KeyError):
+        sessions.move(session_id, MoveDirection.UP)
+    with pytest.raises(KeyError):
+        sessions.close("missing")
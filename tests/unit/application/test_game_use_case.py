@@ -0,0 +1,88 @@
+import random
+from collections.abc import Iterable
+
+import pytest
+
+from src.application.use_cases.game_use_case import GameLoopUseCase
+from src.domain.dataclasses_.dimension import Dimension
+from src.domain.entities.board import Board
+from src.domain.entities.game import Game
+from src.domain.entities.game_history import GameHistory
+from src.domain.entities.tile_spawner import TileSpawner
+from src.domain.enums_.game_command import GameCommand
+from src.domain.enums_.move_direction import MoveDirection
+from src.presentation.cli.models import PresenterOutput
+from src.presentation.cli.presenter import CliPresenter
+
+
+class ScriptEnded(Exception):
+    pass
+
+
+class ScriptedView:
+    def __init__(self, actions: Iterable[MoveDirection | GameCommand]) -> None:
+        self.frames: list[PresenterOutput] = []
+        self._actions = iter(actions)
+
+    def display(self, data: PresenterOutput) -> None:
+        self.frames.append(data)
+
+    def get_next_move(self) -> MoveDirection | GameCommand:
+        action = next(self._actions, None)
+        if action is None:
+            raise ScriptEnded
+        return action
+
+
+def _play(
+    actions: list[MoveDirection | GameCommand], history: GameHistory | None
+) -> list[PresenterOutput]:
+    game = Game(
+        board=Board.create(Dimension(rows=4, cols=4)),
+        tile_spawner=TileSpawner(rng=random.Random(7)),
+    )
+    view = ScriptedView(actions)
+    use_case = GameLoopUseCase(
+        game=game, presenter=CliPresenter(), view=view, history=history
+    )
+    with pytest.raises(ScriptEnded):
+        use_case.execute()
+    return view.frames
+
+
+_MOVES = [MoveDirection.LEFT, MoveDirection.UP, MoveDirection.RIGHT, MoveDirection.DOWN]
+
+
+def test_undo_restores_board_and_score():
+    frames = _play([*_MOVES, GameCommand.UNDO, GameCommand.UNDO], GameHistory())
+
+    # start, four moves, then back to the frames after the third and second
+    assert len({str(frame) for frame in frames[:5]}) == 5
+    assert frames[5:] == [frames[3], frames[2]]
+
+
+def test_redo_replays_the_same_spawn():
+    frames = _play(
+        [
+            *_MOVES,
+            GameCommand.UNDO,
+            GameCommand.UNDO,
+            GameCommand.REDO,
+            GameCommand.REDO,
+        ],
+        GameHistory(),
+    )
+
+    assert frames[-2:] == frames[3:5]
+
+
+def test_move_after_undo_spawns_like_the_undone_move():
+    frames = _play([*_MOVES, GameCommand.UNDO, _MOVES[-1]], GameHistory())
+
+    assert frames[-1] == frames[4]
+
+
+def test_commands_without_history_are_ignored():
+    frames = _play([*_MOVES, GameCommand.UNDO, GameCommand.REDO], history=None)
+
+    assert frames[-1] == frames[-2] == frames[-3]
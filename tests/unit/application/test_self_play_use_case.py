@@ -0,0 +1,40 @@
+import random
+
+from src.application.use_cases.self_play_use_case import SelfPlayUseCase
+from src.domain.dataclasses_.game_result import GameState
+from src.domain.dataclasses_.game_summary import GameSummary
+from src.domain.entities.game import Game
+from src.domain.entities.tile_spawner import TileSpawner
+from src.domain.enums_.game_result import GameResult
+from src.domain.enums_.move_direction import MoveDirection
+from src.presentation.ai.random_policy import RandomMovePolicy
+
+
+class RecordingPolicy:
+    def __init__(self) -> None:
+        self.states: list[GameState] = []
+
+    def choose_move(self, game_state: GameState) -> MoveDirection:
+        self.states.append(game_state)
+        return MoveDirection.LEFT
+
+
+def test_execute_plays_until_completed(board):
+    game = Game(board=board, tile_spawner=TileSpawner(rng=random.Random(1)))
+    summary: GameSummary = SelfPlayUseCase(
+        game=game, policy=RandomMovePolicy(seed=1)
+    ).execute()
+
+    assert summary.result is GameResult.LOSE
+    assert summary.moves > 0
+    assert summary.score > 0
+    assert summary.max_tile >= 16
+
+
+def test_execute_respects_max_moves(bit_board_game):
+    policy = RecordingPolicy()
+    summary = SelfPlayUseCase(game=bit_board_game, policy=policy, max_moves=3).execute()
+
+    assert summary.moves == 3
+    assert len(policy.states) == 3
+    assert summary.result is None
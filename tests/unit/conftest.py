@@ -3,8 +3,11 @@ import pytest
 from src.domain.dataclasses_.dimension import Dimension
 from src.domain.dataclasses_.tile import Tile
 from src.domain.dataclasses_.tile_position import TilePosition
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.bit_board_game import BitBoardGame
 from src.domain.entities.board import Board
 from src.domain.entities.game import Game
+from src.domain.entities.move_tables import MoveTables
 from src.domain.entities.tile_spawner import TileSpawner
 from src.domain.enums_.tile_value import TileValue
 from tests.unit.objects import board_with_full_column, empty_board
@@ -33,6 +36,26 @@ def game(board, tile_spawner) -> Game:
     )
 
 
+@pytest.fixture(scope="session")
+def move_tables() -> MoveTables:
+    tables = MoveTables()
+    tables.left_rows  # generate once for the whole test session
+    yield tables
+
+
+@pytest.fixture
+def bit_board(dimension) -> BitBoard:
+    yield BitBoard.create(dimension=dimension)
+
+
+@pytest.fixture
+def bit_board_game(bit_board, tile_spawner) -> BitBoardGame:
+    yield BitBoardGame(
+        board=bit_board,
+        tile_spawner=tile_spawner,
+    )
+
+
 @pytest.fixture
 def tiles_for_board() -> list[list[Tile]]:
     yield board_with_full_column()
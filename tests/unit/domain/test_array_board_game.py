@@ -0,0 +1,115 @@
+import random
+from array import array
+
+import pytest
+
+from src.domain.dataclasses_.tile import Tile
+from src.domain.dataclasses_.tile_position import TilePosition
+from src.domain.entities.array_board import ArrayBoard
+from src.domain.entities.array_board_game import ArrayBoardGame
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.tile_spawner import TileSpawner
+from src.domain.enums_.game_result import GameResult
+from src.domain.enums_.move_direction import MoveDirection
+from src.domain.enums_.tile_value import TileValue
+
+
+def _create_game(exponents: list[list[int]]) -> ArrayBoardGame:
+    cells = array("B", (exponent for row in exponents for exponent in row))
+    return ArrayBoardGame(
+        board=ArrayBoard(cells=cells, dim=len(exponents)),
+        tile_spawner=TileSpawner(rng=random.Random(0)),
+    )
+
+
+def _get_exponents(game: ArrayBoardGame) -> list[list[int]]:
+    state = BitBoard.to_game_state(game.get_snapshot())
+    return [[tile.value.exponent for tile in row] for row in state.tiles]
+
+
+@pytest.mark.parametrize(
+    "move, expected",
+    [
+        (
+            MoveDirection.LEFT,
+            [[2, 0, 0, 0], [3, 2, 0, 0], [2, 3, 0, 0], [2, 3, 5, 0]],
+        ),
+        (
+            MoveDirection.RIGHT,
+            [[0, 0, 0, 2], [0, 0, 2, 3], [0, 0, 2, 3], [0, 2, 3, 5]],
+        ),
+        (
+            MoveDirection.UP,
+            [[1, 1, 1, 2], [2, 2, 2, 3], [0, 3, 1, 4], [0, 0, 4, 0]],
+        ),
+        (
+            MoveDirection.DOWN,
+            [[0, 0, 1, 0], [0, 1, 2, 2], [1, 2, 1, 3], [2, 3, 4, 4]],
+        ),
+    ],
+)
+def test__slide_line(move: MoveDirection, expected: list[list[int]]):
+    game = _create_game([[0, 1, 1, 0], [0, 2, 2, 2], [1, 0, 1, 3], [2, 3, 4, 4]])
+    # no tile is spawned for the comparison
+    game._spawn = lambda qty, changed: None
+
+    game.make_move(move)
+
+    assert _get_exponents(game) == expected
+
+
+def test__slide_line_does_not_merge_largest_tiles():
+    game = _create_game([[15, 15, 0, 0], [0] * 4, [0] * 4, [0] * 4])
+    game._spawn = lambda qty, changed: None
+
+    state = game.make_move(MoveDirection.LEFT)
+
+    assert _get_exponents(game)[0] == [15, 15, 0, 0]
+    assert state.changed_cells == frozenset()
+    assert state.score == 0
+
+
+def test_make_move_score_and_changed_cells():
+    game = _create_game([[1, 1, 2, 2], [0] * 4, [0] * 4, [0] * 4])
+    game._spawn = lambda qty, changed: None
+
+    state = game.make_move(MoveDirection.LEFT)
+
+    assert state.score == 4 + 8
+    assert state.changed_cells == frozenset(
+        TilePosition(row_idx=0, col_idx=col_idx) for col_idx in range(4)
+    )
+    assert [tile.value for tile in state.tiles[0]] == [4, 8, 0, 0]
+
+
+@pytest.mark.parametrize(
+    "exponents, result",
+    [
+        ([[11, 0], [0, 0]], GameResult.WIN),
+        ([[1, 2], [2, 1]], GameResult.LOSE),
+        ([[15, 15], [2, 1]], GameResult.LOSE),
+        ([[1, 1], [2, 3]], None),
+        ([[1, 2], [1, 3]], None),
+    ],
+)
+def test__get_game_result(exponents: list[list[int]], result: GameResult | None):
+    assert _create_game(exponents)._get_game_result() == result
+
+
+def test_make_move_invalid_direction():
+    with pytest.raises(ValueError):
+        _create_game([[0, 0], [0, 0]]).make_move("diagonal")  # type: ignore[arg-type]
+
+
+def test_array_board_round_trip():
+    tiles = [
+        [Tile(value=TileValue.ONE), Tile(value=TileValue.ZERO)],
+        [Tile(value=TileValue.FIFTEEN), Tile(value=TileValue.ELEVEN)],
+    ]
+
+    assert ArrayBoard.from_tiles(tiles).get_tiles() == tiles
+
+
+def test_array_board_invalid_cells():
+    with pytest.raises(ValueError):
+        ArrayBoard(cells=array("B", bytes(3)), dim=2)
@@ -0,0 +1,132 @@
+import random
+
+import pytest
+
+from src.domain.dataclasses_.batch_game_state import BatchGameState
+from src.domain.dataclasses_.dimension import Dimension
+from src.domain.dataclasses_.tile import Tile
+from src.domain.entities.batch_game import BatchGame
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.board import Board
+from src.domain.entities.game import Game
+from src.domain.entities.tile_spawner import TileSpawner
+from src.domain.enums_.game_result import GameResult
+from src.domain.enums_.game_status import GameStatus
+from src.domain.enums_.move_direction import MoveDirection
+from src.domain.enums_.tile_value import TileValue
+from tests.unit.objects import (
+    board_random_state_3,
+    board_with_almost_win_condition,
+    board_with_lose_condition,
+    board_with_one_possible_move,
+)
+
+np = pytest.importorskip("numpy")
+
+
+def _to_exponents(tiles: list[list[Tile]]) -> list[list[int]]:
+    return [[BitBoard.to_exponent(tile.value) for tile in row] for row in tiles]
+
+
+def _random_tiles(rng: random.Random, dim: int) -> list[list[Tile]]:
+    values = list(TileValue)[:6]
+    return [[Tile(value=rng.choice(values)) for _ in range(dim)] for _ in range(dim)]
+
+
+def test_start():
+    batch = BatchGame(boards_qty=50, dimension=Dimension(rows=4, cols=4), seed=1)
+    state: BatchGameState = batch.start()
+
+    assert state.exponents.shape == (50, 4, 4)
+    assert ((state.exponents != 0).sum(axis=(1, 2)) == 2).all()
+    assert set(np.unique(state.exponents)) <= {0, 1, 2}
+    assert (state.scores == 0).all()
+    assert (state.statuses == GameStatus.IN_PROGRESS.value).all()
+    assert (state.results == BatchGameState.NO_RESULT).all()
+
+
+@pytest.mark.parametrize("dim", [4, 6])
+def test__apply_move_matches_game(dim: int):
+    rng = random.Random(dim)
+    boards = [_random_tiles(rng, dim) for _ in range(200)]
+    batch = BatchGame(boards_qty=len(boards), dimension=Dimension(rows=dim, cols=dim))
+
+    for direction in BatchGame.DIRECTIONS:
+        batch._exponents = np.array(
+            [_to_exponents(tiles) for tiles in boards], np.uint8
+        )
+        batch._scores[:] = 0
+        batch._apply_move(direction, np.ones(len(boards), dtype=np.bool_))
+
+        for idx, tiles in enumerate(boards):
+            tiles = [row[:] for row in tiles]
+            game = Game(board=Board(tiles=tiles), tile_spawner=TileSpawner())
+            game._apply_move(direction, tiles)
+
+            assert batch._exponents[idx].tolist() == _to_exponents(tiles)
+            assert batch._scores[idx] == game._score
+
+
+def test_make_moves():
+    batch = BatchGame(boards_qty=3, dimension=Dimension(rows=4, cols=4), seed=7)
+    batch._exponents = np.array(
+        [
+            _to_exponents(board_random_state_3()),
+            _to_exponents(board_with_almost_win_condition()),
+            _to_exponents(board_with_lose_condition()),
+        ],
+        dtype=np.uint8,
+    )
+
+    state = batch.make_moves(
+        [MoveDirection.UP, MoveDirection.RIGHT, MoveDirection.RIGHT]
+    )
+
+    assert state.changed.tolist() == [True, True, False]
+    assert state.scores.tolist() == [48, 2048, 0]
+    assert state.statuses.tolist() == [
+        GameStatus.IN_PROGRESS.value,
+        GameStatus.COMPLETED.value,
+        GameStatus.COMPLETED.value,
+    ]
+    assert state.results.tolist() == [
+        BatchGameState.NO_RESULT,
+        GameResult.WIN.value,
+        GameResult.LOSE.value,
+    ]
+    # a new tile has been spawned on the changed boards only
+    assert (state.exponents[:2] != 0).sum(axis=(1, 2)).tolist() == [12, 2]
+
+    frozen = batch.make_moves(np.array([2, 2, 2]))
+    assert (frozen.exponents[1:] == state.exponents[1:]).all()
+
+
+def test_get_game_state():
+    batch = BatchGame(boards_qty=1, dimension=Dimension(rows=4, cols=4))
+    batch._exponents[0] = _to_exponents(board_with_one_possible_move())
+    batch._update_results(np.ones(1, dtype=np.bool_))
+
+    game_state = batch.get_game_state(0)
+    assert game_state.tiles == board_with_one_possible_move()
+    assert game_state.status == GameStatus.IN_PROGRESS
+    assert game_state.result is None
+
+
+def test_random_games_complete():
+    batch = BatchGame(boards_qty=100, dimension=Dimension(rows=4, cols=4), seed=3)
+    batch.start()
+    moves_rng = np.random.default_rng(3)
+
+    for _ in range(2000):
+        state = batch.make_moves(moves_rng.integers(0, 4, size=100))
+        if (state.statuses == GameStatus.COMPLETED.value).all():
+            break
+
+    assert (state.statuses == GameStatus.COMPLETED.value).all()
+    assert (state.scores > 0).all()
+
+
+def test_wrong_number_of_directions():
+    batch = BatchGame(boards_qty=2, dimension=Dimension(rows=4, cols=4))
+    with pytest.raises(ValueError):
+        batch.make_moves([MoveDirection.UP])
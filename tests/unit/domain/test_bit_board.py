@@ -0,0 +1,105 @@
+import random
+
+import pytest
+
+from src.domain.dataclasses_.dimension import Dimension
+from src.domain.dataclasses_.tile import Tile
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.board import Board
+from src.domain.entities.game import Game
+from src.domain.entities.tile_spawner import TileSpawner
+from src.domain.enums_.move_direction import MoveDirection
+from src.domain.enums_.tile_value import TileValue
+from tests.unit.objects import board_random_state_1
+
+
+def test_get_tiles(tiles_for_board):
+    assert BitBoard.from_tiles(tiles_for_board).get_tiles() == tiles_for_board
+
+
+def test_get_empty_tiles_positions(tiles_for_board, empty_tiles_positions):
+    board = BitBoard.from_tiles(tiles_for_board)
+    assert board.get_empty_tiles_positions() == empty_tiles_positions
+
+
+def test_get_empty_cells(tiles_for_board, empty_tiles_positions):
+    board = BitBoard.from_tiles(tiles_for_board)
+    assert board.get_empty_cells() == [
+        position.row_idx * 4 + position.col_idx for position in empty_tiles_positions
+    ]
+
+
+def test_get_empty_mask(tiles_for_board, empty_tiles_positions):
+    board = BitBoard.from_tiles(tiles_for_board)
+    assert board.get_empty_mask() == sum(
+        1 << (position.row_idx * 4 + position.col_idx) * BitBoard.CELL_BITS
+        for position in empty_tiles_positions
+    )
+
+
+def test_create(dimension, empty_tiles_for_board):
+    assert BitBoard.create(dimension=dimension).get_tiles() == empty_tiles_for_board
+
+
+def test_create_large():
+    board = BitBoard.create(dimension=Dimension(rows=6, cols=6))
+    assert len(board.get_empty_cells()) == 36
+    assert board.get_empty_mask().bit_count() == 36
+
+
+def test_from_tiles_packs_nibbles():
+    board = BitBoard.from_tiles(board_random_state_1())
+    cells = board.get_cells()
+
+    # first row: 4, 4, 8, 8 -> exponents 2, 2, 3, 3, column 0 in the lowest nibble
+    assert cells & 0xFFFF == 0x3322
+    assert BitBoard.to_exponent(TileValue.ELEVEN) == 11
+
+
+def _from_exponents(exponents: list[list[int]]) -> BitBoard:
+    return BitBoard.from_tiles(
+        [[Tile(value=TileValue.from_exponent(exp)) for exp in row] for row in exponents]
+    )
+
+
+@pytest.mark.parametrize(
+    "exponents, moves",
+    [
+        ([[0, 0], [0, 0]], set()),
+        ([[1, 0], [0, 0]], {MoveDirection.DOWN, MoveDirection.RIGHT}),
+        ([[0, 0], [0, 1]], {MoveDirection.UP, MoveDirection.LEFT}),
+        ([[1, 1], [2, 3]], {MoveDirection.LEFT, MoveDirection.RIGHT}),
+        ([[1, 2], [1, 3]], {MoveDirection.UP, MoveDirection.DOWN}),
+        ([[1, 2], [2, 1]], set()),
+        # the largest tiles never merge
+        ([[15, 15], [2, 1]], set()),
+        # a row end and the next row start are not neighbours
+        ([[1, 2, 3], [3, 1, 2], [2, 3, 1]], set()),
+    ],
+)
+def test_get_legal_moves_mask(exponents: list[list[int]], moves: set[MoveDirection]):
+    assert _from_exponents(exponents).get_legal_moves_mask() == sum(
+        move.bit for move in moves
+    )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_get_legal_moves_mask_matches_moves(seed: int):
+    rng = random.Random(seed)
+    for _ in range(100):
+        dim = rng.randint(1, 7)
+        top = rng.choice([2, 4, 15])
+        exponents = [
+            [rng.randint(1, top) if rng.random() < 0.8 else 0 for _ in range(dim)]
+            for _ in range(dim)
+        ]
+        board = _from_exponents(exponents)
+
+        legal_moves = set()
+        for move in MoveDirection:
+            tiles = board.get_tiles()
+            game = Game(board=Board(tiles=tiles), tile_spawner=TileSpawner())
+            if game._apply_move(move=move, tiles=tiles):
+                legal_moves.add(move)
+
+        assert board.get_legal_moves_mask() == sum(move.bit for move in legal_moves)
@@ -0,0 +1,197 @@
+import random
+
+import pytest
+
+from src.domain.dataclasses_.dimension import Dimension
+from src.domain.dataclasses_.game_result import GameState
+from src.domain.dataclasses_.tile import Tile
+from src.domain.dataclasses_.tile_position import TilePosition
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.bit_board_game import BitBoardGame
+from src.domain.entities.board import Board
+from src.domain.entities.game import Game
+from src.domain.entities.move_tables import MoveTables
+from src.domain.entities.tile_spawner import TileSpawner
+from src.domain.enums_.game_result import GameResult
+from src.domain.enums_.game_status import GameStatus
+from src.domain.enums_.move_direction import MoveDirection
+from tests.unit.objects import (
+    board_random_state_1,
+    board_random_state_1_swipe_down,
+    board_random_state_1_swipe_left,
+    board_random_state_1_swipe_right,
+    board_random_state_1_swipe_up,
+    board_random_state_2,
+    board_random_state_2_swipe_down,
+    board_random_state_2_swipe_left,
+    board_random_state_2_swipe_right,
+    board_random_state_2_swipe_up,
+    board_random_state_3,
+    board_random_state_3_swipe_down,
+    board_random_state_3_swipe_left,
+    board_random_state_3_swipe_right,
+    board_random_state_3_swipe_up,
+    board_with_almost_win_condition,
+    board_with_lose_condition,
+    board_with_one_possible_move,
+    board_with_win_condition,
+    empty_board,
+)
+
+
+def test_start(bit_board_game: BitBoardGame):
+    game_state: GameState = bit_board_game.start()
+    assert game_state.tiles != empty_board()
+    assert game_state.score == 0
+    assert game_state.status == GameStatus.IN_PROGRESS
+    assert game_state.result is None
+    assert len(game_state.changed_cells) == 2
+
+
+def test__get_changed_cells(bit_board_game: BitBoardGame):
+    assert bit_board_game._get_changed_cells(0x1000_0000_0000_00F0) == {
+        TilePosition(row_idx=0, col_idx=1),
+        TilePosition(row_idx=3, col_idx=3),
+    }
+
+
+@pytest.mark.parametrize(
+    "tiles, move, expected_result",
+    [
+        (board_with_lose_condition(), MoveDirection.RIGHT, board_with_lose_condition()),
+        (
+            board_random_state_1(),
+            MoveDirection.RIGHT,
+            board_random_state_1_swipe_right(),
+        ),
+        (board_random_state_1(), MoveDirection.LEFT, board_random_state_1_swipe_left()),
+        (board_random_state_1(), MoveDirection.UP, board_random_state_1_swipe_up()),
+        (board_random_state_1(), MoveDirection.DOWN, board_random_state_1_swipe_down()),
+        (
+            board_random_state_2(),
+            MoveDirection.RIGHT,
+            board_random_state_2_swipe_right(),
+        ),
+        (board_random_state_2(), MoveDirection.LEFT, board_random_state_2_swipe_left()),
+        (board_random_state_2(), MoveDirection.UP, board_random_state_2_swipe_up()),
+        (board_random_state_2(), MoveDirection.DOWN, board_random_state_2_swipe_down()),
+        (
+            board_random_state_3(),
+            MoveDirection.RIGHT,
+            board_random_state_3_swipe_right(),
+        ),
+        (board_random_state_3(), MoveDirection.LEFT, board_random_state_3_swipe_left()),
+        (board_random_state_3(), MoveDirection.UP, board_random_state_3_swipe_up()),
+        (board_random_state_3(), MoveDirection.DOWN, board_random_state_3_swipe_down()),
+    ],
+)
+def test__apply_move(
+    bit_board_game: BitBoardGame,
+    tiles: list[list[Tile]],
+    move: MoveDirection,
+    expected_result: list[list[Tile]],
+):
+    cells = BitBoard.from_tiles(tiles).get_cells()
+    expected_cells = BitBoard.from_tiles(expected_result).get_cells()
+    assert bit_board_game._apply_move(move, cells) == expected_cells
+
+
+def test__apply_move_score(bit_board_game: BitBoardGame):
+    cells = BitBoard.from_tiles(board_random_state_3()).get_cells()
+    bit_board_game._apply_move(MoveDirection.UP, cells)
+    assert bit_board_game._score == 48
+
+
+@pytest.mark.parametrize("dim", [4, 5, 7])
+def test__transpose(dim: int):
+    game = BitBoardGame(
+        board=BitBoard.create(Dimension(rows=dim, cols=dim)),
+        tile_spawner=TileSpawner(),
+    )
+    rng = random.Random(dim)
+    cells = 0
+    for idx in range(dim * dim):
+        cells |= rng.randrange(16) << (idx * BitBoard.CELL_BITS)
+
+    transposed = game._transpose(cells)
+
+    for row_idx in range(dim):
+        for col_idx in range(dim):
+            src = (row_idx * dim + col_idx) * BitBoard.CELL_BITS
+            dst = (col_idx * dim + row_idx) * BitBoard.CELL_BITS
+            assert (cells >> src) & 0xF == (transposed >> dst) & 0xF
+    assert game._transpose(transposed) == cells
+
+
+@pytest.mark.parametrize(
+    "tiles, expected_result",
+    [
+        (board_with_lose_condition(), GameResult.LOSE),
+        (board_with_win_condition(), GameResult.WIN),
+        (board_with_one_possible_move(), None),
+        (board_with_almost_win_condition(), None),
+        (board_random_state_1(), None),
+    ],
+)
+def test__get_game_result(
+    bit_board_game: BitBoardGame,
+    tiles: list[list[Tile]],
+    expected_result: GameResult | None,
+):
+    cells = BitBoard.from_tiles(tiles).get_cells()
+    assert bit_board_game._get_game_result(cells) == expected_result
+
+
+def test__apply_move_invalid_direction(bit_board_game: BitBoardGame):
+    with pytest.raises(ValueError):
+        bit_board_game._apply_move("diagonal", 0)
+
+
+def test_apply_moves_matches_make_move(move_tables: MoveTables):
+    moves_rng = random.Random(3)
+    moves = [moves_rng.choice(list(MoveDirection)) for _ in range(60)]
+
+    def create_game() -> BitBoardGame:
+        return BitBoardGame(
+            board=BitBoard.create(Dimension(rows=4, cols=4)),
+            tile_spawner=TileSpawner(rng=random.Random(8)),
+            move_tables=move_tables,
+        )
+
+    stepped = create_game()
+    stepped.start()
+    for move in moves:
+        state = stepped.make_move(move)
+
+    replayed = create_game()
+    replayed.start()
+    summary = replayed.apply_moves(moves)
+
+    assert replayed._board.get_cells() == stepped._board.get_cells()
+    assert summary.score == state.score
+    assert summary.moves == len(moves)
+    assert summary.max_tile == max(tile.value for row in state.tiles for tile in row)
+
+
+@pytest.mark.parametrize("dim", [4, 5])
+def test_get_legal_moves_mask_matches_game(dim: int):
+    dimension = Dimension(rows=dim, cols=dim)
+    game = Game(
+        board=Board.create(dimension), tile_spawner=TileSpawner(rng=random.Random(1))
+    )
+    bit_board_game = BitBoardGame(
+        board=BitBoard.create(dimension), tile_spawner=TileSpawner(rng=random.Random(1))
+    )
+    game.start()
+    bit_board_game.start()
+    moves_rng = random.Random(1)
+
+    for _ in range(200):
+        mask = game.get_legal_moves_mask()
+        assert bit_board_game.get_legal_moves_mask() == mask
+        if not mask:
+            break
+        legal_moves = [move for move in MoveDirection if mask & move.bit]
+        move = moves_rng.choice(legal_moves)
+        game.make_move(move)
+        bit_board_game.make_move(move)
@@ -1,4 +1,9 @@
+import random
+
+from src.domain.dataclasses_.tile import Tile
+from src.domain.dataclasses_.tile_position import TilePosition
 from src.domain.entities.board import Board
+from src.domain.enums_.tile_value import TileValue
 
 
 def test_get_tiles(board_with_tiles, tiles_for_board):
@@ -6,8 +11,47 @@ def test_get_tiles(board_with_tiles, tiles_for_board):
 
 
 def test_get_empty_tiles_positions(board_with_tiles, empty_tiles_positions):
-    assert board_with_tiles.get_empty_tiles_positions() == empty_tiles_positions
+    assert list(board_with_tiles.get_empty_tiles_positions()) == empty_tiles_positions
+
+
+def test_get_empty_cells_count(board_with_tiles, empty_tiles_positions):
+    assert board_with_tiles.get_empty_cells_count() == len(empty_tiles_positions)
+
+
+def test_update_cells(board_with_tiles, tiles_for_board):
+    tiles = tiles_for_board
+    filled = board_with_tiles.get_empty_tiles_positions()[1]
+    emptied = TilePosition(row_idx=0, col_idx=0)
+    tiles[filled.row_idx][filled.col_idx] = Tile(value=TileValue.ONE)
+    tiles[emptied.row_idx][emptied.col_idx] = Tile(value=TileValue.ZERO)
+
+    board_with_tiles.update_cells([filled, emptied])
+
+    assert list(board_with_tiles.get_empty_tiles_positions()) == list(
+        Board(tiles=tiles).get_empty_tiles_positions()
+    )
+    assert board_with_tiles.get_empty_cells_count() == len(
+        Board(tiles=tiles).get_empty_tiles_positions()
+    )
 
 
 def test_create(dimension, empty_tiles_for_board):
     assert Board.create(dimension=dimension).get_tiles() == empty_tiles_for_board
+
+
+def test_update_cells_keeps_row_major_order():
+    rng = random.Random(0)
+    values = [TileValue.ZERO, TileValue.ONE]
+    tiles = [[Tile(value=rng.choice(values)) for _ in range(7)] for _ in range(7)]
+    board = Board(tiles=tiles)
+
+    for _ in range(300):
+        row_idx, col_idx = rng.randrange(7), rng.randrange(7)
+        tiles[row_idx][col_idx] = Tile(value=rng.choice(values))
+        board.update_cells([TilePosition(row_idx=row_idx, col_idx=col_idx)])
+
+        empty = list(Board(tiles=tiles).get_empty_tiles_positions())
+        positions = board.get_empty_tiles_positions()
+        assert list(positions) == empty
+        assert positions[-1:] == empty[-1:]
+        assert board.get_empty_cells_count() == len(empty)
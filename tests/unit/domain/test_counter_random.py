@@ -0,0 +1,46 @@
+from collections import Counter
+
+import pytest
+
+from src.domain.entities.counter_random import CounterRandom
+
+
+def test_same_seed_same_sequence():
+    first = CounterRandom(seed=42)
+    second = CounterRandom(seed=42)
+
+    assert [first.random() for _ in range(100)] == [
+        second.random() for _ in range(100)
+    ]
+    assert CounterRandom(seed=1).random() != CounterRandom(seed=2).random()
+
+
+def test_random_range():
+    rng = CounterRandom(seed=7)
+    values = [rng.random() for _ in range(10000)]
+
+    assert all(0.0 <= value < 1.0 for value in values)
+    assert 0.45 < sum(values) / len(values) < 0.55
+
+
+def test_choice_is_roughly_uniform():
+    rng = CounterRandom(seed=3)
+    counts = Counter(rng.choice("abcd") for _ in range(8000))
+
+    assert set(counts) == set("abcd")
+    assert all(1800 < count < 2200 for count in counts.values())
+
+
+def test_choice_from_empty_sequence():
+    with pytest.raises(IndexError):
+        CounterRandom().choice([])
+
+
+def test_state_round_trip():
+    rng = CounterRandom(seed=5)
+    rng.random()
+    state = rng.getstate()
+    expected = [rng.randrange(16) for _ in range(10)]
+
+    rng.setstate(state)
+    assert [rng.randrange(16) for _ in range(10)] == expected
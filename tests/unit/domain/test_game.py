@@ -1,11 +1,20 @@
+import random
+from collections.abc import Callable
+
 import pytest
 
 from src.domain.dataclasses_.game_result import GameState
 from src.domain.dataclasses_.tile import Tile
+from src.domain.dataclasses_.tile_position import TilePosition
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.board import Board
 from src.domain.entities.game import Game
+from src.domain.entities.move_tables import MoveTables
+from src.domain.entities.tile_spawner import TileSpawner
 from src.domain.enums_.game_result import GameResult
 from src.domain.enums_.game_status import GameStatus
 from src.domain.enums_.move_direction import MoveDirection
+from src.domain.enums_.tile_value import TileValue
 from tests.unit.objects import (
     board_random_state_1,
     board_random_state_1_swipe_down,
@@ -94,7 +103,7 @@ def test_make_move(
     expected_status: GameStatus,
     expected_result: GameResult | None,
 ):
-    game._board._tiles = tiles
+    game._board = Board(tiles=tiles)
     game_state: GameState = game.make_move(move_direction=move)
 
     differences = 0
@@ -142,7 +151,7 @@ def test__apply_move(
 def test__apply_move_right(
     game: Game, tiles: list[list[Tile]], expected_result: list[list[Tile]]
 ):
-    game._apply_move_right(tiles)
+    game._apply_move(move=MoveDirection.RIGHT, tiles=tiles)
     assert tiles == expected_result
 
 
@@ -158,7 +167,7 @@ def test__apply_move_right(
 def test__apply_move_left(
     game: Game, tiles: list[list[Tile]], expected_result: list[list[Tile]]
 ):
-    game._apply_move_left(tiles)
+    game._apply_move(move=MoveDirection.LEFT, tiles=tiles)
     assert tiles == expected_result
 
 
@@ -174,7 +183,7 @@ def test__apply_move_left(
 def test__apply_move_down(
     game: Game, tiles: list[list[Tile]], expected_result: list[list[Tile]]
 ):
-    game._apply_move_down(tiles)
+    game._apply_move(move=MoveDirection.DOWN, tiles=tiles)
     assert tiles == expected_result
 
 
@@ -190,28 +199,76 @@ def test__apply_move_down(
 def test__apply_move_up(
     game: Game, tiles: list[list[Tile]], expected_result: list[list[Tile]]
 ):
-    game._apply_move_up(tiles)
+    game._apply_move(move=MoveDirection.UP, tiles=tiles)
     assert tiles == expected_result
 
 
 @pytest.mark.parametrize(
-    "tiles_before, tiles_after, expected_result",
+    "create_tiles, move, create_tiles_after",
     [
-        (board_random_state_1(), board_random_state_1(), False),
-        (board_with_lose_condition(), board_with_lose_condition(), False),
-        (empty_board(), empty_board(), False),
-        (board_random_state_2(), board_random_state_2_swipe_up(), False),
-        (board_random_state_3(), board_random_state_3_swipe_left(), True),
-        (board_random_state_3(), board_random_state_3_swipe_up(), True),
+        (board_random_state_1, MoveDirection.RIGHT, board_random_state_1_swipe_right),
+        (board_random_state_1, MoveDirection.DOWN, board_random_state_1_swipe_down),
+        (board_random_state_2, MoveDirection.LEFT, board_random_state_2_swipe_left),
+        (board_random_state_2, MoveDirection.UP, board_random_state_2_swipe_up),
+        (board_random_state_3, MoveDirection.LEFT, board_random_state_3_swipe_left),
+        (board_random_state_3, MoveDirection.UP, board_random_state_3_swipe_up),
+        (board_with_lose_condition, MoveDirection.RIGHT, board_with_lose_condition),
+        (empty_board, MoveDirection.DOWN, empty_board),
     ],
 )
-def test__has_board_changed(
-    game: Game,
-    tiles_before: list[list[Tile]],
-    tiles_after: list[list[Tile]],
-    expected_result: bool,
+@pytest.mark.parametrize("with_tables", [False, True])
+def test__apply_move_changed_cells(
+    move_tables: MoveTables,
+    tile_spawner: TileSpawner,
+    create_tiles: Callable[[], list[list[Tile]]],
+    move: MoveDirection,
+    create_tiles_after: Callable[[], list[list[Tile]]],
+    with_tables: bool,
 ):
-    assert game._has_board_changed(tiles_before, tiles_after) == expected_result
+    tiles = create_tiles()
+    tiles_after = create_tiles_after()
+    game = Game(
+        board=Board(tiles=tiles),
+        tile_spawner=tile_spawner,
+        move_tables=move_tables if with_tables else None,
+    )
+    expected = {
+        TilePosition(row_idx=row_idx, col_idx=col_idx)
+        for row_idx, row in enumerate(tiles)
+        for col_idx, tile in enumerate(row)
+        if tile != tiles_after[row_idx][col_idx]
+    }
+
+    assert game._apply_move(move=move, tiles=tiles) == expected
+
+
+def test_make_move_changed_cells(game: Game):
+    game._board = Board(tiles=board_random_state_3())
+    game_state: GameState = game.make_move(move_direction=MoveDirection.UP)
+
+    expected_tiles = board_random_state_3_swipe_up()
+    moved = {
+        TilePosition(row_idx=row_idx, col_idx=col_idx)
+        for row_idx, row in enumerate(board_random_state_3())
+        for col_idx, tile in enumerate(row)
+        if tile != expected_tiles[row_idx][col_idx]
+    }
+    spawned = {
+        TilePosition(row_idx=row_idx, col_idx=col_idx)
+        for row_idx, row in enumerate(game_state.tiles)
+        for col_idx, tile in enumerate(row)
+        if tile != expected_tiles[row_idx][col_idx]
+    }
+
+    assert len(spawned) == 1
+    assert game_state.changed_cells == moved | spawned
+
+
+def test_make_move_without_changes(game: Game):
+    game._board = Board(tiles=board_with_lose_condition())
+    game_state: GameState = game.make_move(move_direction=MoveDirection.RIGHT)
+
+    assert game_state.changed_cells == frozenset()
 
 
 @pytest.mark.parametrize(
@@ -226,5 +283,212 @@ def test__has_board_changed(
 def test__get_game_result(
     game: Game, tiles: list[list[Tile]], expected_result: GameResult | None
 ):
-    game._board._tiles = tiles
+    game._board = Board(tiles=tiles)
     assert game._get_game_result(tiles) == expected_result
+
+
+@pytest.mark.parametrize(
+    "value, expected_value",
+    [
+        (TileValue.ELEVEN, TileValue.TWELVE),
+        (TileValue.FOURTEEN, TileValue.FIFTEEN),
+        (TileValue.FIFTEEN, TileValue.FIFTEEN),
+    ],
+)
+def test__apply_move_past_win(
+    game: Game, value: TileValue, expected_value: TileValue
+):
+    tiles = empty_board()
+    tiles[0][0] = Tile(value=value)
+    tiles[0][1] = Tile(value=value)
+
+    game._apply_move(move=MoveDirection.LEFT, tiles=tiles)
+
+    assert tiles[0][0] == Tile(value=expected_value)
+
+
+def _slide_reference(values: list[TileValue]) -> tuple[list[TileValue], int]:
+    """Straightforward model of a move along one line: compact, then merge."""
+    tiles = [value for value in values if value != TileValue.ZERO]
+    moved: list[TileValue] = []
+    score = 0
+    while tiles:
+        value = tiles.pop(0)
+        if tiles and tiles[0] == value and value != TileValue.FIFTEEN:
+            tiles.pop(0)
+            value = value.next()
+            score += value
+        moved.append(value)
+    return moved + [TileValue.ZERO] * (len(values) - len(moved)), score
+
+
+def _move_reference(
+    tiles: list[list[Tile]], move: MoveDirection
+) -> tuple[list[list[Tile]], int]:
+    dim = len(tiles)
+    grid = [[tile.value for tile in row] for row in tiles]
+    if move in (MoveDirection.UP, MoveDirection.DOWN):
+        grid = [list(column) for column in zip(*grid)]
+    if move in (MoveDirection.RIGHT, MoveDirection.DOWN):
+        grid = [row[::-1] for row in grid]
+
+    score = 0
+    for idx in range(dim):
+        grid[idx], line_score = _slide_reference(grid[idx])
+        score += line_score
+
+    if move in (MoveDirection.RIGHT, MoveDirection.DOWN):
+        grid = [row[::-1] for row in grid]
+    if move in (MoveDirection.UP, MoveDirection.DOWN):
+        grid = [list(row) for row in zip(*grid)]
+    return [[Tile(value=value) for value in row] for row in grid], score
+
+
+def _random_tiles(rng: random.Random, dim: int) -> list[list[Tile]]:
+    # few distinct values and many empty cells, so lines slide and merge a lot
+    top = rng.choice([3, 6, 15])
+    return [
+        [
+            Tile(value=TileValue.from_exponent(rng.randint(1, top)))
+            if rng.random() < 0.6
+            else Tile(value=TileValue.ZERO)
+            for _ in range(dim)
+        ]
+        for _ in range(dim)
+    ]
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("move", list(MoveDirection))
+def test__apply_move_matches_reference(
+    tile_spawner: TileSpawner, move: MoveDirection, seed: int
+):
+    rng = random.Random(seed)
+    for _ in range(50):
+        tiles = _random_tiles(rng, dim=rng.randint(1, 9))
+        expected_tiles, expected_score = _move_reference(tiles, move)
+        expected_changed = {
+            TilePosition(row_idx=row_idx, col_idx=col_idx)
+            for row_idx, row in enumerate(tiles)
+            for col_idx, tile in enumerate(row)
+            if tile != expected_tiles[row_idx][col_idx]
+        }
+        game = Game(board=Board(tiles=tiles), tile_spawner=tile_spawner)
+
+        changed = game._apply_move(move=move, tiles=tiles)
+
+        assert tiles == expected_tiles
+        assert game._score == expected_score
+        assert changed == expected_changed
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test__apply_move_matches_move_tables(
+    move_tables: MoveTables, tile_spawner: TileSpawner, seed: int
+):
+    rng = random.Random(seed)
+    for _ in range(50):
+        tiles = _random_tiles(rng, dim=4)
+        for move in MoveDirection:
+            with_kernel = [row[:] for row in tiles]
+            with_tables = [row[:] for row in tiles]
+            kernel_game = Game(board=Board(tiles=with_kernel), tile_spawner=tile_spawner)
+            tables_game = Game(
+                board=Board(tiles=with_tables),
+                tile_spawner=tile_spawner,
+                move_tables=move_tables,
+            )
+
+            changed = kernel_game._apply_move(move=move, tiles=with_kernel)
+
+            assert changed == tables_game._apply_move(move=move, tiles=with_tables)
+            assert with_kernel == with_tables
+            assert kernel_game._score == tables_game._score
+
+
+def test_get_legal_moves_mask_is_cached_until_the_board_changes(
+    game: Game, monkeypatch: pytest.MonkeyPatch
+):
+    game._board = Board(tiles=board_with_one_possible_move())
+    computed = []
+    get_legal_moves_mask = BitBoard.get_legal_moves_mask
+
+    def count(board: BitBoard) -> int:
+        computed.append(board.get_cells())
+        return get_legal_moves_mask(board)
+
+    monkeypatch.setattr(BitBoard, "get_legal_moves_mask", count)
+
+    mask = game.get_legal_moves_mask()
+    assert game.get_legal_moves_mask() == mask
+    assert len(computed) == 1
+
+    game.make_move(next(move for move in MoveDirection if mask & move.bit))
+    game.get_legal_moves_mask()
+    assert len(computed) == 2
+
+
+def test__get_game_result_largest_tiles_do_not_merge(game: Game):
+    tiles = board_with_lose_condition()
+    tiles[0][0] = tiles[0][1] = Tile(value=TileValue.FIFTEEN)
+    game._board = Board(tiles=tiles)
+
+    assert game._get_game_result(tiles) == GameResult.LOSE
+
+
+@pytest.mark.parametrize("dim", [3, 4, 5])
+@pytest.mark.parametrize("with_tables", [False, True])
+def test_successors_match_moves(move_tables: MoveTables, dim: int, with_tables: bool):
+    rng = random.Random(dim)
+    for _ in range(30):
+        tiles = _random_tiles(rng, dim)
+        game = Game(
+            board=Board(tiles=tiles),
+            tile_spawner=TileSpawner(),
+            move_tables=move_tables if with_tables else None,
+        )
+
+        successors = game.successors()
+
+        assert list(successors) == list(MoveDirection)
+        for move, preview in successors.items():
+            moved = [row[:] for row in tiles]
+            reference = Game(board=Board(tiles=moved), tile_spawner=TileSpawner())
+            changed_cells = reference._apply_move(move=move, tiles=moved)
+            assert preview == game.preview(move)
+            assert preview.direction == move
+            after = BitBoard(cells=preview.cells, dim=preview.dimension)
+            assert after.get_tiles() == moved
+            assert preview.score_delta == reference._score
+            assert preview.changed == bool(changed_cells)
+
+
+def test_successors_do_not_change_the_game():
+    game = Game(
+        board=Board(tiles=board_random_state_1()),
+        tile_spawner=TileSpawner(rng=random.Random(0)),
+    )
+    snapshot = game.get_snapshot()
+
+    game.successors()
+    game.preview(MoveDirection.LEFT)
+
+    assert game.get_snapshot() == snapshot
+    assert game._board.get_tiles() == board_random_state_1()
+
+
+def test_successors_follow_the_board(game: Game):
+    game._board = Board(tiles=board_random_state_1())
+    game.successors()
+
+    state = game.make_move(MoveDirection.LEFT)
+
+    fresh = Game(
+        board=Board(tiles=[row[:] for row in state.tiles]), tile_spawner=TileSpawner()
+    )
+    assert game.successors() == fresh.successors()
+
+
+def test_preview_invalid_direction(game: Game):
+    with pytest.raises(ValueError):
+        game.preview("diagonal")  # type: ignore[arg-type]
@@ -0,0 +1,116 @@
+import random
+from collections.abc import Callable
+
+import pytest
+
+from src.domain.dataclasses_.dimension import Dimension
+from src.domain.dataclasses_.game_snapshot import GameSnapshot
+from src.domain.dataclasses_.tile import Tile
+from src.domain.entities.batch_game import BatchGame
+from src.domain.entities.bit_board import BitBoard
+from src.domain.enums_.game_result import GameResult
+from src.domain.enums_.move_direction import MoveDirection
+from src.domain.enums_.tile_value import TileValue
+from src.domain.interfaces.domain.game import IGame
+from tests.unit.objects import GAME_FACTORIES, classic_game, play_random_game
+
+GameFactory = Callable[[int, int], IGame]
+
+
+def _to_snapshot(exponents: list[list[int]]) -> GameSnapshot:
+    tiles = [[Tile(value=TileValue.from_exponent(e)) for e in row] for row in exponents]
+    return GameSnapshot(
+        dimension=len(exponents), cells=BitBoard.from_tiles(tiles).get_cells(), score=0
+    )
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("dim", [4, 5, 8])
+@pytest.mark.parametrize("create_game", GAME_FACTORIES[1:], ids=lambda f: f.__name__)
+def test_same_seed_same_game(create_game: GameFactory, dim: int, seed: int):
+    expected = play_random_game(classic_game(dim, seed), seed, 400)
+
+    assert play_random_game(create_game(dim, seed), seed, 400) == expected
+
+
+@pytest.mark.parametrize("create_game", GAME_FACTORIES, ids=lambda f: f.__name__)
+@pytest.mark.parametrize("create_resumed", GAME_FACTORIES, ids=lambda f: f.__name__)
+@pytest.mark.parametrize("dim", [4, 5])
+def test_resume_from_snapshot(
+    create_game: GameFactory, create_resumed: GameFactory, dim: int
+):
+    moves_rng = random.Random(5)
+    moves = [moves_rng.choice(list(MoveDirection)) for _ in range(40)]
+    original = create_game(dim, 1)
+    original.start()
+    for move in moves[:20]:
+        original.make_move(move)
+
+    snapshot = original.get_snapshot()
+    resumed = create_resumed(dim, 2)
+    resumed.restore_snapshot(snapshot)
+
+    assert resumed.get_snapshot() == snapshot
+    for move in moves[20:]:
+        original.make_move(move)
+        resumed.make_move(move)
+        assert resumed.get_snapshot() == original.get_snapshot()
+
+
+@pytest.mark.parametrize("create_game", GAME_FACTORIES, ids=lambda f: f.__name__)
+def test_restore_snapshot_other_dimension(create_game: GameFactory):
+    snapshot = create_game(4, 0).get_snapshot()
+
+    with pytest.raises(ValueError):
+        create_game(5, 0).restore_snapshot(snapshot)
+
+
+@pytest.mark.parametrize("create_game", GAME_FACTORIES, ids=lambda f: f.__name__)
+@pytest.mark.parametrize("cells", [-1, 1 << 64])
+def test_restore_snapshot_cells_do_not_fit(create_game: GameFactory, cells: int):
+    snapshot = GameSnapshot(dimension=4, cells=cells, score=0)
+
+    with pytest.raises(ValueError):
+        create_game(4, 0).restore_snapshot(snapshot)
+
+
+@pytest.mark.parametrize("dim", [4, 5])
+def test_batch_game_moves_match(dim: int):
+    np = pytest.importorskip("numpy")
+    rng = random.Random(dim)
+    # the largest tiles are frequent, so that pairs of FIFTEEN (never merged) appear
+    values = [0, 1, 2, 13, 14, 15, 15]
+    boards = [
+        [[rng.choice(values) for _ in range(dim)] for _ in range(dim)]
+        for _ in range(100)
+    ]
+    batch = BatchGame(boards_qty=len(boards), dimension=Dimension(rows=dim, cols=dim))
+
+    for direction in BatchGame.DIRECTIONS:
+        batch._exponents = np.array(boards, np.uint8)
+        batch._scores[:] = 0
+        batch._apply_move(direction, np.ones(len(boards), dtype=np.bool_))
+
+        for idx, exponents in enumerate(boards):
+            game = classic_game(dim, 0)
+            game.restore_snapshot(_to_snapshot(exponents))
+            preview = game.preview(direction)
+            moved = BitBoard(cells=preview.cells, dim=dim).get_tiles()
+
+            assert batch.get_game_state(idx).tiles == moved
+            assert batch._scores[idx] == preview.score_delta
+
+
+def test_batch_game_result_matches():
+    np = pytest.importorskip("numpy")
+    # full, and only pairs of FIFTEEN are equal neighbours
+    exponents = [[15, 15, 1, 2], [1, 2, 15, 15], [15, 15, 1, 2], [1, 2, 15, 15]]
+    game = classic_game(4, 0)
+    game.restore_snapshot(_to_snapshot(exponents))
+    batch = BatchGame(boards_qty=1, dimension=Dimension(rows=4, cols=4))
+    batch._exponents = np.array([exponents], np.uint8)
+
+    batch._update_results(np.ones(1, dtype=np.bool_))
+
+    assert game.get_snapshot().result is GameResult.LOSE
+    assert batch.get_game_state(0).result is GameResult.LOSE
@@ -0,0 +1,103 @@
+import random
+
+import pytest
+
+from src.domain.dataclasses_.game_snapshot import GameSnapshot
+from src.domain.entities.counter_random import CounterRandom
+from src.domain.entities.game_history import GameHistory
+
+
+def _snapshot(idx: int, rng_state: object = None) -> GameSnapshot:
+    return GameSnapshot(dimension=4, cells=idx, score=idx * 4, rng_state=rng_state)
+
+
+def test_undo_and_redo():
+    history = GameHistory()
+    for idx in range(3):
+        history.record(_snapshot(idx))
+
+    assert history.undo(_snapshot(3)) == _snapshot(2)
+    assert history.undo(_snapshot(2)) == _snapshot(1)
+    assert history.redo(_snapshot(1)) == _snapshot(2)
+    assert history.redo(_snapshot(2)) == _snapshot(3)
+    assert history.redo(_snapshot(3)) is None
+    assert history.can_undo()
+    assert not history.can_redo()
+
+
+def test_record_clears_redo():
+    history = GameHistory()
+    history.record(_snapshot(0))
+    history.undo(_snapshot(1))
+
+    history.record(_snapshot(0))
+
+    assert not history.can_redo()
+    assert history.undo(_snapshot(5)) == _snapshot(0)
+    assert history.undo(_snapshot(0)) is None
+
+
+def test_oldest_entries_are_dropped():
+    size = GameHistory()
+    size.record(_snapshot(1))
+    history = GameHistory(max_bytes=3 * size.get_size())
+
+    for idx in range(10):
+        history.record(_snapshot(idx))
+
+    assert history.get_size() <= 3 * size.get_size()
+    undone = [history.undo(_snapshot(0)) for _ in range(3)]
+    assert undone == [_snapshot(9), _snapshot(8), _snapshot(7)]
+    assert not history.can_undo()
+
+
+def test_zero_bytes_disables_history():
+    history = GameHistory(max_bytes=0)
+    history.record(_snapshot(0))
+
+    assert not history.can_undo()
+    assert history.get_size() == 0
+
+
+def test_negative_max_bytes():
+    with pytest.raises(ValueError):
+        GameHistory(max_bytes=-1)
+
+
+def test_mersenne_words_are_shared():
+    rng = random.Random(0)
+    history = GameHistory(max_bytes=1 << 30)
+    states = []
+    for idx in range(500):
+        states.append(rng.getstate())
+        history.record(_snapshot(idx, rng.getstate()))
+        rng.randrange(16)
+        rng.random()
+
+    # 500 moves draw ~1500 words of 624 (plus the initial twist of a newly
+    # seeded generator): a handful of word tuples, not 500
+    assert len(history._words_refs) <= 5
+    assert history.get_size() < 500 * 1000
+
+    current = _snapshot(500, rng.getstate())
+    for idx in reversed(range(500)):
+        current = history.undo(current)
+        assert current == _snapshot(idx, states[idx])
+    while history.can_redo():
+        history.redo(_snapshot(0, rng.getstate()))
+    history.clear()
+    assert history.get_size() == 0
+
+
+def test_size_is_released():
+    history = GameHistory()
+    rng = random.Random(0)
+    history.record(_snapshot(0, CounterRandom(1).getstate()))
+    history.record(_snapshot(1, rng.getstate()))
+    size = history.get_size()
+
+    history.undo(_snapshot(2, rng.getstate()))
+    history.redo(_snapshot(1, rng.getstate()))
+
+    assert history.get_size() == size
+    assert len(history._words_refs) == 1
@@ -0,0 +1,164 @@
+import random
+
+import pytest
+
+from src.domain.dataclasses_.dimension import Dimension
+from src.domain.dataclasses_.tile import Tile
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.bit_board_game import BitBoardGame
+from src.domain.entities.board import Board
+from src.domain.entities.game import Game
+from src.domain.entities.move_tables import MoveTables
+from src.domain.entities.tile_spawner import TileSpawner
+from src.domain.enums_.game_status import GameStatus
+from src.domain.enums_.move_direction import MoveDirection
+from tests.unit.objects import (
+    board_random_state_1,
+    board_random_state_1_swipe_down,
+    board_random_state_1_swipe_left,
+    board_random_state_1_swipe_right,
+    board_random_state_1_swipe_up,
+    board_random_state_3,
+    board_random_state_3_swipe_down,
+    board_random_state_3_swipe_left,
+    board_random_state_3_swipe_right,
+    board_random_state_3_swipe_up,
+    board_with_lose_condition,
+)
+
+
+class InMemoryCache:
+    def __init__(self, data: bytes | None = None) -> None:
+        self.data = data
+        self.saves = 0
+
+    def load(self) -> bytes | None:
+        return self.data
+
+    def save(self, data: bytes) -> None:
+        self.data = data
+        self.saves += 1
+
+
+@pytest.mark.parametrize(
+    "row, expected_left, expected_right, expected_score",
+    [
+        # exponents, column 0 in the lowest nibble
+        (0x0000, 0x0000, 0x0000, 0),
+        (0x1111, 0x0022, 0x2200, 8),
+        (0x0101, 0x0002, 0x2000, 4),
+        (0x3322, 0x0043, 0x4300, 24),
+        (0x1211, 0x0122, 0x1220, 4),
+        (0xFF00, 0x00FF, 0xFF00, 0),
+    ],
+)
+def test_row_tables(move_tables, row, expected_left, expected_right, expected_score):
+    assert move_tables.left_rows[row] == expected_left
+    assert move_tables.right_rows[row] == expected_right
+    assert move_tables.left_scores[row] == expected_score
+
+
+def test_tables_match_row_function(move_tables):
+    for row in range(0, MoveTables.ROWS_QTY, 97):
+        assert (move_tables.left_rows[row], move_tables.left_scores[row]) == (
+            MoveTables.move_row_left(row, 4)
+        )
+
+
+def test_cache_is_filled_on_first_use(move_tables):
+    cache = InMemoryCache()
+    tables = MoveTables(cache=cache)
+    assert cache.saves == 0
+
+    tables.left_rows
+    tables.right_scores
+    assert cache.saves == 1
+    assert cache.data == move_tables.to_bytes()
+
+
+def test_cache_is_reused(move_tables):
+    cache = InMemoryCache(move_tables.to_bytes())
+    tables = MoveTables(cache=cache)
+
+    assert tables.right_rows == move_tables.right_rows
+    assert cache.saves == 0
+
+
+@pytest.mark.parametrize("corrupt", [b"", b"garbage", b"2048MT\x01" + b"\x00" * 10])
+def test_corrupted_cache_is_rebuilt(move_tables, corrupt):
+    cache = InMemoryCache(corrupt)
+    tables = MoveTables(cache=cache)
+
+    assert tables.left_rows == move_tables.left_rows
+    assert cache.saves == 1
+
+
+@pytest.mark.parametrize(
+    "tiles, move, expected_result",
+    [
+        (board_with_lose_condition(), MoveDirection.RIGHT, board_with_lose_condition()),
+        (
+            board_random_state_1(),
+            MoveDirection.RIGHT,
+            board_random_state_1_swipe_right(),
+        ),
+        (board_random_state_1(), MoveDirection.LEFT, board_random_state_1_swipe_left()),
+        (board_random_state_1(), MoveDirection.UP, board_random_state_1_swipe_up()),
+        (board_random_state_1(), MoveDirection.DOWN, board_random_state_1_swipe_down()),
+        (
+            board_random_state_3(),
+            MoveDirection.RIGHT,
+            board_random_state_3_swipe_right(),
+        ),
+        (board_random_state_3(), MoveDirection.LEFT, board_random_state_3_swipe_left()),
+        (board_random_state_3(), MoveDirection.UP, board_random_state_3_swipe_up()),
+        (board_random_state_3(), MoveDirection.DOWN, board_random_state_3_swipe_down()),
+    ],
+)
+def test_game_apply_move_with_tables(
+    move_tables: MoveTables,
+    tiles: list[list[Tile]],
+    move: MoveDirection,
+    expected_result: list[list[Tile]],
+):
+    game = Game(
+        board=Board(tiles=tiles), tile_spawner=TileSpawner(), move_tables=move_tables
+    )
+    game._apply_move(move=move, tiles=tiles)
+    assert tiles == expected_result
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_tables_do_not_change_the_game(move_tables: MoveTables, seed: int):
+    dimension = Dimension(rows=4, cols=4)
+
+    def play(game: Game | BitBoardGame) -> list[tuple]:
+        moves_rng = random.Random(seed)
+        states = [game.start()]
+        for _ in range(400):
+            states.append(game.make_move(moves_rng.choice(list(MoveDirection))))
+            if states[-1].status is GameStatus.COMPLETED:
+                break
+        return [state.score for state in states] + [states[-1].tiles]
+
+    expected = play(
+        Game(
+            board=Board.create(dimension),
+            tile_spawner=TileSpawner(rng=random.Random(seed)),
+        )
+    )
+
+    assert expected == play(
+        Game(
+            board=Board.create(dimension),
+            tile_spawner=TileSpawner(rng=random.Random(seed)),
+            move_tables=move_tables,
+        )
+    )
+    assert expected == play(
+        BitBoardGame(
+            board=BitBoard.create(dimension),
+            tile_spawner=TileSpawner(rng=random.Random(seed)),
+            move_tables=move_tables,
+        )
+    )
@@ -0,0 +1,42 @@
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from src.domain.dataclasses_.tile import Tile
+from src.domain.dataclasses_.tile_position import TilePosition
+from src.domain.enums_.tile_value import TileValue
+
+
+def test_tile_is_interned():
+    assert Tile(value=TileValue.THREE) is Tile(TileValue.THREE)
+    assert Tile(value=TileValue.THREE) != Tile(value=TileValue.FOUR)
+
+
+def test_tile_value_is_normalized():
+    assert Tile(value=TileValue.SIX).value is TileValue.SIX
+    assert Tile(64) is Tile(value=TileValue.SIX)
+
+
+def test_tile_position_is_interned():
+    assert TilePosition(row_idx=2, col_idx=3) is TilePosition(2, 3)
+    assert len({TilePosition(1, 1), TilePosition(row_idx=1, col_idx=1)}) == 1
+
+
+@pytest.mark.parametrize(
+    "value", [Tile(value=TileValue.ONE), TilePosition(row_idx=0, col_idx=1)]
+)
+def test_copies_keep_identity(value):
+    assert copy.copy(value) is value
+    assert copy.deepcopy(value) is value
+    assert pickle.loads(pickle.dumps(value)) is value
+
+
+@pytest.mark.parametrize(
+    "value, field",
+    [(Tile(value=TileValue.ONE), "value"), (TilePosition(0, 1), "row_idx")],
+)
+def test_immutable(value, field):
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        setattr(value, field, 0)
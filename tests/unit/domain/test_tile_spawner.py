@@ -1,7 +1,10 @@
+import random
+
 import pytest
 
 from src.domain.dataclasses_.tile import Tile
-from src.domain.entities.game import Game
+from src.domain.entities.board import Board
+from src.domain.entities.counter_random import CounterRandom
 from src.domain.entities.tile_spawner import TileSpawner
 from src.domain.enums_.tile_value import TileValue
 from tests.unit.objects import board_random_state_1, empty_board
@@ -12,20 +15,56 @@ from tests.unit.objects import board_random_state_1, empty_board
     [
         (empty_board(), 1),
         (empty_board(), 2),
+        (empty_board(), 16),
         (board_random_state_1(), 1),
+        (board_random_state_1(), 3),
     ],
 )
-def test_spawn(
-    game: Game, tile_spawner: TileSpawner, tiles: list[list[Tile]], qty: int
-):
-    game._board._tiles = tiles
-    empty_cells_before = game._board.get_empty_tiles_positions()
+def test_spawn(tile_spawner: TileSpawner, tiles: list[list[Tile]], qty: int):
+    empty_cells_before = list(Board(tiles=tiles).get_empty_tiles_positions())
 
-    tile_spawner.spawn(tiles, qty, empty_cells_before)
+    spawned = tile_spawner.spawn(tiles, qty, empty_cells_before)
 
-    empty_cells_after = game._board.get_empty_tiles_positions()
+    empty_cells_after = list(Board(tiles=tiles).get_empty_tiles_positions())
     assert empty_cells_after != empty_cells_before
     assert len(empty_cells_after) + qty == len(empty_cells_before)
+    assert set(empty_cells_before) - set(empty_cells_after) == set(spawned)
+
+
+@pytest.mark.parametrize("qty", [0, 5])
+def test_spawn_invalid_qty(tile_spawner: TileSpawner, qty: int):
+    tiles = board_random_state_1()
+    empty_cells = list(Board(tiles=tiles).get_empty_tiles_positions())
+
+    with pytest.raises(ValueError):
+        tile_spawner.spawn(tiles, qty, empty_cells)
+
+
+def test_pick_spawns_picks_distinct_cells():
+    spawner = TileSpawner(rng=random.Random(5))
+    cells = list(range(10))
+
+    for qty in range(1, 11):
+        picked = [cell for cell, _ in spawner.pick_spawns(qty, cells)]
+        assert len(set(picked)) == qty
+        assert set(picked) <= set(cells)
+
+
+@pytest.mark.parametrize("rng_factory", [random.Random, CounterRandom])
+def test_pick_spawns_in_mask_matches_pick_spawns(rng_factory):
+    by_list = TileSpawner(rng=rng_factory(4))
+    by_mask = TileSpawner(rng=rng_factory(4))
+    mask_rng = random.Random(9)
+
+    for _ in range(200):
+        mask = mask_rng.getrandbits(64) & 0x1111_1111_1111_1111
+        shifts = [shift for shift in range(64) if mask >> shift & 1]
+        if not shifts:
+            continue
+        qty = mask_rng.randint(1, len(shifts))
+        assert by_mask.pick_spawns_in_mask(qty, mask) == by_list.pick_spawns(
+            qty, shifts
+        )
 
 
 def test__get_new_tile_value(tile_spawner):
@@ -40,3 +79,15 @@ def test__get_new_tile_value(tile_spawner):
 
     assert values.count(TileValue.ONE) > min_expected_2
     assert values.count(TileValue.TWO) < max_expected_4
+
+
+@pytest.mark.parametrize("rng_factory", [random.Random, CounterRandom])
+def test_pick_spawns_is_reproducible(rng_factory):
+    cells = list(range(16))
+
+    first = TileSpawner(rng=rng_factory(11))
+    second = TileSpawner(rng=rng_factory(11))
+
+    assert [first.pick_spawns(2, cells) for _ in range(20)] == [
+        second.pick_spawns(2, cells) for _ in range(20)
+    ]
@@ -0,0 +1,20 @@
+import pytest
+
+from src.domain.enums_.tile_value import TileValue
+
+
+@pytest.mark.parametrize("value", list(TileValue)[:-1])
+def test_next(value: TileValue):
+    assert value.next() == (value * 2 if value else TileValue.ONE)
+
+
+def test_next_of_max_value():
+    with pytest.raises(StopIteration):
+        TileValue.FIFTEEN.next()
+
+
+@pytest.mark.parametrize("exponent", range(16))
+def test_exponent_round_trip(exponent: int):
+    value = TileValue.from_exponent(exponent)
+    assert value.exponent == exponent
+    assert value == (1 << exponent if exponent else 0)
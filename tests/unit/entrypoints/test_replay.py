@@ -0,0 +1,49 @@
+import dataclasses
+import json
+
+import pytest
+
+from src.domain.enums_.random_generator_kind import RandomGeneratorKind
+from src.entrypoints.replay import run_replays, start_replay
+from src.entrypoints.simulate import run_simulation, start_simulation
+
+
+@pytest.mark.parametrize("rng_kind", list(RandomGeneratorKind))
+def test_recorded_games_replay_exactly(rng_kind: RandomGeneratorKind):
+    report = run_simulation(
+        games=6, workers=1, seed=4, rng_kind=rng_kind, record=True
+    )
+
+    assert len(report.replays) == 6
+    assert [replay.score for replay in report.replays] == report.scores
+    assert run_replays(report.replays, workers=1, chunk_size=4) == []
+
+
+def test_diverging_replay_is_reported():
+    replays = run_simulation(games=3, workers=1, seed=2, record=True).replays
+    replays[1] = dataclasses.replace(replays[1], seed=replays[1].seed + 1)
+
+    assert run_replays(replays, workers=1) == [1]
+
+
+def test_start_replay(tmp_path, capsys):
+    log = tmp_path / "games.bin"
+    start_simulation(
+        ["--games", "3", "--workers", "1", "--seed", "1", "--json"]
+        + ["--rng", "counter", "--record", str(log)]
+    )
+    capsys.readouterr()
+
+    start_replay([str(log), "--workers", "1", "--json"])
+    summary = json.loads(capsys.readouterr().out)
+
+    assert summary["games"] == 3
+    assert summary["mismatches"] == 0
+
+
+def test_start_replay_invalid_log(tmp_path):
+    log = tmp_path / "games.bin"
+    log.write_bytes(b"garbage")
+
+    with pytest.raises(SystemExit):
+        start_replay([str(log), "--workers", "1"])
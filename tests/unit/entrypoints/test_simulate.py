@@ -0,0 +1,81 @@
+import json
+
+import pytest
+
+from src.domain.dataclasses_.simulation_report import SimulationReport
+from src.entrypoints.di.cli.container import GameEngine
+from src.entrypoints.simulate import run_simulation, start_simulation
+from src.infrastructure.position_dataset import PositionDataset, find_shards
+
+
+def test_run_simulation_is_reproducible():
+    sequential = run_simulation(games=12, workers=1, seed=3, chunk_size=5)
+    parallel = run_simulation(games=12, workers=2, seed=3, chunk_size=2)
+
+    assert sequential.games == 12
+    assert sequential.scores == parallel.scores
+    assert sequential.moves == parallel.moves
+    assert sequential.max_tiles == parallel.max_tiles
+
+
+def test_engines_play_the_same_games():
+    classic = run_simulation(games=4, workers=1, seed=9, engine=GameEngine.CLASSIC)
+    bitboard = run_simulation(games=4, workers=1, seed=9, engine=GameEngine.BITBOARD)
+
+    assert classic.scores == bitboard.scores
+
+
+def test_run_simulation_writes_dataset(tmp_path):
+    dataset = tmp_path / "positions.ds"
+    stale_shard = tmp_path / "positions-00000099.ds"
+    stale_shard.write_bytes(b"")
+
+    report = run_simulation(
+        games=5, workers=1, seed=4, chunk_size=2, max_moves=50, dataset=dataset
+    )
+
+    shards = find_shards(dataset)
+    assert [shard.name for shard in shards] == [
+        "positions-00000000.ds",
+        "positions-00000002.ds",
+        "positions-00000004.ds",
+    ]
+    records = []
+    for shard in shards:
+        with PositionDataset(shard) as shard_dataset:
+            records.extend(shard_dataset)
+    assert len(records) == sum(report.moves)
+
+    # every game starts from zero, so its deltas add up to its final score
+    first_move = 0
+    for moves, score in zip(report.moves, report.scores):
+        game_records = records[first_move : first_move + moves]
+        assert sum(record.score_delta for record in game_records) == score
+        assert {record.final_score for record in game_records} == {score}
+        first_move += moves
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert SimulationReport.percentile(values, 50) == 50
+    assert SimulationReport.percentile(values, 99) == 99
+    assert SimulationReport.percentile(values, 100) == 100
+    assert SimulationReport.percentile([], 50) == 0
+
+
+def test_start_simulation_prints_json(capsys):
+    start_simulation(["--games", "3", "--workers", "1", "--seed", "1", "--json"])
+    summary = json.loads(capsys.readouterr().out)
+
+    assert summary["games"] == 3
+    assert summary["seed"] == 1
+    assert sum(summary["max_tile"].values()) == 3
+
+
+@pytest.mark.parametrize("seed", [-1, 2**64 - 2])
+def test_start_simulation_rejects_seed_out_of_range(seed: int, tmp_path):
+    args = ["--games", "3", "--workers", "1", "--seed", str(seed)]
+
+    with pytest.raises(SystemExit):
+        start_simulation([*args, "--record", str(tmp_path / "replays.log")])
+    assert not (tmp_path / "replays.log").exists()
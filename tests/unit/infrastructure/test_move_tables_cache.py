@@ -0,0 +1,22 @@
+from src.infrastructure.move_tables_cache import FileMoveTablesCache
+
+
+def test_load_missing_file(tmp_path):
+    assert FileMoveTablesCache(path=tmp_path / "tables.bin").load() is None
+
+
+def test_save_and_load(tmp_path):
+    cache = FileMoveTablesCache(path=tmp_path / "nested" / "tables.bin")
+    cache.save(b"\x00\x01\x02")
+
+    assert cache.load() == b"\x00\x01\x02"
+    assert [path.name for path in (tmp_path / "nested").iterdir()] == ["tables.bin"]
+
+
+def test_save_to_unwritable_location_is_ignored(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_bytes(b"")
+    cache = FileMoveTablesCache(path=blocker / "tables.bin")
+
+    cache.save(b"data")
+    assert cache.load() is None
@@ -0,0 +1,129 @@
+import pytest
+
+from src.domain.dataclasses_.position_record import PositionRecord
+from src.domain.enums_.move_direction import MoveDirection
+from src.infrastructure.position_dataset import (
+    PositionDataset,
+    PositionDatasetWriter,
+    find_shards,
+    get_shard_path,
+)
+
+
+def _create_records(dim: int, qty: int) -> list[PositionRecord]:
+    full_board = (1 << (dim * dim * 4)) - 1
+    directions = list(MoveDirection)
+    return [
+        PositionRecord(
+            cells=full_board - idx,
+            move=directions[idx % len(directions)],
+            score_delta=idx * 4,
+            final_score=2**32 - 1,
+        )
+        for idx in range(qty)
+    ]
+
+
+@pytest.mark.parametrize("dim", [3, 4, 5])
+def test_write_and_read(tmp_path, dim: int):
+    records = _create_records(dim, 10)
+    path = tmp_path / "nested" / "positions.ds"
+    with PositionDatasetWriter(path=path, dimension=dim, buffer_records=3) as writer:
+        writer.write(records[:4])
+        writer.write(records[4:])
+        assert writer.get_count() == 10
+
+    with PositionDataset(path) as dataset:
+        assert dataset.get_dimension() == dim
+        assert len(dataset) == 10
+        assert list(dataset) == records
+        assert dataset[-1] == records[-1]
+        with pytest.raises(IndexError):
+            dataset[10]
+
+
+def test_record_width(tmp_path):
+    path = tmp_path / "positions.ds"
+    with PositionDatasetWriter(path=path, dimension=4) as writer:
+        writer.write(_create_records(4, 3))
+
+    with PositionDataset(path) as dataset:
+        buffer = dataset.get_buffer()
+        # cells (u64), move (u8), score delta and final score (u32 each)
+        assert len(buffer) == 3 * 17
+        buffer.release()
+
+
+@pytest.mark.parametrize("dim", [4, 5])
+def test_to_numpy(tmp_path, dim: int):
+    np = pytest.importorskip("numpy")
+    records = _create_records(dim, 5)
+    path = tmp_path / "positions.ds"
+    with PositionDatasetWriter(path=path, dimension=dim) as writer:
+        writer.write(records)
+
+    with PositionDataset(path) as dataset:
+        array = dataset.to_numpy()
+
+    assert array.shape == (5,)
+    assert list(array["score_delta"]) == [record.score_delta for record in records]
+    assert list(array["move"]) == [idx % 4 for idx in range(5)]
+    cells = array["cells"].reshape(5, -1).astype(object)
+    assert [
+        sum(int(word) << (64 * idx) for idx, word in enumerate(row)) for row in cells
+    ] == [record.cells for record in records]
+    assert np.all(array["final_score"] == 2**32 - 1)
+
+
+def test_to_numpy_empty(tmp_path):
+    pytest.importorskip("numpy")
+    path = tmp_path / "positions.ds"
+    PositionDatasetWriter(path=path, dimension=4).close()
+
+    with PositionDataset(path) as dataset:
+        assert len(dataset) == 0
+        assert dataset.to_numpy().shape == (0,)
+
+
+def test_incomplete_record_is_ignored(tmp_path):
+    path = tmp_path / "positions.ds"
+    with PositionDatasetWriter(path=path, dimension=4) as writer:
+        writer.write(_create_records(4, 3))
+    path.write_bytes(path.read_bytes()[:-1])
+
+    with PositionDataset(path) as dataset:
+        assert len(dataset) == 2
+
+
+@pytest.mark.parametrize(
+    "record",
+    [
+        PositionRecord(cells=1 << 64, move=MoveDirection.UP, score_delta=0, final_score=0),
+        PositionRecord(cells=0, move=MoveDirection.UP, score_delta=-1, final_score=0),
+    ],
+)
+def test_write_invalid_record(tmp_path, record: PositionRecord):
+    with PositionDatasetWriter(path=tmp_path / "positions.ds", dimension=4) as writer:
+        with pytest.raises(ValueError):
+            writer.write([record])
+
+
+@pytest.mark.parametrize("data", [b"", b"2048DS", b"NOTSET" + bytes(10)])
+def test_read_invalid_file(tmp_path, data: bytes):
+    path = tmp_path / "positions.ds"
+    path.write_bytes(data)
+
+    with pytest.raises(ValueError):
+        PositionDataset(path)
+
+
+def test_shards(tmp_path):
+    path = tmp_path / "positions.ds"
+    for shard in (12, 3):
+        PositionDatasetWriter(path=get_shard_path(path, shard), dimension=4).close()
+    (tmp_path / "positions-other.ds").touch()
+
+    assert find_shards(path) == [
+        tmp_path / "positions-00000003.ds",
+        tmp_path / "positions-00000012.ds",
+    ]
@@ -0,0 +1,81 @@
+import pytest
+
+from src.domain.dataclasses_.game_replay import GameReplay
+from src.domain.enums_.move_direction import MoveDirection
+from src.domain.enums_.random_generator_kind import RandomGeneratorKind
+from src.infrastructure.replay_log import (
+    FileReplayLog,
+    decode_replays,
+    encode_replays,
+)
+
+_REPLAYS = [
+    GameReplay(
+        seed=2**64 - 1,
+        rng_kind=RandomGeneratorKind.COUNTER,
+        dimension=4,
+        moves=(
+            MoveDirection.UP,
+            MoveDirection.DOWN,
+            MoveDirection.LEFT,
+            MoveDirection.RIGHT,
+            MoveDirection.LEFT,
+        ),
+        score=1234,
+        max_tile=128,
+    ),
+    GameReplay(
+        seed=0,
+        rng_kind=RandomGeneratorKind.MERSENNE,
+        dimension=5,
+        moves=(),
+        score=0,
+        max_tile=4,
+    ),
+]
+
+
+def test_round_trip():
+    assert decode_replays(encode_replays(_REPLAYS)) == _REPLAYS
+
+
+def test_moves_take_two_bits():
+    single = encode_replays(_REPLAYS[:1])
+    empty = encode_replays([])
+
+    # fixed-size record plus ceil(5 / 4) bytes of moves
+    assert len(single) - len(empty) == 8 + 1 + 1 + 3 * 4 + 2
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"NOTLOG\x01\x00\x00\x00\x00",
+        encode_replays(_REPLAYS)[:-1],
+        encode_replays(_REPLAYS) + b"\x00",
+    ],
+)
+def test_decode_invalid_data(data: bytes):
+    with pytest.raises(ValueError):
+        decode_replays(data)
+
+
+def test_encode_negative_seed():
+    replay = GameReplay(
+        seed=-1,
+        rng_kind=RandomGeneratorKind.MERSENNE,
+        dimension=4,
+        moves=(),
+        score=0,
+        max_tile=0,
+    )
+    with pytest.raises(ValueError):
+        encode_replays([replay])
+
+
+def test_save_and_load(tmp_path):
+    log = FileReplayLog(path=tmp_path / "nested" / "games.bin")
+    log.save(_REPLAYS)
+
+    assert log.load() == _REPLAYS
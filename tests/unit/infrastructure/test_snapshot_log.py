@@ -0,0 +1,145 @@
+import random
+
+import pytest
+
+from src.domain.dataclasses_.game_snapshot import GameSnapshot
+from src.domain.entities.counter_random import CounterRandom
+from src.domain.enums_.game_result import GameResult
+from src.infrastructure.snapshot_log import (
+    FileSnapshotLog,
+    decode_snapshot,
+    encode_snapshot,
+    snapshot_from_json,
+    snapshot_to_json,
+)
+
+
+def _mersenne_state() -> tuple:
+    rng = random.Random(7)
+    rng.gauss(0, 1)  # leaves a cached gaussian in the state
+    return rng.getstate()
+
+
+_SNAPSHOTS = [
+    GameSnapshot(dimension=4, cells=0xB000_0000_0000_0021, score=20_000),
+    GameSnapshot(
+        dimension=4,
+        cells=0x1234_5678_9ABC_DEF1,
+        score=1_234_567,
+        result=GameResult.LOSE,
+        rng_state=CounterRandom(2**64 - 1).getstate(),
+    ),
+    GameSnapshot(dimension=5, cells=0x1, score=0, rng_state=_mersenne_state()),
+    GameSnapshot(dimension=3, cells=0, score=0, rng_state=random.Random(1).getstate()),
+]
+
+
+@pytest.mark.parametrize("snapshot", _SNAPSHOTS)
+def test_binary_round_trip(snapshot: GameSnapshot):
+    data = encode_snapshot(snapshot)
+
+    assert decode_snapshot(data) == (snapshot, len(data))
+    assert decode_snapshot(memoryview(b"xx" + data), offset=2)[0] == snapshot
+
+
+def test_position_fits_in_sixteen_bytes():
+    # flags, dimension, 8 bytes of cells and a 3-byte score
+    assert len(encode_snapshot(_SNAPSHOTS[0])) == 13
+
+
+@pytest.mark.parametrize("snapshot", _SNAPSHOTS)
+def test_json_round_trip(snapshot: GameSnapshot):
+    assert snapshot_from_json(snapshot_to_json(snapshot)) == snapshot
+
+
+@pytest.mark.parametrize(
+    "snapshot",
+    [
+        GameSnapshot(dimension=2, cells=1 << 16, score=0),
+        GameSnapshot(dimension=4, cells=0, score=-1),
+        GameSnapshot(dimension=4, cells=0, score=0, rng_state=("unknown",)),
+        GameSnapshot(dimension=4, cells=0, score=0, rng_state=(1 << 64, 0)),
+        GameSnapshot(dimension=4, cells=0, score=0, rng_state=(-1, 0)),
+        GameSnapshot(dimension=4, cells=0, score=0, rng_state=(1, -1)),
+    ],
+)
+def test_encode_unsupported_snapshot(snapshot: GameSnapshot):
+    with pytest.raises(ValueError):
+        encode_snapshot(snapshot)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"\x00\x04\x00",
+        encode_snapshot(_SNAPSHOTS[1])[:-1],
+        b"\x0c\x01\x00\x00",
+    ],
+)
+def test_decode_invalid_data(data: bytes):
+    with pytest.raises(ValueError):
+        decode_snapshot(data)
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        '{"tiles": [[3]], "score": 0}',
+        '{"tiles": [[2, 4], [2]], "score": 0, "result": null, "rng_state": null}',
+        '{"tiles": [[2]], "score": -4, "result": null, "rng_state": null}',
+    ],
+)
+def test_decode_invalid_json(document: str):
+    with pytest.raises(ValueError):
+        snapshot_from_json(document)
+
+
+def test_append_and_load(tmp_path):
+    log = FileSnapshotLog(path=tmp_path / "nested" / "snapshots.bin")
+    log.append(_SNAPSHOTS[:2])
+    log.append(_SNAPSHOTS[2:], sync=True)
+
+    assert log.load() == _SNAPSHOTS
+    assert log.load_last() == _SNAPSHOTS[-1]
+
+
+def test_load_empty_log(tmp_path):
+    path = tmp_path / "snapshots.bin"
+    path.touch()
+
+    assert FileSnapshotLog(path=path).load_last() is None
+
+
+@pytest.mark.parametrize("cut", [1, 3, 5])
+def test_load_truncated_log(tmp_path, cut: int):
+    path = tmp_path / "snapshots.bin"
+    log = FileSnapshotLog(path=path)
+    log.append(_SNAPSHOTS)
+    path.write_bytes(path.read_bytes()[:-cut])
+
+    # the record cut short by an interrupted append is ignored...
+    assert log.load_last() == _SNAPSHOTS[-2]
+    # ...and dropped by the next append
+    log.append(_SNAPSHOTS[-1:])
+    assert log.load() == _SNAPSHOTS
+
+
+def test_load_corrupted_record(tmp_path):
+    path = tmp_path / "snapshots.bin"
+    FileSnapshotLog(path=path).append(_SNAPSHOTS)
+    data = bytearray(path.read_bytes())
+    # the first record claims one byte more than its snapshot takes
+    data[7] += 1
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(ValueError):
+        FileSnapshotLog(path=path).load()
+
+
+def test_load_unknown_file(tmp_path):
+    path = tmp_path / "snapshots.bin"
+    path.write_bytes(b"NOTLOG\x01")
+
+    with pytest.raises(ValueError):
+        FileSnapshotLog(path=path).load()
@@ -1,5 +1,20 @@
+import random
+from collections.abc import Callable
+
+from src.domain.dataclasses_.dimension import Dimension
+from src.domain.dataclasses_.game_result import GameState
 from src.domain.dataclasses_.tile import Tile
+from src.domain.entities.array_board import ArrayBoard
+from src.domain.entities.array_board_game import ArrayBoardGame
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.bit_board_game import BitBoardGame
+from src.domain.entities.board import Board
+from src.domain.entities.game import Game
+from src.domain.entities.tile_spawner import TileSpawner
+from src.domain.enums_.game_status import GameStatus
+from src.domain.enums_.move_direction import MoveDirection
 from src.domain.enums_.tile_value import TileValue
+from src.domain.interfaces.domain.game import IGame
 
 
 def empty_board() -> list[list[Tile]]:
@@ -220,3 +235,47 @@ def board_random_state_3_swipe_down() -> list[list[Tile]]:
         [Tile(TileValue.THREE), Tile(TileValue.ONE), Tile(TileValue.THREE), Tile(TileValue.TWO)],
         [Tile(TileValue.FOUR), Tile(TileValue.FOUR), Tile(TileValue.THREE), Tile(TileValue.FOUR)]
     ]
+
+
+def classic_game(dim: int, seed: int) -> Game:
+    """Returns a Game on an empty dim×dim board spawning tiles from seed"""
+    return Game(
+        board=Board.create(Dimension(rows=dim, cols=dim)),
+        tile_spawner=TileSpawner(rng=random.Random(seed)),
+    )
+
+
+def bit_board_game(dim: int, seed: int) -> BitBoardGame:
+    """Returns a BitBoardGame on an empty dim×dim board spawning tiles from seed"""
+    return BitBoardGame(
+        board=BitBoard.create(Dimension(rows=dim, cols=dim)),
+        tile_spawner=TileSpawner(rng=random.Random(seed)),
+    )
+
+
+def array_board_game(dim: int, seed: int) -> ArrayBoardGame:
+    """Returns an ArrayBoardGame on an empty dim×dim board spawning tiles from seed"""
+    return ArrayBoardGame(
+        board=ArrayBoard.create(Dimension(rows=dim, cols=dim)),
+        tile_spawner=TileSpawner(rng=random.Random(seed)),
+    )
+
+
+GAME_FACTORIES: list[Callable[[int, int], IGame]] = [classic_game, bit_board_game, array_board_game]
+
+
+def play_random_game(game: IGame, seed: int, max_moves: int) -> list[tuple]:
+    """Starts the game, plays random moves drawn from seed and returns every state as a tuple"""
+    def snapshot(state: GameState) -> tuple:
+        # some engines return their live tile grid, so copy it before the next move
+        tiles = [[tile.value for tile in row] for row in state.tiles]
+        return tiles, state.score, state.status, state.result, state.changed_cells
+
+    moves_rng = random.Random(seed)
+    states = [snapshot(game.start())]
+    for _ in range(max_moves):
+        state = game.make_move(moves_rng.choice(list(MoveDirection)))
+        states.append(snapshot(state))
+        if state.status is GameStatus.COMPLETED:
+            break
+    return states
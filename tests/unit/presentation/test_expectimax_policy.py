@@ -0,0 +1,85 @@
+import random
+import time
+
+import pytest
+
+from src.domain.dataclasses_.dimension import Dimension
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.bit_board_game import BitBoardGame
+from src.domain.entities.tile_spawner import TileSpawner
+from src.domain.enums_.game_status import GameStatus
+from src.domain.enums_.move_direction import MoveDirection
+from src.domain.enums_.tile_value import TileValue
+from src.presentation.ai.expectimax_policy import ExpectimaxMovePolicy
+from tests.unit.objects import board_with_lose_condition, board_with_one_possible_move
+
+
+@pytest.fixture
+def policy(move_tables) -> ExpectimaxMovePolicy:
+    yield ExpectimaxMovePolicy(move_tables=move_tables)
+
+
+def _cells(tiles) -> int:
+    return BitBoard.from_tiles(tiles).get_cells()
+
+
+def test_only_legal_move_is_chosen(policy):
+    # merging the last row is possible only horizontally
+    assert policy.choose_move_for_cells(_cells(board_with_one_possible_move())) in (
+        MoveDirection.LEFT,
+        MoveDirection.RIGHT,
+    )
+
+
+def test_lost_board(policy):
+    assert policy.choose_move_for_cells(_cells(board_with_lose_condition())) in tuple(
+        MoveDirection
+    )
+
+
+def test_move_is_decided_within_budget(policy):
+    rng = random.Random(5)
+    values = [TileValue.ZERO] * 4 + list(TileValue)[1:8]
+    durations = []
+    for _ in range(20):
+        cells = 0
+        for idx in range(16):
+            cells |= BitBoard.to_exponent(rng.choice(values)) << (4 * idx)
+
+        started = time.perf_counter()
+        policy.choose_move_for_cells(cells)
+        durations.append(time.perf_counter() - started)
+
+    assert max(durations) < 0.05
+
+
+def test_transposition_table_is_bounded(move_tables):
+    policy = ExpectimaxMovePolicy(
+        move_tables=move_tables, max_depth=2, time_budget=None, table_size=8
+    )
+    policy.choose_move_for_cells(0x0000_0000_0012_0001)
+    assert 0 < len(policy._table) <= 8
+
+
+def test_invalid_depth(move_tables):
+    with pytest.raises(ValueError):
+        ExpectimaxMovePolicy(move_tables=move_tables, max_depth=0)
+
+
+def test_plays_much_better_than_random(move_tables):
+    policy = ExpectimaxMovePolicy(
+        move_tables=move_tables, max_depth=2, time_budget=None
+    )
+    game = BitBoardGame(
+        board=BitBoard.create(Dimension(rows=4, cols=4)),
+        tile_spawner=TileSpawner(rng=random.Random(1)),
+        move_tables=move_tables,
+    )
+    state = game.start()
+    for _ in range(600):
+        state = game.make_move(policy.choose_move(state))
+        if state.status is GameStatus.COMPLETED:
+            break
+
+    # random play practically never gets beyond 256
+    assert max(tile.value for row in state.tiles for tile in row) >= 512
@@ -0,0 +1,34 @@
+from src.domain.dataclasses_.game_result import GameState
+from src.domain.dataclasses_.tile import Tile
+from src.domain.enums_.game_status import GameStatus
+from src.domain.enums_.tile_value import TileValue
+from src.presentation.cli.glyphs import get_tile_glyphs
+from src.presentation.cli.models import TileColor
+from src.presentation.cli.presenter import CliPresenter
+
+
+def test_glyphs_cover_all_values():
+    glyphs = get_tile_glyphs(6, TileColor.get_color, "\033[0m")
+
+    assert set(glyphs) == {value.value for value in TileValue}
+    assert glyphs[0] == (" " * 8,) * 3
+    assert glyphs[2] == (
+        f"{TileColor.TWO.value}┌──────┐\033[0m",
+        f"{TileColor.TWO.value}│  2   │\033[0m",
+        f"{TileColor.TWO.value}└──────┘\033[0m",
+    )
+    assert glyphs[2048][1] == f"{TileColor.TWENTY48.value}│ 2048 │\033[0m"
+
+
+def test_glyphs_are_built_once_per_look():
+    first = get_tile_glyphs(6, TileColor.get_color, "\033[0m")
+
+    assert get_tile_glyphs(6, TileColor.get_color, "\033[0m") is first
+    assert get_tile_glyphs(8, TileColor.get_color, "\033[0m") is not first
+
+
+def test_presenter_passes_numeric_values():
+    tiles = [[Tile(value=TileValue.ZERO), Tile(value=TileValue.TEN)]]
+    state = GameState(tiles=tiles, score=12, status=GameStatus.IN_PROGRESS)
+
+    assert CliPresenter().present(state).tiles == [[0, 1024]]
@@ -0,0 +1,86 @@
+import os
+import threading
+
+import pytest
+
+from src.domain.enums_.game_command import GameCommand
+from src.domain.enums_.move_direction import MoveDirection
+from src.presentation.cli.input_reader import RawInputReader
+
+
+@pytest.fixture
+def pipe():
+    read_fd, write_fd = os.pipe()
+    yield read_fd, write_fd
+    os.close(read_fd)
+    os.close(write_fd)
+
+
+def test_burst_of_keys_is_queued_in_order(pipe):
+    read_fd, write_fd = pipe
+    reader = RawInputReader(fd=read_fd)
+    os.write(write_fd, b"\x1b[A\x1b[B\x1bOCx\x1b[D")
+
+    moves = [reader.read_move() for _ in range(4)]
+
+    assert moves == [
+        MoveDirection.UP,
+        MoveDirection.DOWN,
+        MoveDirection.RIGHT,
+        MoveDirection.LEFT,
+    ]
+
+
+def test_split_escape_sequence_is_joined(pipe):
+    read_fd, write_fd = pipe
+    reader = RawInputReader(fd=read_fd)
+    os.write(write_fd, b"\x1b[")
+    reader._buffer += os.read(read_fd, 16)
+    reader._decode()
+    os.write(write_fd, b"C")
+
+    assert reader.read_move() is MoveDirection.RIGHT
+
+
+def test_lone_escape_is_dropped(pipe):
+    read_fd, write_fd = pipe
+    reader = RawInputReader(fd=read_fd, escape_timeout=0.01)
+    os.write(write_fd, b"\x1b")
+    # arrives long after the Escape key, so "[A" is no arrow sequence
+    threading.Timer(0.2, os.write, (write_fd, b"[A\x1b[B")).start()
+
+    assert reader.read_move() is MoveDirection.DOWN
+
+
+def test_ctrl_c_interrupts(pipe):
+    read_fd, write_fd = pipe
+    reader = RawInputReader(fd=read_fd)
+    os.write(write_fd, b"\x1b[A\x03\x1b[B")
+
+    with pytest.raises(KeyboardInterrupt):
+        reader.read_move()
+
+
+def test_closed_input():
+    read_fd, write_fd = os.pipe()
+    os.close(write_fd)
+    reader = RawInputReader(fd=read_fd)
+
+    with pytest.raises(EOFError):
+        reader.read_move()
+    os.close(read_fd)
+
+
+def test_undo_and_redo_keys(pipe):
+    read_fd, write_fd = pipe
+    reader = RawInputReader(fd=read_fd)
+    os.write(write_fd, b"\x1b[Dux\x1b[AR")
+
+    actions = [reader.read_move() for _ in range(4)]
+
+    assert actions == [
+        MoveDirection.LEFT,
+        GameCommand.UNDO,
+        MoveDirection.UP,
+        GameCommand.REDO,
+    ]
@@ -0,0 +1,123 @@
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from src.domain.dataclasses_.dimension import Dimension
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.bit_board_game import BitBoardGame
+from src.domain.entities.tile_spawner import TileSpawner
+from src.domain.enums_.game_status import GameStatus
+from src.domain.enums_.move_direction import MoveDirection
+from src.presentation.ai.monte_carlo_policy import (
+    MonteCarloMovePolicy,
+    RolloutTask,
+    run_rollouts,
+)
+from src.presentation.ai.rollout import RolloutEngine
+from tests.unit.objects import board_with_lose_condition, board_with_one_possible_move
+
+_BOARD = 0x0000_0010_0021_1231
+
+
+def _cells(tiles) -> int:
+    return BitBoard.from_tiles(tiles).get_cells()
+
+
+def test_rollout_is_deterministic(move_tables):
+    first = RolloutEngine(move_tables=move_tables, seed=3).play(_BOARD)
+    second = RolloutEngine(move_tables=move_tables, seed=3).play(_BOARD)
+
+    assert first == second
+    assert first > 0
+
+
+def test_rollout_respects_move_limit(move_tables):
+    engine = RolloutEngine(move_tables=move_tables, seed=3, max_moves=0)
+
+    assert engine.play(_BOARD) == 0
+
+
+def test_run_rollouts_stops_at_deadline(move_tables):
+    task = RolloutTask(
+        move_tables=move_tables,
+        cells=_BOARD,
+        rollouts=1000,
+        seed=1,
+        deadline=time.time(),
+        tile2_spawn_chance=None,
+        max_moves=None,
+    )
+
+    assert run_rollouts(task)[1] == 1
+
+
+def test_only_legal_move_is_chosen(move_tables):
+    policy = MonteCarloMovePolicy(move_tables=move_tables, rollouts=5, seed=1)
+
+    assert policy.choose_move_for_cells(_cells(board_with_one_possible_move())) in (
+        MoveDirection.LEFT,
+        MoveDirection.RIGHT,
+    )
+
+
+def test_lost_board(move_tables):
+    policy = MonteCarloMovePolicy(move_tables=move_tables, rollouts=5, seed=1)
+
+    assert (
+        policy.choose_move_for_cells(_cells(board_with_lose_condition()))
+        is MoveDirection.UP
+    )
+
+
+def test_invalid_rollouts(move_tables):
+    with pytest.raises(ValueError):
+        MonteCarloMovePolicy(move_tables=move_tables, rollouts=0)
+
+
+@pytest.mark.parametrize("executor_cls", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_executor_gives_same_move_as_inline(move_tables, executor_cls):
+    inline = MonteCarloMovePolicy(
+        move_tables=move_tables, rollouts=20, tasks_per_move=4, seed=7
+    )
+    with executor_cls(max_workers=2) as executor:
+        pooled = MonteCarloMovePolicy(
+            move_tables=move_tables,
+            rollouts=20,
+            tasks_per_move=4,
+            seed=7,
+            executor=executor,
+        )
+        pooled_move = pooled.choose_move_for_cells(_BOARD)
+
+    assert pooled_move is inline.choose_move_for_cells(_BOARD)
+
+
+def test_move_is_decided_within_budget(move_tables):
+    policy = MonteCarloMovePolicy(
+        move_tables=move_tables, rollouts=100000, time_budget=0.02, seed=1
+    )
+
+    started = time.perf_counter()
+    policy.choose_move_for_cells(_BOARD)
+
+    # every candidate move plays at least one rollout after the deadline
+    assert time.perf_counter() - started < 0.2
+
+
+def test_plays_better_than_random(move_tables):
+    policy = MonteCarloMovePolicy(move_tables=move_tables, rollouts=10, seed=1)
+    game = BitBoardGame(
+        board=BitBoard.create(Dimension(rows=4, cols=4)),
+        tile_spawner=TileSpawner(rng=random.Random(1)),
+        move_tables=move_tables,
+    )
+    state = game.start()
+    for _ in range(400):
+        state = game.make_move(policy.choose_move(state))
+        if state.status is GameStatus.COMPLETED:
+            break
+
+    # random play practically never gets beyond 256
+    assert max(tile.value for row in state.tiles for tile in row) >= 512
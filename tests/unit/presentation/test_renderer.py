@@ -0,0 +1,73 @@
+import io
+import re
+
+from src.presentation.cli.models import PresenterOutput
+from src.presentation.cli.renderer import TerminalRenderer
+from src.presentation.cli.unix_view import UnixCliView
+
+
+def _output(tiles: list[list[int]], score: int = 0) -> PresenterOutput:
+    return PresenterOutput(tiles=tiles, score=f"Score: {score}", message="Go!")
+
+
+def test_first_frame_is_full_redraw():
+    stream = io.StringIO()
+    renderer = TerminalRenderer(stream=stream)
+
+    written = renderer.render({(1, 1): "a", (2, 1): "b"})
+
+    assert stream.getvalue() == "\033[H\033[J\033[1;1Ha\033[2;1Hb\033[3;1H"
+    assert written == len(stream.getvalue())
+
+
+def test_only_changed_spans_are_written():
+    stream = io.StringIO()
+    renderer = TerminalRenderer(stream=stream)
+    renderer.render({(1, 1): "a", (1, 5): "b", (2, 1): "c"})
+    stream.truncate(0)
+    stream.seek(0)
+
+    renderer.render({(1, 1): "a", (1, 5): "x", (2, 1): "c"})
+
+    assert stream.getvalue() == "\033[1;5Hx\033[3;1H"
+
+
+def test_unchanged_frame_writes_nothing():
+    stream = io.StringIO()
+    renderer = TerminalRenderer(stream=stream)
+    renderer.render({(1, 1): "a"})
+
+    assert renderer.render({(1, 1): "a"}) == 0
+    assert stream.getvalue().count("\033[1;1Ha") == 1
+
+
+def test_layout_change_and_invalidate_redraw_everything():
+    stream = io.StringIO()
+    renderer = TerminalRenderer(stream=stream)
+    renderer.render({(1, 1): "a"})
+
+    renderer.render({(1, 1): "a", (2, 1): "b"})
+    assert stream.getvalue().count("\033[H\033[J") == 2
+
+    renderer.invalidate()
+    renderer.render({(1, 1): "a", (2, 1): "b"})
+    assert stream.getvalue().count("\033[H\033[J") == 3
+
+
+def test_view_redraws_only_changed_tiles():
+    stream = io.StringIO()
+    view = UnixCliView(renderer=TerminalRenderer(stream=stream))
+    tiles = [[2, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 0, 0, 0]]
+    view.display(_output(tiles))
+    full_frame = stream.getvalue()
+    stream.truncate(0)
+    stream.seek(0)
+
+    tiles[0] = [0, 0, 0, 2]
+    view.display(_output(tiles))
+    update = stream.getvalue()
+
+    # three components of the two changed tiles, then the cursor is parked
+    assert len(re.findall(r"\033\[\d+;\d+H", update)) == 7
+    assert "Go!" not in update and "Score" not in update
+    assert len(update) < len(full_frame) / 2
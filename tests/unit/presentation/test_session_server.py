@@ -0,0 +1,97 @@
+import asyncio
+import json
+
+import pytest
+
+from src.application.use_cases.game_sessions_use_case import GameSessionsUseCase
+from src.domain.dataclasses_.dimension import Dimension
+from src.domain.entities.bit_board import BitBoard
+from src.domain.entities.bit_board_game import BitBoardGame
+from src.domain.entities.counter_random import CounterRandom
+from src.domain.entities.tile_spawner import TileSpawner
+from src.presentation.remote.latency import LatencyStats
+from src.presentation.remote.session_server import (
+    SessionServerProtocol,
+    create_session_server,
+)
+
+
+@pytest.fixture
+def sessions(move_tables) -> GameSessionsUseCase:
+    rng = CounterRandom()
+    game = BitBoardGame(
+        board=BitBoard.create(Dimension(rows=4, cols=4)),
+        tile_spawner=TileSpawner(rng=rng),
+        move_tables=move_tables,
+    )
+    yield GameSessionsUseCase(game=game, rng=rng)
+
+
+def _request(protocol: SessionServerProtocol, **request) -> dict:
+    return json.loads(protocol.handle_line(json.dumps(request).encode()))
+
+
+def test_game_requests(sessions):
+    latency = LatencyStats()
+    protocol = SessionServerProtocol(sessions=sessions, latency=latency, dim=4)
+
+    created = _request(protocol, op="new", seed=5)
+    assert created["score"] == created["moves"] == 0
+    assert created["result"] is None
+    assert sum(value > 0 for row in created["tiles"] for value in row) == 2
+
+    moved = _request(protocol, op="move", session=created["session"], direction="up")
+    assert moved["moves"] == 1
+    assert _request(protocol, op="get", session=created["session"]) == moved
+
+    stats = _request(protocol, op="stats")
+    assert stats["sessions"] == 1
+    assert stats["moves"] == latency.get_total() == 1
+    assert stats["p99_us"] >= stats["p50_us"] > 0
+
+    assert _request(protocol, op="close", session=created["session"]) == {
+        "closed": created["session"]
+    }
+
+
+@pytest.mark.parametrize(
+    "request_line",
+    [
+        b"not json",
+        b"[1, 2]",
+        b'{"op": "jump"}',
+        b'{"op": "new", "seed": "x"}',
+        b'{"op": "move", "session": "missing", "direction": "up"}',
+        b'{"op": "move"}',
+        b"[" * 5000 + b"]" * 5000,
+    ],
+)
+def test_invalid_requests(sessions, request_line: bytes):
+    protocol = SessionServerProtocol(sessions=sessions, latency=LatencyStats(), dim=4)
+
+    assert "error" in json.loads(protocol.handle_line(request_line))
+
+
+def test_pipelined_requests_over_tcp(sessions):
+    async def run() -> list[dict]:
+        server = await create_session_server(
+            sessions=sessions, latency=LatencyStats(), dim=4
+        )
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b'{"op": "new", "seed": 1}\n')
+            created = json.loads(await reader.readline())
+            move = json.dumps(
+                {"op": "move", "session": created["session"], "direction": "left"}
+            )
+            # one write with many requests, the last one split across writes
+            writer.write(((move + "\n") * 50 + move[:10]).encode())
+            writer.write((move[10:] + "\n").encode())
+            responses = [json.loads(await reader.readline()) for _ in range(51)]
+            writer.close()
+            await writer.wait_closed()
+        return responses
+
+    responses = asyncio.run(run())
+    assert [response["moves"] for response in responses] == list(range(1, 52))